@@ -0,0 +1,238 @@
+# ==============================================
+# ObliviousBench v0.1 — Truth Through Erasure
+# No time. No replay. No logs.
+# ==============================================
+"""
+Microbenchmarks for the Heart's hot paths: propose, ingest (in-window,
+out-of-window, duplicate), dream/seed hydration, and Skeleton.Step, across
+book sizes.
+
+Each case reports ops/sec, per-op latency percentiles (ns) and tracemalloc
+bytes per op, as JSON. Pass --baseline to compare against a saved run; the
+exit code is 1 if any case regressed beyond --tolerance.
+
+    python ObliviousBench.py --out base.json
+    python ObliviousBench.py --baseline base.json
+"""
+from __future__ import annotations
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import ObliviousSkeleton as Skeleton
+from ObliviousHeart import ObliviousHeart, NextRPS, ROCK
+
+Op = Callable[[], Any]
+Setup = Callable[[int, int], Op]      # (accounts, ops) → one op per call
+
+def _book(accounts: int) -> Dict[str, int]:
+    return {f"acct{i}": 1000 for i in range(accounts)}
+
+def _cycle(items: List[Any]) -> Op:
+    it = iter(items)
+    return lambda: next(it)
+
+# =========================
+# Cases
+# =========================
+def _heart(**options: Any) -> Dict[str, Setup]:
+    def propose(accounts: int, ops: int) -> Op:
+        h = ObliviousHeart("acct0", _book(accounts), **options)
+        return lambda: h.propose("acct1", 1)
+
+    def chain(accounts: int, ops: int, delta: bool = False) -> List[Any]:
+        # ops consecutive proposals, each in-window for the next
+        src = ObliviousHeart("acct0", _book(accounts), **options)
+        out = []
+        for i in range(ops):
+            p = src.propose(f"acct{1 + i % max(1, accounts - 1)}", 1, delta=delta)
+            src.ingest(p)
+            out.append(p)
+        return out
+
+    def in_window(accounts: int, ops: int) -> Op:
+        h = ObliviousHeart("sink", _book(accounts), **options)
+        proofs = _cycle(chain(accounts, ops))
+        return lambda: h.ingest(proofs())
+
+    def in_window_delta(accounts: int, ops: int) -> Op:
+        h = ObliviousHeart("sink", _book(accounts), **options)
+        proofs = _cycle(chain(accounts, ops, delta=True))
+        return lambda: h.ingest(proofs())
+
+    def out_of_window(accounts: int, ops: int) -> Op:
+        h = ObliviousHeart("sink", _book(accounts), **options)
+        p = ObliviousHeart("acct0", _book(accounts), **options).propose("acct1", 1)
+        p = p.replace(rps=NextRPS(NextRPS(ROCK)))
+        return lambda: h.ingest(p)
+
+    def duplicate(accounts: int, ops: int) -> Op:
+        h = ObliviousHeart("sink", _book(accounts), **options)
+        p = ObliviousHeart("acct0", _book(accounts), **options).propose("acct1", 1)
+        h.ingest(p)
+        return lambda: h.ingest(p)
+
+    def hydrate(accounts: int, ops: int) -> Op:
+        # Alternating seeds: every ingest is a real hydration
+        h = ObliviousHeart("sink", _book(accounts), **options)
+        a = ObliviousHeart("acct0", _book(accounts), **options)
+        b = ObliviousHeart("acct0", _book(accounts), **options)
+        b.ingest(b.propose("acct1", 1))
+        seeds = [a.seed_proof(), b.seed_proof()]
+        state = {"i": 0}
+
+        def op() -> Any:
+            state["i"] ^= 1
+            return h.ingest(seeds[state["i"]])
+        return op
+
+    return {"propose": propose, "ingest.in_window": in_window,
+            "ingest.in_window_delta": in_window_delta,
+            "ingest.out_of_window": out_of_window,
+            "ingest.duplicate": duplicate, "ingest.hydrate": hydrate}
+
+def _skeleton() -> Dict[str, Setup]:
+    def step(accounts: int, ops: int) -> Op:
+        book = _book(accounts)
+        S = {"tallies": dict(book), "rps": ROCK, "envy": False, "head": None}
+        proofs, rps, t = [], ROCK, dict(book)
+        for i in range(ops):
+            t = dict(t, acct0=t["acct0"] - 1)
+            rps = Skeleton.NEXT[rps]
+            proofs.append({"id": "acct0", "tallies": t, "rps": rps})
+        nxt = _cycle(proofs)
+        return lambda: Skeleton.Step(S, nxt())
+
+    return {"step": step}
+
+def cases() -> Dict[str, Setup]:
+    out: Dict[str, Setup] = {}
+    for group, table in (("heart", _heart()),
+                         ("heart.persistent", _heart(persistent=True)),
+                         ("skeleton", _skeleton())):
+        for name, setup in table.items():
+            out[f"{group}.{name}"] = setup
+    return out
+
+# =========================
+# Measurement
+# =========================
+def _pct(sorted_ns: List[int], q: float) -> int:
+    return sorted_ns[min(len(sorted_ns) - 1, int(q * len(sorted_ns)))]
+
+def measure(setup: Setup, accounts: int, ops: int) -> Dict[str, Any]:
+    # Pass 1: wall clock, per-op latency
+    op = setup(accounts, ops)
+    clock = time.perf_counter_ns
+    lat: List[int] = []
+    start = clock()
+    for _ in range(ops):
+        t0 = clock()
+        op()
+        lat.append(clock() - t0)
+    total = clock() - start
+    lat.sort()
+
+    # Pass 2: allocations (tracemalloc slows everything; timed separately)
+    op = setup(accounts, ops)
+    tracemalloc.start()
+    begin = tracemalloc.get_traced_memory()[0]
+    transient = 0
+    for _ in range(ops):
+        tracemalloc.reset_peak()
+        before = tracemalloc.get_traced_memory()[0]
+        op()
+        transient += tracemalloc.get_traced_memory()[1] - before
+    retained = tracemalloc.get_traced_memory()[0] - begin
+    tracemalloc.stop()
+
+    return {
+        "ops": ops,
+        "ops_per_sec": round(ops / (total / 1e9)),
+        "p50_ns": _pct(lat, 0.50),
+        "p90_ns": _pct(lat, 0.90),
+        "p99_ns": _pct(lat, 0.99),
+        "max_ns": lat[-1],
+        "alloc_bytes_per_op": round(transient / ops),
+        "retained_bytes_per_op": round(retained / ops),
+    }
+
+def run(accounts: List[int], ops: int, only: Optional[str] = None,
+        table: Optional[Dict[str, Setup]] = None) -> Dict[str, Any]:
+    # table: another suite's cases (Hydra's bench.py); default, the Heart's
+    results: Dict[str, Any] = {}
+    for name, setup in (cases() if table is None else table).items():
+        if only and only not in name:
+            continue
+        for n in accounts:
+            results[f"{name}[accounts={n}]"] = measure(setup, n, ops)
+    return {
+        "meta": {"python": platform.python_version(),
+                 "machine": platform.machine(),
+                 "accounts": accounts, "ops": ops},
+        "results": results,
+    }
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any],
+            tolerance: float) -> List[Tuple[str, str, float, float]]:
+    # → (case, metric, baseline, current) for every regression
+    worse = []
+    base = baseline.get("results", {})
+    for key, cur in current["results"].items():
+        old = base.get(key)
+        if old is None:
+            continue
+        if cur["ops_per_sec"] < old["ops_per_sec"] * (1 - tolerance):
+            worse.append((key, "ops_per_sec", old["ops_per_sec"], cur["ops_per_sec"]))
+        # A few bytes of jitter is noise, not a regression
+        if cur["alloc_bytes_per_op"] > old["alloc_bytes_per_op"] * (1 + tolerance) + 64:
+            worse.append((key, "alloc_bytes_per_op",
+                          old["alloc_bytes_per_op"], cur["alloc_bytes_per_op"]))
+    return worse
+
+def _table(report: Dict[str, Any]) -> str:
+    rows = [f"{'case':<52} {'ops/s':>10} {'p50':>8} {'p99':>8} {'B/op':>8}"]
+    for key, r in report["results"].items():
+        rows.append(f"{key:<52} {r['ops_per_sec']:>10} {r['p50_ns']:>8} "
+                    f"{r['p99_ns']:>8} {r['alloc_bytes_per_op']:>8}")
+    return "\n".join(rows)
+
+def main(argv: Optional[List[str]] = None,
+         table: Optional[Dict[str, Setup]] = None,
+         prog: str = "ObliviousBench.py") -> int:
+    ap = argparse.ArgumentParser(prog=prog)
+    ap.add_argument("--accounts", type=int, nargs="*", default=[5, 100, 10_000],
+                    help="Book sizes to run (default 5 100 10000)")
+    ap.add_argument("--ops", type=int, default=2000, help="Ops per case (default 2000)")
+    ap.add_argument("--only", help="Run only cases whose name contains this")
+    ap.add_argument("--out", help="Write the JSON report here (default stdout)")
+    ap.add_argument("--baseline", help="Compare against this saved report")
+    ap.add_argument("--tolerance", type=float, default=0.10,
+                    help="Allowed slowdown / allocation growth (default 0.10)")
+    args = ap.parse_args(argv)
+
+    report = run(list(args.accounts), int(args.ops), args.only, table)
+    print(_table(report), file=sys.stderr)
+    text = json.dumps(report, indent=2, sort_keys=True)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            worse = compare(report, json.load(f), float(args.tolerance))
+        for key, metric, old, new in worse:
+            print(f"REGRESSION {key} {metric}: {old} → {new}", file=sys.stderr)
+        if worse:
+            return 1
+        print("OK — no regressions against baseline", file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
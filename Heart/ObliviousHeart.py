@@ -4,9 +4,11 @@
 # ==============================================
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
+from ObliviousTally import (AccountRegistry, PersistentTallies, TallyVector,
+                            digest_against, digest_update, tally_digest)
 
-Proof = Dict[str, Any]
 ROCK, PAPER, SCISSORS = 1, 2, 3
 
 def NextRPS(rps: int) -> int:
@@ -17,6 +19,161 @@ def RPSName(rps: int) -> str:
     names = {ROCK: "ROCK", PAPER: "PAPER", SCISSORS: "SCISSORS"}
     return names.get(int(rps), "RPS?")
 
+def Frozen(tallies: Mapping[str, int]) -> Mapping[str, int]:
+    # Read-only without a copy: the caller hands over ownership
+    if isinstance(tallies, (MappingProxyType, PersistentTallies)):
+        return tallies
+    if isinstance(tallies, TallyVector):
+        return tallies.freeze()
+    return MappingProxyType(tallies)
+
+def IsFrozen(tallies: Mapping[str, int]) -> bool:
+    return isinstance(tallies, (MappingProxyType, PersistentTallies)) or (
+        isinstance(tallies, TallyVector) and tallies.frozen)
+
+def _plain(tallies: Mapping[str, int]) -> Dict[str, int]:
+    if isinstance(tallies, MappingProxyType):
+        return tallies.copy()
+    if isinstance(tallies, (TallyVector, PersistentTallies)):
+        return tallies.to_dict()
+    return dict(tallies)
+
+class Record(Mapping[str, Any]):
+    """Slotted fields over frozen tallies. Shared, never copied; reads (and,
+    for callers that edit what they were handed, writes) like a dict.
+    Subclasses name their fields in __slots__ and _fields."""
+    __slots__ = ("_held",)
+    _fields: Tuple[str, ...] = ()
+    _aliases: Dict[str, str] = {}      # field ← older wire key
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is frozen; use replace()")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is frozen; use replace()")
+
+    def hold(self) -> "Record":
+        # Kept by a heart as well as handed out: item writes refuse from here
+        object.__setattr__(self, "_held", True)
+        return self
+
+    # =========================
+    # Dict shim
+    # =========================
+    def __getitem__(self, key: str) -> Any:
+        v = getattr(self, key, None) if key in self._fields else None
+        if v is None:
+            raise KeyError(key)
+        return v
+
+    def get(self, key: str, default: Any = None) -> Any:
+        v = getattr(self, key, None) if key in self._fields else None
+        return default if v is None else v
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        # p["rps"] = … rebinds this record's field only; tallies are never
+        # written through, a new mapping is frozen in their place
+        if key not in self._fields:
+            raise KeyError(key)
+        if self._held:
+            raise TypeError(f"{type(self).__name__} is held by a heart; copy() it first")
+        if value is not None and key in ("tallies", "delta"):
+            value = Frozen(value if IsFrozen(value) else dict(value))
+        object.__setattr__(self, key, value)
+
+    def __delitem__(self, key: str) -> None:
+        if key not in self:
+            raise KeyError(key)
+        self[key] = None
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._fields and getattr(self, key) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        return (k for k in self._fields if getattr(self, k) is not None)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.to_wire()!r})"
+
+    def __copy__(self) -> Any:
+        # A fresh, unheld record over the same frozen tallies
+        return self.replace()
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> Any:
+        return self.replace()
+
+    def __reduce__(self) -> Any:
+        return (type(self).from_wire, (self.to_wire(), False))
+
+    def replace(self, **changes: Any) -> Any:
+        fields = {k: getattr(self, k) for k in self._fields}
+        fields.update(changes)
+        return type(self)(**fields)
+
+    # =========================
+    # Wire
+    # =========================
+    def to_wire(self) -> Dict[str, Any]:
+        d = {k: getattr(self, k) for k in self._fields
+             if getattr(self, k) is not None}
+        for k in ("tallies", "delta"):
+            if k in d:
+                d[k] = _plain(d[k])
+        return d
+
+    @classmethod
+    def from_wire(cls, d: Mapping[str, Any], copy: bool = True) -> Any:
+        # copy=False when d is freshly decoded and owned by no one else
+        if isinstance(d, cls):
+            return d
+        fields = {k: d[k] for k in d if k in cls._fields}
+        for k, alias in cls._aliases.items():
+            if k not in fields and d.get(alias) is not None:
+                fields[k] = d[alias]
+        for k in ("tallies", "delta"):
+            v = fields.get(k)
+            if v is not None and (copy or not isinstance(v, dict)):
+                fields[k] = v if IsFrozen(v) else dict(v)
+        return cls(**fields)
+
+class Proof(Record):
+    """The heart's proof: a Record in rps terms."""
+    __slots__ = ("id", "tallies", "rps", "digest", "is_dream", "is_seed",
+                 "is_snapshot", "mode", "base", "delta")
+    _fields = __slots__
+    _aliases = {"rps": "crown"}
+
+    def __init__(self, id: Optional[str] = None,
+                 tallies: Optional[Mapping[str, int]] = None,
+                 rps: Optional[int] = None, digest: Optional[int] = None,
+                 is_dream: Optional[bool] = None, is_seed: Optional[bool] = None,
+                 is_snapshot: Optional[bool] = None, mode: Optional[str] = None,
+                 base: Optional[int] = None,
+                 delta: Optional[Mapping[str, int]] = None) -> None:
+        put = object.__setattr__
+        put(self, "id", id)
+        put(self, "tallies", None if tallies is None else Frozen(tallies))
+        put(self, "rps", rps)
+        put(self, "digest", digest)
+        put(self, "is_dream", is_dream)
+        put(self, "is_seed", is_seed)
+        put(self, "is_snapshot", is_snapshot)
+        put(self, "mode", mode)
+        put(self, "base", base)
+        put(self, "delta", None if delta is None else Frozen(delta))
+        put(self, "_held", False)
+
+def ProofKey(P: Proof) -> Tuple[str, int, int]:
+    # Stable identity for dedupe and diagnostics: who, which phase, what state
+    digest = P.get("digest")
+    if digest is None:
+        digest = tally_digest(P.get("tallies", {}) or {})
+    return (str(P.get("id", "")), int(P.get("rps", P.get("crown", 0)) or 0),
+            int(digest))
+
 @dataclass(frozen=True)
 class Intent:
     type: str
@@ -24,69 +181,161 @@ class Intent:
 
 @dataclass
 class ProofState:
-    tallies: Dict[str, int]
+    tallies: Mapping[str, int]
     rps: int
     head: Optional[str] = None
 
 class ObliviousHeart:
     def __init__(self, node_id: str,
                  initial_tallies: Optional[Dict[str, int]] = None,
-                 initial_rps: int = ROCK) -> None:
+                 initial_rps: int = ROCK,
+                 registry: Optional[AccountRegistry] = None,
+                 verify_digest: bool = False,
+                 persistent: bool = False) -> None:
         self.node_id = str(node_id)
-        tallies = dict(initial_tallies or {
+        # Compact mode: tallies live in array('q') vectors over a shared
+        # registry. Copies are one buffer copy; equality is a memcmp.
+        self.registry = registry
+        # Persistent mode: tallies are a HAMT. A transfer copies one path,
+        # every other node is shared with the previous state and its proofs.
+        self.persistent = bool(persistent)
+        if self.persistent and registry is not None:
+            raise ValueError("persistent and registry tallies are exclusive")
+        # The tallies decide equality (C-level compare); the digest is carried
+        # across the entries that change. verify_digest recomputes it in full
+        # on every adopt as a cross-check.
+        self.verify_digest = bool(verify_digest)
+        tallies = self._own(initial_tallies or {
             "A": 10, "B": 10, "C": 10, "D": 10, "E": 10
         })
         self.state = ProofState(
-            tallies=dict(tallies), rps=int(initial_rps), head=None
+            tallies=tallies, rps=int(initial_rps), head=None
         )
-        self.best: Proof = {
-            "id": self.node_id, "tallies": dict(tallies),
-            "rps": int(initial_rps)
-        }
+        self._digest: Optional[Tuple[Any, int]] = None
+        self.best = Proof(id=self.node_id, tallies=self.state.tallies,
+                          rps=int(initial_rps), digest=self.digest()).hold()
         self.envy = False
 
+    def _tallies(self, tallies: Mapping[str, int]) -> Dict[str, int]:
+        # A private, writable copy
+        if self.registry is not None:
+            return self.registry.vector(tallies)  # type: ignore[return-value]
+        if isinstance(tallies, MappingProxyType):
+            return tallies.copy()                # dict.copy, not a key walk
+        return dict(tallies)
+
+    def _own(self, tallies: Mapping[str, int]) -> Mapping[str, int]:
+        # Frozen tallies are shared as-is; anything else is copied once
+        if self.persistent:
+            if isinstance(tallies, PersistentTallies):
+                return tallies
+            return PersistentTallies(tallies)
+        if IsFrozen(tallies) and (self.registry is None or (
+                isinstance(tallies, TallyVector)
+                and tallies.registry is self.registry)):
+            return tallies
+        return Frozen(self._tallies(tallies))
+
+    def digest(self) -> int:
+        # Order-independent digest of state.tallies, kept current on every
+        # mutation; recomputed only if state.tallies is replaced from outside
+        tallies = self.state.tallies
+        if self._digest is None or self._digest[0] is not tallies:
+            self._digest = (tallies, tally_digest(tallies))
+        return self._digest[1]
+
+    def _moved(self, tallies: Mapping[str, int]) -> Optional[int]:
+        # None if these are our tallies already; else their digest, computed
+        # here: a peer's digest only names its proof (ProofKey), it does not
+        # vouch for the tallies
+        return digest_against(tallies, self.state.tallies, self.digest(),
+                              verify=self.verify_digest)
+
+    def _adopt(self, tallies: Mapping[str, int], digest: int, rps: int,
+               head: Optional[str]) -> None:
+        self.state = ProofState(
+            tallies=self._own(tallies), rps=int(rps), head=head
+        )
+        self._digest = (self.state.tallies, digest)
+        self.best = Proof(id=head or self.node_id, tallies=self.state.tallies,
+                          rps=int(rps), digest=digest).hold()
+
     def snapshot(self) -> Proof:
-        return {"id": self.node_id, "tallies": dict(self.state.tallies),
-                "rps": int(self.state.rps), "is_dream": False}
+        return Proof(id=self.node_id, tallies=self._own(self.state.tallies),
+                     rps=int(self.state.rps), digest=self.digest(),
+                     is_dream=False)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Frozen proxies don't pickle: ship plain tallies, refreeze on load
+        d = dict(self.__dict__)
+        d["state"] = ProofState(tallies=_plain(self.state.tallies),
+                                rps=self.state.rps, head=self.state.head)
+        d["_digest"] = self.digest()
+        if self.best.tallies is self.state.tallies:
+            d["best"] = self.best.replace(tallies=None)
+        return d
+
+    def __setstate__(self, d: Dict[str, Any]) -> None:
+        digest = d.pop("_digest")
+        self.__dict__.update(d)
+        self.state.tallies = self._own(self.state.tallies)
+        self._digest = (self.state.tallies, digest)
+        if self.best.tallies is None:
+            self.best = self.best.replace(tallies=self.state.tallies)
+        self.best.hold()
 
     def emotions(self) -> Dict[str, Any]:
         return {"envy": bool(self.envy)}
 
     def seed_proof(self) -> Proof:
-        return {"id": self.node_id,
-                "tallies": dict(self.best.get("tallies", self.state.tallies)),
-                "rps": int(self.state.rps), "is_seed": True}
+        return Proof(id=self.node_id, tallies=self.best.tallies,
+                     rps=int(self.state.rps), digest=self.best.digest,
+                     is_seed=True)
 
     def _envy_reanchor(self) -> Proof:
-        return {"id": self.node_id,
-                "tallies": dict(self.best.get("tallies", self.state.tallies)),
-                "rps": int(self.state.rps), "is_dream": True, "mode": "ENVY"}
+        return Proof(id=self.node_id, tallies=self.best.tallies,
+                     rps=int(self.state.rps), digest=self.best.digest,
+                     is_dream=True, mode="ENVY")
 
-    def propose(self, to_node: str, amount: int) -> Proof:
+    def propose(self, to_node: str, amount: int, delta: bool = False) -> Proof:
         if self.envy:
             return self._envy_reanchor()
-        frm, to, amt = self.node_id, str(to_node), int(amount)
-        tallies = dict(self.state.tallies)
-        tallies[frm] = tallies.get(frm, 0) - amt
-        tallies[to] = tallies.get(to, 0) + amt
-        return {"id": self.node_id, "tallies": tallies,
-                "rps": NextRPS(self.state.rps)}
+        amt = int(amount)
+        return self._proposal(((self.node_id, -amt), (str(to_node), amt)), delta)
+
+    def _proposal(self, moves: Iterable[Tuple[str, int]],
+                  delta: bool = False) -> Proof:
+        # (account, change) moves against the current tallies, as one proof
+        cur, base = self.state.tallies, self.digest()
+        changes: Dict[str, int] = {}
+        digest = base
+        for name, change in moves:
+            old = changes.get(name, cur.get(name))
+            changes[name] = (old or 0) + change
+            digest = digest_update(digest, name, old, changes[name])
+        if delta:
+            # Only the changed entries, anchored to the digest of our base
+            return Proof(id=self.node_id, base=base, delta=changes,
+                         rps=NextRPS(self.state.rps), digest=digest)
+        return Proof(id=self.node_id, tallies=self._materialize(cur, changes),
+                     rps=NextRPS(self.state.rps), digest=digest)
 
     def ingest(self, incoming: Proof) -> List[Intent]:
         intents: List[Intent] = []
-        if not isinstance(incoming, dict):
+        if not isinstance(incoming, Mapping):
             return intents
         rps_in = int(incoming.get("rps", incoming.get("crown", self.state.rps)))
-        tallies_in = dict(incoming.get("tallies", {}) or {})
+        tallies_in = incoming.get("tallies", {}) or {}
         head_in = str(incoming.get("id", "")) or None
         if incoming.get("is_seed") or incoming.get("is_dream") or incoming.get(
             "is_snapshot"
         ):
-            if tallies_in and tallies_in != self.state.tallies:
-                self.state.tallies = dict(tallies_in)
-                self.best = {"id": head_in or self.node_id,
-                             "tallies": dict(tallies_in),
-                             "rps": int(self.state.rps)}
+            if tallies_in:
+                digest_in = self._moved(tallies_in)
+                if digest_in is not None:
+                    head = self.state.head
+                    self._adopt(tallies_in, digest_in, self.state.rps, head_in)
+                    self.state.head = head
             if self.envy:
                 self.envy = False
             return intents
@@ -101,17 +350,167 @@ class ObliviousHeart:
             intents.append(Intent("REQUEST_SYNC",
                                  {"rps": rps_cur, "label": RPSName(rps_cur)}))
             return intents
+        if "delta" in incoming:
+            return self._ingest_delta(incoming, rps_in, rps_cur, head_in)
         if self.envy:
             self.envy = False
-        if tallies_in == self.state.tallies:
+        digest_in = self._moved(tallies_in)
+        if digest_in is None:
             return intents
-        self.state = ProofState(
-            tallies=dict(tallies_in), rps=int(rps_in), head=head_in
-        )
-        self.best = {"id": head_in or self.node_id,
-                     "tallies": dict(tallies_in), "rps": int(rps_in)}
-        intents.append(Intent("PROPAGATE", {"proof": dict(self.best)}))
+        self._adopt(tallies_in, digest_in, rps_in, head_in)
+        intents.append(Intent("PROPAGATE", {"proof": self.best}))
         if rps_in == rps_next:
             intents.append(Intent("REQUEST_SYNC",
                                  {"rps": rps_in, "label": RPSName(rps_in)}))
         return intents
+
+    def _ingest_delta(self, incoming: Proof, rps_in: int, rps_cur: int,
+                      head_in: Optional[str]) -> List[Intent]:
+        intents: List[Intent] = []
+        base = incoming.get("base")
+        if base != self.digest():
+            # Not our base: the delta cannot be applied, hydrate instead
+            intents.append(Intent("REQUEST_SYNC",
+                                 {"rps": rps_cur, "label": RPSName(rps_cur),
+                                  "need_tail": True}))
+            return intents
+        if self.envy:
+            self.envy = False
+        changes = {str(k): int(v) for k, v in
+                   (incoming.get("delta", {}) or {}).items()}
+        cur = self.state.tallies
+        if all(cur.get(k) == v for k, v in changes.items()):
+            return intents
+        digest = int(base)
+        for k, v in changes.items():
+            digest = digest_update(digest, k, cur.get(k), v)
+        tallies = self._materialize(cur, changes)
+        self.state = ProofState(tallies=tallies, rps=int(rps_in), head=head_in)
+        self._digest = (tallies, digest)
+        self.best = Proof(id=head_in or self.node_id, tallies=tallies,
+                          rps=int(rps_in), digest=digest).hold()
+        intents.append(Intent("PROPAGATE", {"proof": Proof(
+            id=head_in or self.node_id, base=int(base), delta=changes,
+            rps=int(rps_in), digest=digest)}))
+        if rps_in == NextRPS(rps_cur):
+            intents.append(Intent("REQUEST_SYNC",
+                                 {"rps": rps_in, "label": RPSName(rps_in)}))
+        return intents
+
+    def ingest_many(self, proofs: Iterable[Proof]) -> List[Intent]:
+        # The same law as ingest, run across the batch in order. Survivors
+        # are tracked by reference and only the last one is materialized;
+        # intents collapse to at most one ENVY, PROPAGATE and REQUEST_SYNC.
+        envy, rps, head = self.envy, int(self.state.rps or ROCK), self.state.head
+        base, digest = self.state.tallies, self.digest()
+        changes: Dict[str, int] = {}      # delta overlay on base
+        best_id, best_rps = self.best.id, self.best.rps
+        adopts, last = 0, None            # last PROPAGATE-worthy adopt
+        spoken = 0                        # adopts ingest would have propagated
+        envy_at: Optional[Dict[str, Any]] = None
+        sync_at: Optional[Dict[str, Any]] = None
+        need_tail = False
+
+        def get(k: str) -> Optional[int]:
+            return changes[k] if k in changes else base.get(k)
+
+        def moved(tallies: Mapping[str, int]) -> Optional[int]:
+            return digest_against(tallies, base, digest, changes,
+                                  verify=self.verify_digest)
+
+        for incoming in proofs:
+            if not isinstance(incoming, Mapping):
+                continue
+            rps_in = int(incoming.get("rps", incoming.get("crown", rps)))
+            head_in = str(incoming.get("id", "")) or None
+            if incoming.get("is_seed") or incoming.get("is_dream") or incoming.get(
+                "is_snapshot"
+            ):
+                tallies_in = incoming.get("tallies", {}) or {}
+                if tallies_in:
+                    digest_in = moved(tallies_in)
+                    if digest_in is not None:
+                        base, changes, digest = tallies_in, {}, digest_in
+                        best_id, best_rps = head_in or self.node_id, rps
+                        adopts += 1
+                envy = False
+                continue
+            rps_next = NextRPS(rps)
+            if rps_in not in (rps, rps_next):
+                if not envy:
+                    envy = True
+                    envy_at = envy_at or {"current": RPSName(rps),
+                                          "incoming": RPSName(rps_in)}
+                sync_at = {"rps": rps, "label": RPSName(rps)}
+                continue
+            if "delta" in incoming:
+                if incoming.get("base") != digest:
+                    sync_at, need_tail = {"rps": rps, "label": RPSName(rps)}, True
+                    continue
+                envy = False
+                delta = {str(k): int(v) for k, v in
+                         (incoming.get("delta", {}) or {}).items()}
+                if all(get(k) == v for k, v in delta.items()):
+                    continue
+                for k, v in delta.items():
+                    digest = digest_update(digest, k, get(k), v)
+                    changes[k] = v
+                last = (delta, int(incoming["base"]), base, dict(changes),
+                        digest, rps_in, head_in)
+                spoken += 1
+            else:
+                envy = False
+                tallies_in = incoming.get("tallies", {}) or {}
+                digest_in = moved(tallies_in)
+                if digest_in is None:
+                    continue
+                base, changes, digest = tallies_in, {}, digest_in
+                last = (None, None, base, {}, digest, rps_in, head_in)
+                spoken += 1
+            adopts += 1
+            head, best_id, best_rps = head_in, head_in or self.node_id, rps_in
+            if rps_in == rps_next:
+                sync_at = {"rps": rps_in, "label": RPSName(rps_in)}
+            rps = rps_in
+
+        self.envy = envy
+        intents: List[Intent] = []
+        if envy_at is not None:
+            intents.append(Intent("ENVY", envy_at))
+        if adopts:
+            tallies = self._materialize(base, changes)
+            self.state = ProofState(tallies=tallies, rps=rps, head=head)
+            self._digest = (tallies, digest)
+            self.best = Proof(id=best_id, tallies=tallies, rps=int(best_rps),
+                              digest=digest).hold()
+        if last is not None:
+            delta, d_base, l_base, l_changes, l_digest, l_rps, l_head = last
+            if delta is not None and spoken == 1:
+                # A lone delta travels on exactly as ingest would send it (a
+                # dream adopted around it is never propagated either)
+                proof = Proof(id=l_head or self.node_id, base=d_base,
+                              delta=delta, rps=l_rps, digest=l_digest)
+            else:
+                if l_base is base and l_changes == changes:
+                    t = self.state.tallies
+                else:
+                    t = self._materialize(l_base, l_changes)
+                proof = Proof(id=l_head or self.node_id, tallies=t,
+                              rps=l_rps, digest=l_digest)
+            intents.append(Intent("PROPAGATE", {"proof": proof}))
+        if sync_at is not None:
+            if need_tail:
+                sync_at = dict(sync_at, need_tail=True)
+            intents.append(Intent("REQUEST_SYNC", sync_at))
+        return intents
+
+    def _materialize(self, base: Mapping[str, int],
+                     changes: Mapping[str, int]) -> Mapping[str, int]:
+        if not changes:
+            return self._own(base)
+        if self.persistent:
+            return self._own(base).update(changes)
+        tallies = self._tallies(base)
+        for k, v in changes.items():
+            tallies[k] = v
+        return Frozen(tallies)
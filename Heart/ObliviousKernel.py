@@ -0,0 +1,197 @@
+# ==============================================
+# ObliviousKernel v0.1 — Truth Through Erasure
+# No time. No replay. No logs.
+# ==============================================
+"""
+ObliviousSkeleton.Step over arrays: N independent (state, proof) pairs per
+call. States and proofs are struct-of-arrays (an N×K tally matrix over a
+fixed account order, plus rps, envy and head vectors); admissibility is one
+lookup in a table built from NEXT. Step returns one intent bitmask per pair.
+
+The skeleton stays the oracle. Requires NumPy. Run directly for an
+equivalence check and a throughput run.
+"""
+from __future__ import annotations
+import random
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ObliviousSkeleton import NEXT, ROCK, PAPER, SCISSORS
+from ObliviousTally import HOLE
+import ObliviousSkeleton as Skeleton
+
+# Intent bitmask (one uint8 per pair)
+ENVY, REQUEST_SYNC, PROPAGATE = 1, 2, 4
+
+# ADMIT[r_cur, r_in] → Admit(r_in, r_cur); ADVANCE[r_cur, r_in] → r_in is NEXT
+ADMIT = np.zeros((4, 4), dtype=bool)
+ADVANCE = np.zeros((4, 4), dtype=bool)
+for _r, _n in NEXT.items():
+    ADMIT[_r, _r] = ADMIT[_r, _n] = True
+    ADVANCE[_r, _n] = True
+
+@dataclass
+class States:
+    tallies: np.ndarray   # N×K int64, HOLE where absent
+    rps: np.ndarray       # int8
+    envy: np.ndarray      # bool
+    head: np.ndarray      # int32 code into heads; -1 → None
+
+@dataclass
+class Proofs:
+    tallies: np.ndarray   # N×K int64, HOLE where absent
+    rps: np.ndarray       # int8 (ignored for dreams)
+    dream: np.ndarray     # bool: is_seed / is_snapshot / is_dream
+    id: np.ndarray        # int32 code into heads; -1 → None
+
+def _same_rows(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    # Row equality as one memcmp per row (a K-wide all() is far slower)
+    a, b = np.ascontiguousarray(a), np.ascontiguousarray(b)
+    row = np.dtype((np.void, a.dtype.itemsize * a.shape[1]))
+    return a.view(row).ravel() == b.view(row).ravel()
+
+def Step(S: States, P: Proofs) -> np.ndarray:
+    # Same law as Skeleton.Step, row by row, all rows at once. Mutates S.
+    same = _same_rows(P.tallies, S.tallies)
+    dream = P.dream
+
+    hydrate = dream & ~same               # hydrate only; never competes
+    if hydrate.any():                     # ...and only with actual tallies
+        hydrate[hydrate] = (P.tallies[hydrate] != HOLE).any(axis=1)
+
+    live = ~dream
+    admit = ADMIT[S.rps, P.rps]
+    reject = live & ~admit                # out-of-window → envy + sync request
+    # ↑↑↑↑↑ LinchPin ↑↑↑↑↑
+
+    out = np.zeros(len(S.rps), dtype=np.uint8)
+    out[reject & ~S.envy] |= ENVY
+    out[reject] |= REQUEST_SYNC
+
+    adopt = live & admit & ~same          # tallies-only no-op (ignore rps-only)
+    advance = adopt & ADVANCE[S.rps, P.rps]
+    np.copyto(S.tallies, P.tallies, where=(adopt | hydrate)[:, None])
+    np.copyto(S.rps, P.rps, where=adopt)
+    np.copyto(S.head, P.id, where=adopt)
+    out[adopt] |= PROPAGATE
+    out[advance] |= REQUEST_SYNC
+
+    S.envy[:] = reject                    # dreams and admitted proofs clear it
+    return out
+
+def Intents(mask: int) -> List[str]:
+    # Bitmask → the skeleton's intent list, in the skeleton's order
+    mask = int(mask)
+    if mask & PROPAGATE:
+        return ["PROPAGATE"] + (["REQUEST_SYNC"] if mask & REQUEST_SYNC else [])
+    return (["ENVY"] if mask & ENVY else []) + (
+        ["REQUEST_SYNC"] if mask & REQUEST_SYNC else [])
+
+# =========================
+# Dicts ↔ arrays
+# =========================
+def _code(heads: List[str], head: Optional[str]) -> int:
+    if head is None:
+        return -1
+    if head not in heads:
+        heads.append(head)
+    return heads.index(head)
+
+def _rows(dicts: Sequence[Dict[str, int]], names: Sequence[str]) -> np.ndarray:
+    col = {k: j for j, k in enumerate(names)}
+    m = np.full((len(dicts), len(names)), HOLE, dtype=np.int64)
+    for i, t in enumerate(dicts):
+        for k, v in (t or {}).items():
+            m[i, col[k]] = v
+    return m
+
+def PackStates(states: Sequence[Dict[str, Any]], names: Sequence[str],
+               heads: List[str]) -> States:
+    return States(
+        tallies=_rows([s["tallies"] for s in states], names),
+        rps=np.array([s["rps"] for s in states], dtype=np.int8),
+        envy=np.array([bool(s.get("envy")) for s in states], dtype=bool),
+        head=np.array([_code(heads, s.get("head")) for s in states],
+                      dtype=np.int32),
+    )
+
+def PackProofs(proofs: Sequence[Dict[str, Any]], names: Sequence[str],
+               heads: List[str]) -> Proofs:
+    return Proofs(
+        tallies=_rows([p.get("tallies") or {} for p in proofs], names),
+        rps=np.array([p.get("rps", 0) or 0 for p in proofs], dtype=np.int8),
+        dream=np.array([bool(Skeleton.Dream(p)) for p in proofs], dtype=bool),
+        id=np.array([_code(heads, p.get("id")) for p in proofs], dtype=np.int32),
+    )
+
+def UnpackState(S: States, i: int, names: Sequence[str],
+                heads: Sequence[str]) -> Dict[str, Any]:
+    h = int(S.head[i])
+    return {
+        "tallies": {k: int(v) for k, v in zip(names, S.tallies[i]) if v != HOLE},
+        "rps": int(S.rps[i]),
+        "envy": bool(S.envy[i]),
+        "head": None if h < 0 else heads[h],
+    }
+
+# =========================
+# Self-check + throughput
+# =========================
+def _fuzz(rng: random.Random, names: Sequence[str],
+          n: int) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    def tallies() -> Dict[str, int]:
+        return {k: rng.randint(0, 2) for k in names if rng.random() < 0.9}
+    phases = [ROCK, PAPER, SCISSORS]
+    states = [{"tallies": tallies(), "rps": rng.choice(phases),
+               "envy": rng.random() < 0.3,
+               "head": rng.choice([None, "A", "B"])} for _ in range(n)]
+    proofs = []
+    for s in states:
+        p: Dict[str, Any] = {"id": rng.choice(["A", "B", "C"]),
+                             "rps": rng.choice(phases)}
+        r = rng.random()
+        p["tallies"] = dict(s["tallies"]) if r < 0.2 else (
+            {} if r < 0.25 else tallies())
+        if rng.random() < 0.2:
+            p[rng.choice(["is_seed", "is_snapshot", "is_dream"])] = True
+        proofs.append(p)
+    return states, proofs
+
+def check_against_skeleton(seed: int = 7, n: int = 5000) -> None:
+    rng = random.Random(seed)
+    names, heads = ["A", "B", "C"], []
+    states, proofs = _fuzz(rng, names, n)
+    S, P = PackStates(states, names, heads), PackProofs(proofs, names, heads)
+    masks = Step(S, P)
+    for i, (s, p) in enumerate(zip(states, proofs)):
+        s, want = Skeleton.Step(dict(s), p)
+        assert Intents(masks[i]) == want, (i, s, p, masks[i], want)
+        assert UnpackState(S, i, names, heads) == s, (i, s, p)
+
+def throughput(n: int = 1_000_000, accounts: int = 8, rounds: int = 20,
+               seed: int = 7) -> Dict[str, Any]:
+    rng = np.random.default_rng(seed)
+    S = States(tallies=rng.integers(0, 3, (n, accounts)),
+               rps=rng.integers(1, 4, n).astype(np.int8),
+               envy=np.zeros(n, dtype=bool),
+               head=np.full(n, -1, dtype=np.int32))
+    elapsed = 0.0
+    for _ in range(rounds):
+        P = Proofs(tallies=rng.integers(0, 3, (n, accounts)),
+                   rps=rng.integers(1, 4, n).astype(np.int8),
+                   dream=rng.random(n) < 0.05,
+                   id=rng.integers(0, 8, n).astype(np.int32))
+        t0 = time.perf_counter()
+        Step(S, P)
+        elapsed += time.perf_counter() - t0
+    return {"pairs": n, "accounts": accounts, "rounds": rounds,
+            "seconds": round(elapsed, 3),
+            "steps_per_sec": round(n * rounds / elapsed)}
+
+if __name__ == "__main__":
+    check_against_skeleton()
+    print("OK  - Kernel matches ObliviousSkeleton.Step per pair")
+    print(throughput())
@@ -0,0 +1,159 @@
+# ==============================================
+# ObliviousShards v0.1 — Truth Through Erasure
+# No time. No replay. No logs.
+# ==============================================
+"""
+A heart split into chambers. Accounts are partitioned across N shards by a
+stable hash of the account name; each shard is a whole ObliviousHeart with
+its own rps window, envy flag and tallies. Proofs are routed to shards by
+the accounts they carry, so a hot account only ever churns its own shard.
+
+A transfer between accounts in different shards is one proof per shard.
+Each lands under its own shard's law; there is no cross-shard atomicity.
+"""
+from __future__ import annotations
+from concurrent.futures import Executor
+from hashlib import blake2b
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from ObliviousHeart import ROCK, Intent, ObliviousHeart, Proof
+
+def ShardOf(name: str, shards: int) -> int:
+    # Stable across processes and peers (unlike hash())
+    h = blake2b(str(name).encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(h, "big") % int(shards)
+
+def _ingest_shard(heart: ObliviousHeart,
+                  proofs: List[Proof]) -> Tuple[ObliviousHeart, List[Intent]]:
+    # Module-level so a process pool can pickle it; returns the heart too,
+    # since a worker process mutates its own copy
+    return heart, heart.ingest_many(proofs)
+
+class ShardedHeart:
+    def __init__(self, node_id: str,
+                 initial_tallies: Optional[Dict[str, int]] = None,
+                 shards: int = 4,
+                 initial_rps: int = ROCK,
+                 shard_of: Optional[Callable[[str, int], int]] = None,
+                 **heart_options: Any) -> None:
+        self.node_id = str(node_id)
+        self.shard_of = shard_of or ShardOf
+        n = int(shards)
+        tallies = dict(initial_tallies or {
+            "A": 10, "B": 10, "C": 10, "D": 10, "E": 10
+        })
+        parts: List[Dict[str, int]] = [{} for _ in range(n)]
+        for name, value in tallies.items():
+            parts[self.shard_of(name, n)][name] = value
+        self.shards = [ObliviousHeart(self.node_id, part, initial_rps,
+                                      **heart_options) for part in parts]
+
+    def __len__(self) -> int:
+        return len(self.shards)
+
+    def shard(self, name: str) -> int:
+        return self.shard_of(name, len(self.shards))
+
+    # =========================
+    # Echo
+    # =========================
+    @property
+    def envy(self) -> bool:
+        return any(s.envy for s in self.shards)
+
+    def emotions(self) -> Dict[str, Any]:
+        return {"envy": self.envy, "shards": [s.envy for s in self.shards]}
+
+    def tallies(self) -> Dict[str, int]:
+        merged: Dict[str, int] = {}
+        for s in self.shards:
+            merged.update(s.state.tallies)
+        return merged
+
+    def snapshot(self) -> List[Proof]:
+        return [s.snapshot() for s in self.shards]
+
+    def seed_proofs(self) -> List[Proof]:
+        return [s.seed_proof() for s in self.shards]
+
+    # =========================
+    # Proposal
+    # =========================
+    def propose(self, to_node: str, amount: int,
+                delta: bool = False) -> List[Proof]:
+        # One proof per shard touched. An envious shard re-anchors instead,
+        # and then no shard moves, so the two legs never land half-made.
+        amt = int(amount)
+        legs: Dict[int, List[Tuple[str, int]]] = {}
+        for name, change in ((self.node_id, -amt), (str(to_node), amt)):
+            legs.setdefault(self.shard(name), []).append((name, change))
+        envious = [self.shards[i] for i in legs if self.shards[i].envy]
+        if envious:
+            return [s._envy_reanchor() for s in envious]
+        return [self.shards[i]._proposal(moves, delta)
+                for i, moves in legs.items()]
+
+    # =========================
+    # Routing
+    # =========================
+    def route(self, incoming: Proof) -> List[Tuple[int, Proof]]:
+        # → (shard, proof) pairs. A proof spanning shards is split into one
+        # proof per shard it mentions; shards it doesn't mention are left be.
+        if not isinstance(incoming, Mapping):
+            return []
+        tallies = incoming.get("tallies", {}) or {}
+        delta = incoming.get("delta", {}) or {}
+        keys = delta if "delta" in incoming else tallies
+        if not keys:
+            # Nothing to key on (an empty dream): every shard hears it
+            return [(i, incoming) for i in range(len(self.shards))]
+        groups: Dict[int, List[str]] = {}
+        for name in keys:
+            groups.setdefault(self.shard(name), []).append(name)
+        if len(groups) == 1:
+            return [(next(iter(groups)), incoming)]
+        proof = Proof.from_wire(incoming, copy=False)
+        if "delta" in incoming:
+            # A delta is anchored to one digest; it cannot be cut up. Every
+            # shard it touches hears it unanchored: its own gate, then a
+            # base mismatch, so REQUEST_SYNC for a tail (need_tail).
+            unanchored = proof.replace(base=None)
+            return [(i, unanchored) for i in groups]
+        return [(i, proof.replace(tallies={k: tallies[k] for k in names},
+                                  digest=None))
+                for i, names in groups.items()]
+
+    # =========================
+    # Ingest
+    # =========================
+    def ingest(self, incoming: Proof) -> List[Intent]:
+        intents: List[Intent] = []
+        for i, proof in self.route(incoming):
+            intents.extend(self._tag(i, self.shards[i].ingest(proof)))
+        return intents
+
+    def ingest_many(self, proofs: Iterable[Proof],
+                    executor: Optional[Executor] = None) -> List[Intent]:
+        # Each shard drains its own share of the burst, in order. With an
+        # executor the shards run side by side: a thread pool shares the
+        # hearts in place; a process pool ships each heart out and back.
+        batches: Dict[int, List[Proof]] = {}
+        for incoming in proofs:
+            for i, proof in self.route(incoming):
+                batches.setdefault(i, []).append(proof)
+        if executor is None:
+            results = [_ingest_shard(self.shards[i], batch)
+                       for i, batch in batches.items()]
+        else:
+            futures = [executor.submit(_ingest_shard, self.shards[i], batch)
+                       for i, batch in batches.items()]
+            results = [f.result() for f in futures]
+        intents: List[Intent] = []
+        for i, (heart, out) in zip(batches, results):
+            self.shards[i] = heart
+            intents.extend(self._tag(i, out))
+        return intents
+
+    @staticmethod
+    def _tag(i: int, intents: List[Intent]) -> List[Intent]:
+        return [Intent(it.type, dict(it.payload, shard=i)) for it in intents]
@@ -22,21 +22,133 @@ It proves:
 5) Convergence (ordered): if all nodes process the same delivery order (even
    with drops/dups), they converge to the same final state.
 
+6) Compact mode: array-backed tallies over a shared account registry behave
+   exactly like the dict-backed Heart, and still read as a dict; between
+   vectors, equality and the digest come off the arrays.
+
+7) Delta proofs: a proof carrying only the changed entries lands exactly like
+   the full proof when the base digest matches, and falls back to
+   REQUEST_SYNC (hydration) when it does not.
+
+8) Digest: the order-independent tally digest tracks every mutation, rides on
+   every emitted proof, and is carried across the entries a proof changes.
+   Incoming digests are recomputed, never trusted off the wire.
+
+9) Batched ingest: ingest_many over a burst lands on exactly the state and
+   tail that sequential ingest reaches, with at most one intent of each
+   kind, and its PROPAGATE lands a peer where the last sequential one does
+   (the very same one when the burst adopted once); the Heart and Hydra's
+   plexus alike.
+
+10) Frozen proofs: proofs share their frozen tallies with the heart instead
+    of copying them, and still read, edit and travel as dicts; a proof the
+    heart holds refuses edits.
+
+11) Persistent tallies: HAMT-backed tallies behave exactly like the dict
+    Heart, and a transfer copies one path while the rest stays shared.
+
+12) Sharded heart: accounts split across shards with their own phases;
+    peers agree, envy stays in the shard that caused it, a pooled burst
+    lands where sequential ingest does, and a delta spanning shards asks
+    each one for a tail.
+
+13) Swarm engine: N hearts as NumPy arrays return, per heart, the intents
+    and state ObliviousHeart.ingest does (skipped without NumPy).
+
+14) Batch kernel: the struct-of-arrays Step returns, per (state, proof)
+    pair, the intents and state of ObliviousSkeleton.Step (skipped without
+    NumPy).
+
+15) Hydra wire: a peer is sent JSON until it speaks or offers myelin, and
+    then myelin for good; a JSON-only head is never sent bytes.
+
+16) Myelin: tails, deltas, dreams, HUNGER and PEERS round-trip exactly;
+    kind() and peek() read the header without parsing the tallies; a
+    truncated or malformed buffer is rejected, never half-read.
+
+17) Storm membrane: a full ring evicts its oldest fingerprint; a repeat
+    datagram is an ECHO (a re-traced one too) and is never decoded; a
+    forgery under the real header is not, and doesn't turn the real tail
+    into one; HUNGER and PEERS are never deduped, and a JSON tail is a tail
+    even with an account named HUNGER.
+
+18) Ganglia: with two workers sharing the port, one tail sent from many
+    sources reaches both, and still reaches the heart once (skipped where
+    fork or SO_REUSEPORT is missing).
+
+19) Nurse: a HUNGER flood from one source is cut to its bucket while other
+    sources are still fed; the dream is encoded once per tongue and rebuilt
+    as soon as the plexus moves.
+
+20) Suture: a big payload is cut once per head and stitched back whole
+    from chunks out of order and duplicated; a missing chunk leaves nothing,
+    another head's cut never leaks into this one's, and a forged count
+    reserves nothing.
+
+21) Strangers: a forged PEERS list can't fill the peer table, a stranger
+    heard from frees its slot, and the tongue table holds the newest
+    sources while an evicted peer is re-learned on its next datagram.
+
+22) Thalamus: over random drains of tails, deltas, stale crowns and dreams,
+    landing only what relay() keeps leaves the plexus exactly where landing
+    the whole drain does, envious or not (an envious head takes the latest
+    dream first). Some tails lie, carrying someone else's digest: relay()
+    recomputes digests from the heart's tallies, so a liar can't get an
+    honest tail superseded.
+
+23) Digest cost: a duplicate costs no entry hashes and an in-window tail
+    only those of the entries it changes, in every tally mode, in the Heart
+    and in Hydra's plexus: nothing rehashes the whole book. Plexus heads
+    born from one genesis digest never hash the book themselves (unless
+    verify_digest, which refuses a wrong one).
+
+24) Gossip: a tail has one name whether it came as JSON, myelin, an echo
+    or our own; a head forwards until it has heard a tail `suppress` times;
+    crown sampling draws the same k for the same tail and round, never the
+    source; the heard table keeps its newest HEARD_MAX names.
+
+25) Commissure ring: records of every size come through a small ring in
+    order and exact across many wraparounds, each read in place (keep()
+    sees a view, only records addressed to us); a reader lapped between
+    looks skips to the present and counts an overrun; a record overwritten
+    while keep() is reading it is thrown away (the seqlock check) and the
+    reader carries on from the present.
+
 Note: This Heart intentionally does NOT provide shuffled-order convergence.
 That property requires a deterministic dominance rule, which was removed by
 design.
 """
 
+import os
 import random
+import socket
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
 
 from ObliviousHeart import (
     ObliviousHeart,
     NextRPS,
+    Proof,
+    ProofKey,
     ROCK,
     PAPER,
     SCISSORS,
 )
+from ObliviousShards import ShardedHeart
+from ObliviousTally import AccountRegistry, PersistentTallies, TallyVector, tally_digest
+
+# Hydra's shell sits beside the Heart; it needs a POSIX terminal, so its
+# checks skip where it can't load
+sys.path.insert(0, os.path.normpath(os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), os.pardir, "Hydra")))
+try:
+    import myelin
+    import shell
+    from plexus import plexus
+except ImportError:
+    shell = None
 
 print(__doc__.strip(), "\n")
 
@@ -199,6 +311,935 @@ def test_convergence_ordered(seed=7, nodes=5, rounds=60, drop=0.15, dup=0.25):
     print(f"     Final: rps={ref['rps']} tallies={ref['tallies']}")
 
 
+def test_compact_matches_dict(seed=11, nodes=5, rounds=80):
+    rng = random.Random(seed)
+    ids = [chr(ord("A") + i) for i in range(nodes)]
+    registry = AccountRegistry(ids)
+    plain = {i: ObliviousHeart(i) for i in ids}
+    compact = {i: ObliviousHeart(i, registry=registry) for i in ids}
+
+    for _ in range(rounds):
+        src = rng.choice(ids)
+        dst = rng.choice([x for x in ids if x != src])
+        amt = rng.randint(1, 3)
+        p = plain[src].propose(dst, amt)
+        q = compact[src].propose(dst, amt)
+        assert q["tallies"] == p["tallies"]
+        for i in ids:
+            assert ([x.type for x in compact[i].ingest(q)] ==
+                    [x.type for x in plain[i].ingest(p)])
+
+    for i in ids:
+        a, b = plain[i].snapshot(), compact[i].snapshot()
+        assert b["tallies"] == a["tallies"] and b["rps"] == a["rps"]
+        assert dict(b["tallies"]) == a["tallies"]
+
+    # Vector into vector: equality and the digest come off the arrays;
+    # nothing walks the accounts by name
+    src = compact["A"]
+    sink = ObliviousHeart("S", src.snapshot()["tallies"], src.state.rps,
+                          registry=registry)
+    q = src.propose("B", 1)
+    walk = TallyVector.__iter__
+
+    def walked(self):
+        raise AssertionError("vector walked by name")
+
+    TallyVector.__iter__ = walked
+    try:
+        assert has_intent(sink.ingest(q), "PROPAGATE")
+        assert sink.ingest(q) == [] and sink.ingest_many([q, q]) == []
+    finally:
+        TallyVector.__iter__ = walk
+    assert sink.digest() == tally_digest(q["tallies"])
+
+    # Dict proofs still ingest into a compact heart (new accounts included)
+    C = ObliviousHeart("A", registry=registry)
+    C.ingest({"id": "Z", "tallies": {"A": 9, "Z": 1}, "rps": PAPER})
+    assert C.snapshot()["tallies"] == {"A": 9, "Z": 1}
+    ok("Compact: vector tallies match the dict Heart and read as a dict")
+
+
+def test_delta_matches_full(seed=5, nodes=5, rounds=40):
+    rng = random.Random(seed)
+    ids = [chr(ord("A") + i) for i in range(nodes)]
+    full = {i: ObliviousHeart(i) for i in ids}
+    delta = {i: ObliviousHeart(i) for i in ids}
+
+    for _ in range(rounds):
+        src = rng.choice(ids)
+        dst = rng.choice([x for x in ids if x != src])
+        amt = rng.randint(1, 3)
+        p = full[src].propose(dst, amt)
+        d = delta[src].propose(dst, amt, delta=True)
+        assert "tallies" not in d and len(d["delta"]) == 2
+        for i in ids:
+            full[i].ingest(p)
+            delta[i].ingest(d)
+
+    for i in ids:
+        assert delta[i].snapshot()["tallies"] == full[i].snapshot()["tallies"]
+        assert delta[i].snapshot()["rps"] == full[i].snapshot()["rps"]
+
+    # Stale base => no change, hydration requested; dream repairs it
+    A, B, C = ObliviousHeart("A"), ObliviousHeart("B"), ObliviousHeart("C")
+    A.ingest(A.propose("B", 2))
+    B.ingest(C.propose("D", 1))
+    d = A.propose("C", 1, delta=True)
+    before = B.snapshot()
+    intents = B.ingest(d)
+    sync = [x for x in intents if x.type == "REQUEST_SYNC"]
+    assert sync and sync[0].payload.get("need_tail") is True
+    assert B.snapshot() == before
+    B.ingest(dict(A.seed_proof(), is_dream=True))
+    assert has_intent(B.ingest(d), "PROPAGATE")
+    A.ingest(d)
+    assert B.snapshot()["tallies"] == A.snapshot()["tallies"]
+    assert B.digest() == A.digest()
+    ok("Delta: changed-entries proofs match full proofs; stale base => sync")
+
+
+def test_digest_tracks_state(seed=3, rounds=60):
+    rng = random.Random(seed)
+    ids = ["A", "B", "C", "D", "E"]
+    registry = AccountRegistry(ids)
+    hearts = [ObliviousHeart("A"), ObliviousHeart("A", registry=registry)]
+
+    for _ in range(rounds):
+        src = rng.choice(ids)
+        dst = rng.choice([x for x in ids if x != src])
+        p = ObliviousHeart(src, hearts[0].snapshot()["tallies"],
+                           hearts[0].snapshot()["rps"]).propose(dst, 1)
+        assert p["digest"] == tally_digest(p["tallies"])
+        if rng.random() < 0.3:
+            p = dict(p, is_dream=True)
+        for H in hearts:
+            H.ingest(p)
+            assert H.digest() == tally_digest(H.snapshot()["tallies"])
+            assert H.snapshot()["digest"] == H.digest()
+            assert H.seed_proof()["digest"] == H.digest()
+
+    # The wire digest is never trusted: a peer claiming our digest for other
+    # tallies is adopted, and a bogus digest is not carried on
+    for V in (ObliviousHeart("A"), ObliviousHeart("A", verify_digest=True)):
+        forged = {"id": "X", "tallies": {"A": 7, "C": 13}, "rps": PAPER,
+                  "digest": V.digest()}
+        assert has_intent(V.ingest(forged), "PROPAGATE")
+        assert V.snapshot()["tallies"] == {"A": 7, "C": 13}
+        bogus = {"id": "X", "tallies": {"A": 0}, "rps": SCISSORS,
+                 "digest": 12345}
+        out = V.ingest(bogus)
+        assert V.digest() == tally_digest({"A": 0})
+        assert out[0].payload["proof"]["digest"] == V.digest()
+        assert ProofKey(V.snapshot()) == ("A", SCISSORS, tally_digest({"A": 0}))
+        for p in (dict(forged, is_dream=True), dict(bogus, is_seed=True)):
+            V.ingest(p)
+            assert V.digest() == tally_digest(p["tallies"])
+    ok("Digest: tracks every mutation; never taken off the wire")
+
+
+def _landed(p, after):
+    # Where a PROPAGATE puts a peer: (id, phase, digest, tallies). A delta
+    # lands on the state its sender had reached, after.
+    if p is None:
+        return None
+    tallies = p["tallies"] if p.get("tallies") is not None else after
+    assert p["digest"] == tally_digest(tallies)
+    return p["id"], p.get("rps", p.get("crown")), p["digest"], dict(tallies)
+
+
+def _same_burst(S, M, burst, key, tail):
+    # Same final state, same tail, one intent per kind, and one PROPAGATE
+    # that lands a peer where the last sequential one did
+    sequential, sent = [], []
+    for p in burst:
+        intents = S.ingest(p)
+        sequential += intents
+        sent += [(x.payload[key], S.state.tallies) for x in intents if x.type == "PROPAGATE"]
+    batched = M.ingest_many(burst)
+    assert dict(M.state.tallies) == dict(S.state.tallies) and M.digest() == S.digest()
+    assert M.snapshot() == S.snapshot() and M.emotions() == S.emotions()
+    assert (getattr(M, tail) is None) == (getattr(S, tail) is None)
+    if getattr(S, tail) is not None:
+        assert getattr(M, tail).to_wire() == getattr(S, tail).to_wire()
+    kinds = [x.type for x in batched]
+    assert len(kinds) == len(set(kinds))
+    assert set(kinds) == {x.type for x in sequential}
+    got = [x.payload[key] for x in batched if x.type == "PROPAGATE"]
+    assert len(got) == min(len(sent), 1)
+    if sent:
+        # A lone delta is the very one ingest sent; else the whole tail
+        p, after = sent[-1]
+        assert _landed(got[0], after) == _landed(p, after)
+        assert len(sent) == 1 or got[0].get("tallies") is not None
+        if len(sent) == 1:
+            assert got[0].to_wire() == p.to_wire()
+
+
+def test_ingest_many_matches_sequential(seed=9, bursts=40):
+    rng = random.Random(seed)
+    ids = ["A", "B", "C", "D", "E"]
+    peers = {i: ObliviousHeart(i) for i in ids}
+    S, M = ObliviousHeart("A"), ObliviousHeart("A")
+
+    for _ in range(bursts):
+        burst = []
+        for _ in range(rng.randint(1, 6)):
+            src = peers[rng.choice(ids)]
+            r = rng.random()
+            if r < 0.15:
+                p = src.seed_proof().replace(is_dream=True)
+            else:
+                dst = rng.choice([x for x in ids if x != src.node_id])
+                p = src.propose(dst, rng.randint(1, 3), delta=r < 0.5)
+            if rng.random() < 0.15:
+                p = p.replace(rps=rng.choice([ROCK, PAPER, SCISSORS]))
+            burst.append(p)
+            if rng.random() < 0.25:
+                burst.append(deepcopy(p))
+            for i in ids:
+                if rng.random() < 0.8:
+                    peers[i].ingest(p)
+
+        _same_burst(S, M, burst, "proof", "best")
+        assert M.best["id"] == S.best["id"] and M.best["rps"] == S.best["rps"]
+
+    if shell is not None:
+        # Hydra's plexus: the same law in crowns
+        from plexus import Tail
+        peers = {i: plexus(i) for i in ids}
+        S, M = plexus("A"), plexus("A")
+        for _ in range(bursts):
+            burst = []
+            for _ in range(rng.randint(1, 6)):
+                src = peers[rng.choice(ids)]
+                r = rng.random()
+                if r < 0.15:
+                    p = src.dream_state()
+                else:
+                    dst = rng.choice([x for x in ids if x != src.head_id])
+                    p = src.propose(dst, rng.randint(1, 3), delta=r < 0.5)
+                if rng.random() < 0.15:
+                    p = Tail(**dict(p.to_wire(), crown=rng.randint(1, 3)))
+                burst.append(p)
+                if rng.random() < 0.25:
+                    burst.append(deepcopy(p))
+                for i in ids:
+                    if rng.random() < 0.8:
+                        peers[i].ingest(p)
+
+            _same_burst(S, M, burst, "tail", "tail")
+
+    ok("Batched: ingest_many == sequential ingest: state, tail, PROPAGATE, one intent per kind")
+
+
+def test_proof_frozen_and_shared():
+    A = ObliviousHeart("A")
+    p = A.propose("B", 2)
+    for mutate in (lambda: setattr(p, "rps", ROCK),
+                   lambda: p["tallies"].__setitem__("A", 0),
+                   lambda: A.best.__setitem__("rps", ROCK)):
+        try:
+            mutate()
+        except (TypeError, AttributeError):
+            pass
+        else:
+            raise AssertionError("proof mutated")
+
+    # Adopting, snapshotting and seeding share one tallies object
+    A.ingest(p)
+    assert A.state.tallies is p["tallies"]
+    assert A.snapshot()["tallies"] is p["tallies"]
+    assert A.seed_proof()["tallies"] is p["tallies"]
+    q = deepcopy(p)
+    assert q is not p and q["tallies"] is p["tallies"]
+
+    # Dict shim: item writes rebind the caller's proof, never the heart's
+    q["rps"], q["tallies"] = ROCK, {"A": 0}
+    assert p["rps"] != ROCK and A.state.tallies is p["tallies"]
+    assert q["tallies"] == {"A": 0} and A.digest() == p["digest"]
+    del q["tallies"]
+    assert "tallies" not in q
+    out = A.ingest(A.propose("C", 1))
+    try:
+        out[0].payload["proof"]["rps"] = ROCK
+    except TypeError:
+        pass
+    else:
+        raise AssertionError("held proof mutated")
+
+    # Wire round trip
+    wire = p.to_wire()
+    assert type(wire["tallies"]) is dict and wire == dict(p) == p
+    assert Proof.from_wire(wire) == p and "is_dream" not in p
+    assert p.get("mode", "none") == "none"
+    B = ObliviousHeart("B")
+    B.ingest(wire)
+    wire["tallies"]["A"] = -999                       # sender reuses its dict
+    assert B.snapshot()["tallies"] == p["tallies"]
+    ok("Frozen: tallies are immutable and shared; proofs still edit like dicts")
+
+
+def test_persistent_matches_dict(seed=13, nodes=5, rounds=80):
+    rng = random.Random(seed)
+    ids = [chr(ord("A") + i) for i in range(nodes)]
+    plain = {i: ObliviousHeart(i) for i in ids}
+    shared = {i: ObliviousHeart(i, persistent=True) for i in ids}
+
+    for _ in range(rounds):
+        src = rng.choice(ids)
+        dst = rng.choice([x for x in ids if x != src])
+        amt = rng.randint(1, 3)
+        use_delta = rng.random() < 0.5
+        p = plain[src].propose(dst, amt, delta=use_delta)
+        q = shared[src].propose(dst, amt, delta=use_delta)
+        assert q.get("tallies") == p.get("tallies")
+        for i in ids:
+            assert ([x.type for x in shared[i].ingest(q)] ==
+                    [x.type for x in plain[i].ingest(p)])
+
+    for i in ids:
+        a, b = plain[i].snapshot(), shared[i].snapshot()
+        assert b["tallies"] == a["tallies"] and b["digest"] == a["digest"]
+        assert isinstance(b["tallies"], PersistentTallies)
+        assert b["tallies"] is shared[i].state.tallies
+
+    # One transfer in a large book: one new path, every other node shared
+    book = {f"acct{i}": 100 for i in range(4096)}
+    A = ObliviousHeart("acct0", book, persistent=True)
+    before = A.state.tallies
+    A.ingest(A.propose("acct1", 5))
+    after = A.state.tallies
+    assert after["acct0"] == 95 and after["acct1"] == 105
+    assert before["acct0"] == 100 and after == dict(book, acct0=95, acct1=105)
+    fresh = sum(x is not y for x, y in
+                zip(after._root.items, before._root.items))
+    assert fresh <= 2 and A.seed_proof()["tallies"] is after
+    ok("Persistent: HAMT tallies match the dict Heart and share structure")
+
+
+def test_sharded_isolates_envy(seed=17, rounds=120):
+    rng = random.Random(seed)
+    ids = [f"acct{i}" for i in range(12)]
+    init = {i: 50 for i in ids}
+    A = ShardedHeart("acct0", init, shards=4)
+    B = ShardedHeart("acct1", init, shards=4)
+    C = ShardedHeart("acct1", init, shards=4)
+    burst = []
+    for _ in range(rounds):
+        to = rng.choice(ids[1:])
+        for p in A.propose(to, rng.randint(1, 3), delta=rng.random() < 0.5):
+            A.ingest(p)
+            B.ingest(p)
+            burst.append(p)
+    assert B.tallies() == A.tallies() and sum(A.tallies().values()) == 600
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        C.ingest_many(burst, pool)
+    assert C.tallies() == A.tallies()
+
+    # An out-of-window proof upsets only the shard it routes to
+    p = A.propose("acct3", 1)[-1]
+    i = B.shard(next(iter(p["tallies"])))
+    bad = p.replace(rps=NextRPS(NextRPS(B.shards[i].state.rps)))
+    intents = B.ingest(bad)
+    assert [x.type for x in intents] == ["ENVY", "REQUEST_SYNC"]
+    assert all(x.payload["shard"] == i for x in intents)
+    assert B.emotions()["shards"] == [j == i for j in range(len(B))]
+
+    # A whole-book proof from a plain heart is split across the shards
+    q = ObliviousHeart("acct0", init).propose("acct5", 7)
+    D = ShardedHeart("acct9", init, shards=4)
+    D.ingest(q)
+    assert D.tallies() == q["tallies"]
+
+    # A delta spanning shards can't be applied: each shard asks for a tail
+    src = "acct0"
+    dst = next(f"acct{i}" for i in range(1, 16)
+               if D.shard(f"acct{i}") != D.shard(src))
+    d = ObliviousHeart(src, D.tallies()).propose(dst, 1, delta=True)
+    before = D.tallies()
+    out = D.ingest(d)
+    syncs = [i for i in out if i.type == "REQUEST_SYNC"]
+    assert {i.payload["shard"] for i in syncs} == {D.shard(src), D.shard(dst)}
+    assert all(i.payload.get("need_tail") for i in syncs)
+    assert not has_intent(out, "PROPAGATE") and D.tallies() == before
+    assert [i.type for i in D.ingest_many([d])] == [i.type for i in out]
+    ok("Sharded: per-shard phases agree, envy is isolated, pools match")
+
+
+def test_swarm_matches_heart():
+    try:
+        from ObliviousSwarm import check_against_heart
+    except ImportError:
+        print("SKIP - Swarm: NumPy not installed")
+        return
+    check_against_heart(seed=11, nodes=5, rounds=60)
+    ok("Swarm: array deliveries match ObliviousHeart.ingest per heart")
+
+
+def test_kernel_matches_skeleton():
+    try:
+        from ObliviousKernel import check_against_skeleton
+    except ImportError:
+        print("SKIP - Kernel: NumPy not installed")
+        return
+    check_against_skeleton(seed=11, n=500)
+    ok("Kernel: batched Step matches ObliviousSkeleton.Step per pair")
+
+
+def test_wire_offer():
+    if shell is None:
+        print("SKIP - Wire offer: Hydra's shell can't load here")
+        return
+    speaks = {}
+    old, new = ("10.0.0.1", 9001), ("10.0.0.2", 9002)
+    tail = plexus("A").propose("B", 1)
+
+    # Unheard: JSON
+    out = dict(shell._payloads(tail, [old, new], speaks))
+    assert not myelin.is_myelin(out[old]) and not myelin.is_myelin(out[new])
+
+    # A JSON-only head never offers: it stays on JSON
+    shell._heard(speaks, old, shell.JSON,
+                 shell._peek(b'{"type":"HUNGER","id":"X","crown":1}'))
+    assert speaks[old] == shell.JSON
+
+    # A myelin head's JSON HUNGER offers myelin; from then on it is sticky
+    hunger = shell._offer({"type": "HUNGER", "id": "Y", "crown": 1}, shell.MYELIN)
+    data = shell._wire(hunger, speaks.get(new, shell.JSON))
+    assert not myelin.is_myelin(data)
+    shell._heard(speaks, new, shell._tongue(data), shell._peek(data))
+    shell._heard(speaks, new, shell.JSON)
+    assert speaks[new] == shell.MYELIN
+    out = dict(shell._payloads(tail, [old, new], speaks))
+    assert not myelin.is_myelin(out[old]) and myelin.is_myelin(out[new])
+
+    # Heard speaking myelin is as good as an offer; --wire json never offers
+    shell._heard(speaks, old, shell._tongue(out[new]))
+    assert speaks[old] == shell.MYELIN
+    assert "wire" not in shell._offer({"type": "PEERS", "peers": []}, shell.JSON)
+    ok("Wire: JSON until a peer speaks or offers myelin; JSON-only heads stay JSON")
+
+
+def test_myelin_round_trip():
+    if shell is None:
+        print("SKIP - Myelin: Hydra's shell can't load here")
+        return
+    P = plexus("A")
+    tail, delta, dream = P.propose("B", 3), P.propose("C", 1, delta=True), P.dream_state()
+    hunger = {"type": "HUNGER", "id": "A", "crown": 2, "need_tail": True}
+    peers = {"type": "PEERS", "peers": [["10.0.0.1", 9001], ["hydra.local", 9002]]}
+    kinds = [(tail, myelin.TAIL, myelin.TALLIES), (delta, myelin.TAIL, myelin.DELTA),
+             (dream, myelin.TAIL, myelin.DREAM), (hunger, myelin.HUNGER, myelin.NEED_TAIL),
+             (peers, myelin.PEERS, 0)]
+
+    for msg, kind, flag in kinds:
+        wire = msg.to_wire() if hasattr(msg, "to_wire") else msg
+        data = myelin.encode(msg)
+        assert myelin.decode(data) == wire, (myelin.decode(data), wire)
+        got, flags = myelin.kind(data)
+        assert got == kind and flags & flag == flag
+
+        # Every cut is refused whole; a header cut leaves nothing to peek
+        head = len(myelin.header(msg)) if kind != myelin.PEERS else len(data)
+        for n in range(len(data)):
+            assert myelin.decode(data[:n]) is None, (wire, n)
+            if n < head:
+                assert myelin.peek(data[:n]) is None, (wire, n)
+
+    # The header is read alone: tallies ruined past it still peek the same
+    data = myelin.encode(tail)
+    head = len(myelin.header(tail))
+    ruined = data[:head] + bytes([0xFF] * (len(data) - head))
+    seen = myelin.peek(ruined)
+    assert seen["crown"] == tail["crown"] and seen["digest"] == tail["digest"]
+    assert seen["tallies"] is None and myelin.decode(ruined) is None
+    assert myelin.kind(ruined) == myelin.kind(data)
+
+    # Not ours, not this version, not a type, not a width
+    for bad in (b'{"crown":1}', b"", bytes([myelin.MAGIC]),
+                bytes([myelin.MAGIC, myelin.VERSION + 1]) + data[2:],
+                data[:2] + bytes([9]) + data[3:],
+                data[:head + 1] + b"z" + data[head + 2:]):
+        assert myelin.decode(bad) is None
+    assert myelin.kind(b'{"crown":1}') == (0, 0)
+    ok("Myelin: exact round trips, header-only peeks, cut buffers refused")
+
+
+def test_membrane_ring():
+    if shell is None:
+        print("SKIP - Membrane: Hydra's shell can't load here")
+        return
+    # Eviction: oldest out first; a repeat add doesn't move the ring
+    m = shell.Membrane(3)
+    for k in (b"a", b"b", b"c", b"a"):
+        m.add(k)
+    assert len(m) == 3 and m.at == 0
+    m.add(b"d")
+    assert b"a" not in m and all(k in m for k in (b"b", b"c", b"d"))
+
+    # Duplicates: a repeat datagram is an ECHO under the same fingerprint
+    P = plexus("A")
+    tail = P.propose("B", 1)
+    for codec in (shell.MYELIN, shell.JSON):
+        m = shell.Membrane(8)
+        data = shell._wire(tail, codec)
+        first = shell._sense(data, 1, False, membrane=m)
+        again = shell._sense(data, 1, False, membrane=m)
+        assert first[0] == "TAIL" and again == ("ECHO", shell._tail_key(tail), None)
+        # ...unless an envious head is waiting on a dream
+        dream = shell._wire(P.dream_state(), codec)
+        for _ in range(2):
+            assert shell._sense(dream, 1, True, membrane=m)[0] == "TAIL"
+
+    # Decoded at most once: a repeat never is, an envied dream once a pass
+    decodes, decode = [], shell._decode
+    shell._decode = lambda data: decodes.append(data) or decode(data)
+    try:
+        m = shell.Membrane(8)
+        data, dream = shell._wire(tail, shell.JSON), shell._wire(P.dream_state(), shell.JSON)
+        for _ in range(3):
+            shell._sense(data, 1, False, membrane=m)
+            shell._sense(dream, 1, False, membrane=m)
+        assert len(decodes) == 2 and m.dream(shell._fingerprint(dream))
+        for _ in range(3):
+            assert shell._sense(dream, 1, True, membrane=m)[0] == "TAIL"
+        assert len(decodes) == 5
+    finally:
+        shell._decode = decode
+
+    # A forgery under the real header can't poison the real tail; a trace
+    # trailer doesn't make a new one
+    m = shell.Membrane(8)
+    real = myelin.encode(tail)
+    forged = myelin.encode(dict(tail.to_wire(), tallies={"A": 0, "B": 99}))
+    assert myelin.peek(forged)["digest"] == tail["digest"]
+    assert shell._sense(forged, 1, False, membrane=m)[0] == "TAIL"
+    assert shell._sense(real, 1, False, membrane=m)[0] == "TAIL"
+    relayed = myelin.traced(real, "A", 7, 2, "C")
+    assert shell._sense(relayed, 1, False, membrane=m)[0] == "ECHO"
+
+    # HUNGER and PEERS are answered every time, in either tongue
+    m = shell.Membrane(8)
+    for msg in ({"type": "HUNGER", "id": "B", "crown": 1, "need_tail": True},
+                {"type": "PEERS", "peers": [["10.0.0.1", 9001]]}):
+        for codec in (shell.MYELIN, shell.JSON):
+            data = shell._wire(msg, codec)
+            for _ in range(3):
+                assert shell._sense(data, 1, False, membrane=m)[0] == msg["type"]
+    assert len(m) == 0
+
+    # A JSON tail is read, not grepped: accounts named HUNGER/PEERS are tails
+    odd = plexus("A", {"HUNGER": 5, "PEERS": 5}).propose("HUNGER", 1)
+    data = shell._wire(odd, shell.JSON)
+    assert shell._sense(data, 1, False, membrane=m)[0] == "TAIL"
+    assert shell._sense(data, 1, False, membrane=m)[0] == "ECHO"
+    ok("Membrane: ring evicts oldest, repeats echo, forgeries don't, HUNGER/PEERS pass")
+
+
+def test_ganglia_membrane(sources=16, workers=2):
+    if shell is None or not hasattr(socket, "SO_REUSEPORT"):
+        print("SKIP - Ganglia: needs Hydra's shell and SO_REUSEPORT")
+        return
+    try:
+        from ganglia import Ganglia
+        from vitals import COUNTERS, Vitals
+    except (ImportError, ValueError):
+        print("SKIP - Ganglia: no fork here")
+        return
+    probe = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    probe.bind(("127.0.0.1", 0))
+    port = probe.getsockname()[1]
+    probe.close()
+
+    data = shell._wire(plexus("A").propose("B", 1), shell.MYELIN)
+    g = Ganglia(port, workers, membrane=shell.Membrane(64))
+    outs = []
+    try:
+        g.publish(1, False)
+        # Each source twice: a worker drops its own repeat, the heart the rest
+        for _ in range(sources):
+            s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            s.bind(("127.0.0.1", 0))
+            outs.append(s)
+        for s in outs + outs:
+            s.sendto(data, ("127.0.0.1", port))
+        count = lambda name: [p[COUNTERS.index(name)] for p in g.pulses]
+        deadline = time.monotonic() + 5
+        while sum(count("rx")) < 2 * sources and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert sum(count("rx")) == 2 * sources, count("rx")
+        assert all(count("rx")), f"every source landed on one worker: {count('rx')}"
+        # Each worker lets its first copy through, echoes the rest...
+        assert sum(count("membrane_hits")) == 2 * sources - workers
+        # ...and the heart keeps one of the workers' copies
+        v = Vitals()
+        kinds = [r[0] for r in g.drain(v)]
+        assert kinds == ["TAIL"] and v.membrane_hits == workers - 1, (kinds, v.membrane_hits)
+    finally:
+        for s in outs:
+            s.close()
+        g.close()
+    ok("Ganglia: a tail spread across two workers reaches the heart once")
+
+
+def test_nurse_flood_and_cache(flood=50, burst=3):
+    if shell is None:
+        print("SKIP - Nurse: Hydra's shell can't load here")
+        return
+    from vitals import Vitals
+
+    # A bucket that refills slower than the test runs: exactly `burst` fed
+    nurse = shell.Nurse(rate=1e-6, burst=burst)
+    loud, quiet = ("10.0.0.1", 9001), ("10.0.0.2", 9002)
+    fed = sum(nurse.allow(loud) for _ in range(flood))
+    assert fed == burst, fed
+    assert nurse.allow(quiet) and not nurse.allow(loud)
+    assert all(shell.Nurse(rate=0).allow(loud) for _ in range(flood))
+
+    # One encode per tongue per state, however many are hungry
+    P, v = plexus("A"), Vitals()
+    nurse = shell.Nurse()
+    first = nurse.dream(P, shell.MYELIN, v)
+    for _ in range(flood):
+        assert nurse.dream(P, shell.MYELIN, v) is first
+    nurse.dream(P, shell.JSON, v)
+    assert v.dream_encodes == 2
+
+    # The plexus moves: the cached dream is stale and rebuilt
+    P.ingest(P.propose("B", 2))
+    fresh = nurse.dream(P, shell.MYELIN, v)
+    assert fresh != first and v.dream_encodes == 3
+    assert fresh == shell._wire(P.dream_state(), shell.MYELIN)
+    ok("Nurse: a HUNGER flood is rate-limited; the dream follows the plexus")
+
+
+def test_suture_reassembly(seed=19):
+    if shell is None:
+        print("SKIP - Suture: Hydra's shell can't load here")
+        return
+    import suture
+
+    rng = random.Random(seed)
+    payload = bytes(rng.getrandbits(8) for _ in range(suture.WHOLE_MAX * 2))
+    other = bytes(reversed(payload))
+    src = ("10.0.0.1", 9001)
+
+    # Cut once per head, and each head keeps its own cut
+    a, b = suture.Suture(), suture.Suture()
+    frags = a.cut(payload)
+    assert len(frags) > 1 and a.cut(payload) is frags
+    assert b.cut(other) is not frags and a.cut(payload) is frags
+    assert a.cut(b"small") == (b"small",)
+
+    # Out of order, every chunk twice: whole exactly once
+    shuffled = list(frags) * 2
+    rng.shuffle(shuffled)
+    sut = suture.Suture()
+    got = [w for w in (sut.add(f, src) for f in shuffled) if w is not None]
+    assert got == [payload] and not sut.open and sut.held == 0
+    assert sut.vitals.sutured == 1
+
+    # One chunk missing: nothing passed on, and the wound is reaped
+    sut = suture.Suture(ttl=0.5)
+    for f in frags[:-2] + frags[-1:]:
+        assert sut.add(f, src) is None
+    assert len(sut.open) == 1
+    time.sleep(0.6)
+    assert sut.add(suture.fragments(other)[0], src) is None
+    assert sut.vitals.torn == 1 and len(sut.open) == 1
+
+    # Forged counts reserve nothing: the count must fit the bytes and the
+    # fragment length, and the slots are charged against the budget
+    sut = suture.Suture()
+    forged = [myelin.chunk(123, 1, 0, 50_000_000, b"x"),
+              myelin.chunk(123, 50_000_000, 0, 50_000_000, b"x"),
+              myelin.chunk(123, 3000, 0, 2, bytes(1000)),
+              myelin.chunk(123, 3000, 2, 3, bytes(1500))]
+    for f in forged:
+        assert sut.add(f, src) is None
+    assert not sut.open and sut.held == 0
+    first = sut.add(frags[0], src)
+    assert first is None and sut.held == len(payload) + suture.SLOT_BYTES * len(frags)
+    ok("Suture: out-of-order and duplicate chunks stitch once; a gap never does")
+
+
+def test_strangers_bounded():
+    if shell is None:
+        print("SKIP - Strangers: Hydra's shell can't load here")
+        return
+    import dendrite
+
+    # One forged list, then many: capped per list and in total
+    d = dendrite.Dendrites(seeds=[("127.0.0.1", 1)], port=9000)
+    forged = [[f"10.{i >> 16 & 255}.{i >> 8 & 255}.{i & 255}", 9000] for i in range(5000)]
+    assert len(d.learn(forged)) == dendrite.LEARN_MAX
+    for n in range(0, len(forged), dendrite.LEARN_MAX):
+        d.learn(forged[n:n + dendrite.LEARN_MAX])
+    assert d.strangers == dendrite.STRANGERS_MAX
+    assert len(d) == dendrite.STRANGERS_MAX + 1
+    assert d.learn([["192.168.0.1", 9000]]) == []
+
+    # Heard from: no longer a stranger, and the slot is free again
+    d.touch(tuple(forged[0]))
+    assert d.strangers == dendrite.STRANGERS_MAX - 1
+    assert d.learn([["192.168.0.1", 9000]]) == [("192.168.0.1", 9000)]
+
+    # Tongues: the oldest sources give way, and come back by speaking
+    speaks = {}
+    first = ("10.0.0.1", 9001)
+    shell._heard(speaks, first, shell.MYELIN)
+    for i in range(shell.SPEAKS_MAX):
+        shell._heard(speaks, (f"10.1.{i >> 8 & 255}.{i & 255}", 9000), shell.JSON)
+    assert len(speaks) == shell.SPEAKS_MAX and first not in speaks
+    shell._heard(speaks, first, shell.MYELIN)
+    assert speaks[first] == shell.MYELIN and len(speaks) == shell.SPEAKS_MAX
+    ok("Strangers: rosters can't flood the peer table; tongues stay bounded")
+
+
+def test_thalamus_relay(seed=23, trials=3000):
+    if shell is None:
+        print("SKIP - Thalamus: Hydra's shell can't load here")
+        return
+    from plexus import Tail
+    from thalamus import relay
+
+    rng = random.Random(seed)
+    names = "ABCDE"
+    book = {n: 10 for n in names}
+
+    def stray(dream, claim=None):
+        t = {n: rng.randint(0, 3) for n in names}
+        return Tail(id="X", tallies=t, crown=rng.randint(1, 3),
+                    digest=tally_digest(t) if claim is None else claim, is_dream=dream)
+
+    dropped = total = liars = 0
+    for _ in range(trials):
+        warm = rng.randint(0, 4)
+        sim, whole, kept = (plexus("Z", book) for _ in range(3))
+        for _ in range(warm):
+            p = sim.propose(rng.choice(names), 1)
+            for P in (sim, whole, kept):
+                P.ingest(p)
+        drain = []
+        for _ in range(rng.randint(1, 12)):
+            r = rng.random()
+            if r < 0.15:
+                drain.append(stray(True))
+            elif r < 0.5:
+                p = sim.propose(rng.choice(names), 1, delta=r < 0.3)
+                sim.ingest(p)
+                drain.append(p)
+            elif r < 0.6:
+                # A liar: someone else's tallies under an honest digest
+                liars += 1
+                drain.append(stray(rng.random() < 0.2, claim=sim.digest()))
+            else:
+                drain.append(stray(False))
+        envy = rng.random() < 0.3
+        whole.envy = kept.envy = envy
+
+        # The whole drain, as an envious head lands it: latest dream first
+        order = drain
+        dreams = [t for t in drain if t.get("is_dream")]
+        if envy and dreams:
+            order = [dreams[-1]] + [t for t in drain if not t.get("is_dream")]
+        whole.ingest_many(order)
+
+        # Digests vouched for here; the wire's word is enough while nobody lies
+        crown, digest = int(kept.state.crown), kept.digest()
+        survivors = [f[1] for f in relay([(t, t) for t in drain], crown, digest,
+                                         envy, kept.state.tallies)]
+        if all(t["digest"] == tally_digest(t["tallies"]) for t in drain if "tallies" in t):
+            assert [f[0] for f in relay([(t,) for t in drain], crown, digest, envy)] \
+                == survivors
+        kept.ingest_many(survivors)
+        total += len(drain)
+        dropped += len(drain) - len(survivors)
+        assert (whole.state.crown, whole.digest(), whole.envy) == \
+            (kept.state.crown, kept.digest(), kept.envy), (drain, envy, survivors)
+    assert dropped > total // 10 and liars, (dropped, total, liars)
+    ok(f"Thalamus: relay lands where the whole drain does, liars and all "
+       f"({dropped}/{total} dropped)")
+
+
+def test_digest_cost(accounts=5000):
+    import ObliviousTally
+
+    book = {f"acct{i}": 100 for i in range(accounts)}
+    registry = AccountRegistry(book)
+    makers = [
+        ("dict", lambda i: ObliviousHeart(i, book)),
+        ("registry", lambda i: ObliviousHeart(i, book, registry=registry)),
+        ("persistent", lambda i: ObliviousHeart(i, book, persistent=True)),
+    ]
+    if shell is not None:
+        makers += [("plexus", lambda i: plexus(i, book)),
+                   ("plexus persistent", lambda i: plexus(i, book, persistent=True))]
+
+    hashes, real = [0], ObliviousTally.entry_hash
+
+    def counted(name, value):
+        hashes[0] += 1
+        return real(name, value)
+
+    ObliviousTally.entry_hash = counted
+    try:
+        for mode, make in makers:
+            src, sink, burst = make("acct0"), make("sink"), make("burst")
+            for H in (src, sink, burst):
+                H.digest()                   # the one full hash, at birth
+            hashes[0] = 0
+            p = src.propose("acct1", 1)
+            dream = dict(p.to_wire(), is_dream=True)
+            sink.ingest(p)
+            sink.ingest(p)
+            sink.ingest(dream)
+            burst.ingest_many([p, p, dream])
+            # Two entries moved: 4 hashes to propose, 4 per adopt, 0 per repeat
+            assert hashes[0] <= 12, (mode, hashes[0])
+            assert sink.digest() == burst.digest() == tally_digest(p["tallies"])
+
+        # A swarm born from one genesis book hashes it once, not once a head
+        if shell is not None:
+            genesis = tally_digest(book)
+            hashes[0] = 0
+            swarm = [plexus(f"acct{i}", book, initial_digest=genesis) for i in range(8)]
+            assert hashes[0] == 0 and all(P.digest() == genesis for P in swarm)
+    finally:
+        ObliviousTally.entry_hash = real
+    if shell is not None:
+        try:
+            plexus("acct0", book, initial_digest=genesis ^ 1, verify_digest=True)
+            raise AssertionError("a wrong genesis digest was taken on trust")
+        except ValueError:
+            pass
+    ok("Digest cost: repeats hash nothing; a tail hashes only what it moved")
+
+
+def test_gossip(fanout=3, suppress=3):
+    if shell is None:
+        print("SKIP - Gossip: Hydra's shell can't load here")
+        return
+    from synapse import HEARD_MAX, Gossip
+
+    # One name per tail: in either tongue, as an echo, and as our own
+    P = plexus("A")
+    tail = P.propose("B", 1)
+    name = shell._tail_key(tail)
+    m = shell.Membrane(8)
+    for codec in (shell.MYELIN, shell.JSON):
+        data = shell._wire(tail, codec)
+        kind, _, msg = shell._sense(data, 1, False, membrane=m)
+        assert kind == "TAIL" and shell._tail_key(msg) == name
+        assert shell._sense(data, 1, False, membrane=m) == ("ECHO", name, None)
+
+    # Forward until heard `suppress` times, first copy included; 0 never quiets
+    g = Gossip(fanout=fanout, suppress=suppress)
+    for n in range(1, suppress + 1):
+        assert g.forward(name)
+        assert g.hear(name) == n
+    assert not g.forward(name) and g.forward(shell._tail_key(P.propose("C", 1)))
+    loud = Gossip(fanout=fanout, suppress=0)
+    for _ in range(10):
+        loud.hear(name)
+    assert loud.forward(name)
+
+    # Crown sampling: the same k for the same tail and round, never the source,
+    # another k as copies come back; a small pool goes whole
+    peers = [("10.0.0.%d" % i, 9000) for i in range(12)]
+    a, b = (Gossip(fanout=fanout, sampling="crown", head_id="A") for _ in range(2))
+    first = a.targets(tail, name, peers, peers[0])
+    assert first == b.targets(tail, name, peers, peers[0])
+    assert len(first) == fanout and peers[0] not in first
+    draws = {tuple(first)}
+    for _ in range(8):
+        a.hear(name)
+        draws.add(tuple(a.targets(tail, name, peers, peers[0])))
+    assert len(draws) > 1
+    assert sorted(a.targets(tail, name, peers[:fanout + 1], peers[0])) == peers[1:fanout + 1]
+
+    # Heard table: newest HEARD_MAX names kept; hearing again makes a name new
+    g = Gossip(fanout=fanout, suppress=suppress)
+    g.hear("old")
+    for i in range(HEARD_MAX - 1):
+        g.hear(i)
+    g.hear("old")
+    g.hear("new")
+    assert len(g.heard) == HEARD_MAX
+    assert 0 not in g.heard and g.heard["old"] == 2 and g.heard["new"] == 1
+    ok("Gossip: one name per tail, quiet after `suppress`, crown draws repeat, heard is bounded")
+
+
+def test_commissure_ring(seed=29, size=4096):
+    if shell is None:
+        print("SKIP - Commissure: Hydra's shell can't load here")
+        return
+    try:
+        from commissure import Commissure
+        from vitals import Vitals
+    except ImportError:
+        print("SKIP - Commissure: no shared memory here")
+        return
+    rng = random.Random(seed)
+    probe = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    probe.bind(("127.0.0.1", 0))
+    port = probe.getsockname()[1]
+    probe.close()
+    try:
+        out = Commissure(port, size=size)
+        into = Commissure(port + 1, peers=lambda: [("127.0.0.1", port)], vitals=Vitals(), size=size)
+    except OSError:
+        print("SKIP - Commissure: no POSIX shared memory here")
+        return
+    try:
+        into.refresh()
+        out.refresh()
+        assert out.local(("127.0.0.1", port + 1))
+        me, other = (port + 1,), (port + 2,)
+        views = []
+
+        def keep(view):
+            views.append(type(view))
+            return bytes(view)
+
+        # Wraparound: a few records a look, many laps, every one in order
+        sent, got = [], []
+        while sum(map(len, sent)) < 20 * size:
+            for _ in range(rng.randint(1, 2)):
+                payload = bytes(rng.getrandbits(8) for _ in range(rng.randint(1, out.record_max - 16)))
+                out.send(b"other", other)
+                assert out.send(payload, me)
+                sent.append(payload)
+            got += into.drain(keep)
+        assert [d for d, _ in got] == sent and {a for _, a in got} == {("127.0.0.1", port)}
+        assert set(views) == {memoryview}
+        assert len(views) == len(sent) and into.vitals.shm_overruns == 0
+
+        # A reader lapped between looks drops to the present
+        for _ in range(8):
+            out.send(bytes(out.record_max - 16), me)
+        assert into.drain(keep) == [] and into.vitals.shm_overruns == 1
+        out.send(b"after", me)
+        assert [d for d, _ in into.drain(keep)] == [b"after"]
+
+        # Torn: the producer laps the reader while keep() is reading
+        def torn(view):
+            first = bytes(view)
+            for _ in range(8):
+                out.send(bytes(out.record_max - 16), me)
+            return first
+        out.send(b"torn", me)
+        out.send(b"lost", me)
+        assert into.drain(torn) == [] and into.vitals.shm_overruns == 2
+        out.send(b"whole", me)
+        assert [d for d, _ in into.drain(keep)] == [b"whole"]
+    finally:
+        into.close()
+        out.close()
+    ok(f"Commissure: {len(sent)} records over 20 laps; lapped and torn reads dropped")
+
+
 def main():
     tests = [
         ("gate_and_sync", test_gate_and_sync,
@@ -213,6 +1254,46 @@ def main():
          "Duplicate delivery is harmless"),
         ("convergence_ordered", test_convergence_ordered,
          "Same delivery order => all nodes converge (even with drops/dups)"),
+        ("compact_matches_dict", test_compact_matches_dict,
+         "Array-backed tallies are a drop-in for the dict Heart"),
+        ("delta_matches_full", test_delta_matches_full,
+         "Delta proofs apply on a matching base, else request sync"),
+        ("digest_tracks_state", test_digest_tracks_state,
+         "Incremental digest is the equality and identity of a state"),
+        ("ingest_many", test_ingest_many_matches_sequential,
+         "A burst collapses to its survivor with coalesced intents"),
+        ("proof_frozen", test_proof_frozen_and_shared,
+         "Proofs are frozen and shared; wire form is a plain dict"),
+        ("persistent_tallies", test_persistent_matches_dict,
+         "HAMT tallies: a transfer copies a path, not the book"),
+        ("sharded_heart", test_sharded_isolates_envy,
+         "Shards keep their own phase and envy; bursts run in parallel"),
+        ("swarm_engine", test_swarm_matches_heart,
+         "Vectorized swarm delivers exactly as per-heart ingest"),
+        ("batch_kernel", test_kernel_matches_skeleton,
+         "Struct-of-arrays Step agrees with the skeleton pair by pair"),
+        ("wire_offer", test_wire_offer,
+         "Myelin only to peers that spoke or offered it"),
+        ("myelin_codec", test_myelin_round_trip,
+         "Binary wire round-trips, peeks headers, refuses cut buffers"),
+        ("storm_membrane", test_membrane_ring,
+         "Bounded fingerprint ring dedupes tails, never HUNGER or PEERS"),
+        ("ganglia_membrane", test_ganglia_membrane,
+         "Workers dedupe their own sources; the heart dedupes across them"),
+        ("nurse", test_nurse_flood_and_cache,
+         "Per-source HUNGER buckets; one dream encode per state and tongue"),
+        ("suture", test_suture_reassembly,
+         "Chunks stitch in any order, once; a missing chunk tears the stream"),
+        ("strangers", test_strangers_bounded,
+         "Hearsay peers and remembered tongues are bounded"),
+        ("thalamus_relay", test_thalamus_relay,
+         "Superseded tails dropped before the heart change nothing"),
+        ("digest_cost", test_digest_cost,
+         "Equality by compare; digests carried, never rehashed per tail"),
+        ("gossip", test_gossip,
+         "Tails named once across tongues; suppression, sampling, bounds"),
+        ("commissure", test_commissure_ring,
+         "Ring records read in place; wraparound, lapped and torn reads"),
     ]
 
     for _, fn, _ in tests:
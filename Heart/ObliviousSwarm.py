@@ -0,0 +1,267 @@
+# ==============================================
+# ObliviousSwarm v0.1 — Truth Through Erasure
+# No time. No replay. No logs.
+# ==============================================
+"""
+N hearts as one set of arrays: an N×K int64 tally matrix over an account
+registry, plus rps, envy, head and digest vectors. Each delivery runs the
+Heart's gate, no-op and overwrite rules across every recipient at once and
+returns a per-heart intent bitmask. Per-heart results are the same as
+ObliviousHeart.ingest (default, digest-decided equality).
+
+Requires NumPy. Run directly for an equivalence check and a scale run.
+"""
+from __future__ import annotations
+import random
+import time
+from typing import Any, Dict, List, Mapping, Optional, Sequence
+
+import numpy as np
+
+from ObliviousHeart import ROCK, PAPER, SCISSORS, ObliviousHeart, Proof
+from ObliviousTally import HOLE, AccountRegistry, digest_update, tally_digest
+
+# Intent bitmask (one uint8 per heart per delivery)
+ENVY, REQUEST_SYNC, PROPAGATE, NEED_TAIL = 1, 2, 4, 8
+
+# NEXT_RPS[r] → the admissible next phase of r
+NEXT_RPS = np.array([ROCK, PAPER, SCISSORS, ROCK], dtype=np.int8)
+
+def _digest(value: int) -> np.uint64:
+    return np.uint64(int(value) & 0xFFFFFFFFFFFFFFFF)
+
+class Swarm:
+    def __init__(self, n: int,
+                 initial_tallies: Optional[Mapping[str, int]] = None,
+                 initial_rps: int = ROCK,
+                 registry: Optional[AccountRegistry] = None,
+                 ids: Optional[Sequence[str]] = None) -> None:
+        tallies = dict(initial_tallies or {
+            "A": 10, "B": 10, "C": 10, "D": 10, "E": 10
+        })
+        self.registry = registry or AccountRegistry(sorted(tallies))
+        self.ids: List[str] = [str(i) for i in (ids or range(int(n)))]
+        n = len(self.ids)
+        row = self._row(tallies)
+        self.tallies = np.tile(row, (n, 1))
+        self.rps = np.full(n, int(initial_rps), dtype=np.int8)
+        self.envy = np.zeros(n, dtype=bool)
+        self.head = np.full(n, -1, dtype=np.int32)        # -1 → None
+        self.digest = np.full(n, _digest(tally_digest(tallies)), dtype=np.uint64)
+        self._heads: Dict[str, int] = {}
+        self._head_names: List[str] = []
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    # =========================
+    # Rows ↔ tallies
+    # =========================
+    def _grow(self, k: int) -> None:
+        if k > self.tallies.shape[1]:
+            pad = np.full((len(self), k - self.tallies.shape[1]), HOLE, np.int64)
+            self.tallies = np.hstack([self.tallies, pad])
+
+    def _row(self, tallies: Mapping[str, int]) -> np.ndarray:
+        slots = [self.registry.slot(k) for k in tallies]
+        row = np.full(len(self.registry), HOLE, dtype=np.int64)
+        row[slots] = [int(v) for v in tallies.values()]
+        if hasattr(self, "tallies"):
+            self._grow(len(row))
+        return row
+
+    def _head_code(self, head: Optional[str]) -> int:
+        if not head:
+            return -1
+        code = self._heads.get(head)
+        if code is None:
+            code = self._heads[head] = len(self._head_names)
+            self._head_names.append(head)
+        return code
+
+    def view(self, i: int) -> Dict[str, int]:
+        names = self.registry.names
+        return {names[j]: int(v) for j, v in enumerate(self.tallies[i])
+                if v != HOLE}
+
+    def snapshot(self, i: int) -> Proof:
+        return Proof(id=self.ids[i], tallies=self.view(i),
+                     rps=int(self.rps[i]), digest=int(self.digest[i]),
+                     is_dream=False)
+
+    def state_head(self, i: int) -> Optional[str]:
+        code = int(self.head[i])
+        return None if code < 0 else self._head_names[code]
+
+    def converged(self) -> bool:
+        return bool((self.digest == self.digest[0]).all()
+                    and (self.rps == self.rps[0]).all())
+
+    # =========================
+    # Proposal (from heart i)
+    # =========================
+    def propose(self, i: int, to_node: str, amount: int,
+                delta: bool = False, frm: Optional[str] = None) -> Proof:
+        # frm: the account debited, when hearts and accounts differ
+        heart = ObliviousHeart(frm or self.ids[i], self.view(i), int(self.rps[i]))
+        heart._digest = (heart.state.tallies, int(self.digest[i]))
+        heart.envy = bool(self.envy[i])
+        return heart.propose(to_node, amount, delta=delta)
+
+    # =========================
+    # Delivery (one proof → many hearts)
+    # =========================
+    def deliver(self, incoming: Proof, to: Any = None) -> np.ndarray:
+        idx = np.arange(len(self)) if to is None else np.asarray(to)
+        if idx.dtype == bool:
+            idx = np.flatnonzero(idx)
+        out = np.zeros(len(idx), dtype=np.uint8)
+        if not isinstance(incoming, Mapping) or len(idx) == 0:
+            return out
+        head_in = str(incoming.get("id", "")) or None
+        tallies_in = incoming.get("tallies", {}) or {}
+        if incoming.get("is_seed") or incoming.get("is_dream") or incoming.get(
+            "is_snapshot"
+        ):
+            if tallies_in:
+                d = _digest(tally_digest(tallies_in))    # never the wire's
+                rows = idx[self.digest[idx] != d]
+                if len(rows):
+                    self.tallies[rows] = self._row(tallies_in)
+                    self.digest[rows] = d
+            self.envy[idx] = False
+            return out
+
+        rps_cur = self.rps[idx]
+        rps_in = int(incoming.get("rps", incoming.get("crown", 0)) or 0)
+        if "rps" not in incoming and "crown" not in incoming:
+            rps_in_v = rps_cur                     # absent → current phase
+        else:
+            rps_in_v = np.full(len(idx), rps_in, dtype=np.int8)
+        rps_next = NEXT_RPS[rps_cur]
+        admit = (rps_in_v == rps_cur) | (rps_in_v == rps_next)
+        # ↑↑↑↑↑ LinchPin ↑↑↑↑↑
+
+        reject = ~admit
+        out[reject & ~self.envy[idx]] |= ENVY
+        out[reject] |= REQUEST_SYNC
+        self.envy[idx[reject]] = True
+
+        if "delta" in incoming:
+            return self._deliver_delta(incoming, idx, admit, rps_in_v,
+                                       rps_next, head_in, out)
+
+        self.envy[idx[admit]] = False
+        d = _digest(tally_digest(tallies_in))            # never the wire's
+        adopt = admit & (self.digest[idx] != d)
+        rows = idx[adopt]
+        if len(rows):
+            self.tallies[rows] = self._row(tallies_in)
+            self.digest[rows] = d
+            self.rps[rows] = rps_in_v[adopt]
+            self.head[rows] = self._head_code(head_in)
+        out[adopt] |= PROPAGATE
+        out[adopt & (rps_in_v == rps_next)] |= REQUEST_SYNC
+        return out
+
+    def _deliver_delta(self, incoming: Proof, idx: np.ndarray,
+                       admit: np.ndarray, rps_in_v: np.ndarray,
+                       rps_next: np.ndarray, head_in: Optional[str],
+                       out: np.ndarray) -> np.ndarray:
+        base = incoming.get("base")
+        on_base = admit & (self.digest[idx] == _digest(base or 0)) \
+            if base is not None else np.zeros_like(admit)
+        stale = admit & ~on_base
+        out[stale] |= REQUEST_SYNC | NEED_TAIL
+        self.envy[idx[on_base]] = False
+
+        changes = {str(k): int(v) for k, v in
+                   (incoming.get("delta", {}) or {}).items()}
+        slots = np.array([self.registry.slot(k) for k in changes], dtype=np.intp)
+        self._grow(len(self.registry))
+        vals = np.array(list(changes.values()), dtype=np.int64)
+        rows = idx[on_base]
+        if not len(rows):
+            return out
+        changed = (self.tallies[np.ix_(rows, slots)] != vals).any(axis=1)
+        adopt = np.zeros_like(admit)
+        adopt[np.flatnonzero(on_base)[changed]] = True
+        rows = idx[adopt]
+        if len(rows):
+            # Same base digest → same old entries → one new digest for all
+            old = self.tallies[rows[0], slots]
+            d = int(base)
+            for k, o, v in zip(changes, old, changes.values()):
+                d = digest_update(d, k, None if o == HOLE else int(o), v)
+            self.tallies[np.ix_(rows, slots)] = vals
+            self.digest[rows] = _digest(d)
+            self.rps[rows] = rps_in_v[adopt]
+            self.head[rows] = self._head_code(head_in)
+        out[adopt] |= PROPAGATE
+        out[adopt & (rps_in_v == rps_next)] |= REQUEST_SYNC
+        return out
+
+# =========================
+# Self-check + scale run
+# =========================
+def _mask(intents: List[Any]) -> int:
+    bits = {"ENVY": ENVY, "REQUEST_SYNC": REQUEST_SYNC, "PROPAGATE": PROPAGATE}
+    m = 0
+    for it in intents:
+        m |= bits[it.type]
+        if it.payload.get("need_tail"):
+            m |= NEED_TAIL
+    return m
+
+def check_against_heart(seed: int = 7, nodes: int = 8, rounds: int = 200) -> None:
+    rng = random.Random(seed)
+    ids = [chr(ord("A") + i) for i in range(nodes)]
+    init = {i: 10 for i in ids}
+    hearts = [ObliviousHeart(i, init) for i in ids]
+    swarm = Swarm(nodes, init, ids=ids)
+    for _ in range(rounds):
+        src = rng.randrange(nodes)
+        r = rng.random()
+        if r < 0.1:
+            p = hearts[src].seed_proof().replace(is_dream=True)
+        else:
+            dst = rng.choice([x for x in ids if x != ids[src]])
+            p = hearts[src].propose(dst, rng.randint(1, 3), delta=r < 0.5)
+        if rng.random() < 0.15:
+            p = p.replace(rps=rng.choice([ROCK, PAPER, SCISSORS]))
+        to = np.array([rng.random() < 0.7 for _ in ids])
+        got = swarm.deliver(p, to)
+        want = [_mask(hearts[i].ingest(p)) for i in np.flatnonzero(to)]
+        assert list(got) == want, (got, want)
+        for i in range(nodes):
+            assert swarm.view(i) == hearts[i].snapshot()["tallies"]
+            assert int(swarm.rps[i]) == hearts[i].snapshot()["rps"]
+            assert bool(swarm.envy[i]) == hearts[i].envy
+            assert swarm.state_head(i) == hearts[i].state.head
+            assert int(swarm.digest[i]) == hearts[i].digest()
+
+def scale_run(nodes: int = 100_000, accounts: int = 16, rounds: int = 200,
+              drop: float = 0.1, seed: int = 7) -> Dict[str, Any]:
+    rng = np.random.default_rng(seed)
+    names = [f"acct{i}" for i in range(accounts)]
+    swarm = Swarm(nodes, {k: 100 for k in names})
+    t0 = time.perf_counter()
+    sends = 0
+    for _ in range(rounds):
+        src = int(rng.integers(nodes))
+        frm, to = rng.choice(accounts, 2, replace=False)
+        p = swarm.propose(src, names[to], 1, frm=names[frm])
+        out = swarm.deliver(p, rng.random(nodes) >= drop)
+        sends += int(np.count_nonzero(out & PROPAGATE))
+    elapsed = time.perf_counter() - t0
+    return {"nodes": nodes, "accounts": accounts, "rounds": rounds,
+            "seconds": round(elapsed, 3),
+            "deliveries_per_sec": round(nodes * rounds / elapsed),
+            "envious": int(swarm.envy.sum()),
+            "distinct_states": int(len(np.unique(swarm.digest))),
+            "propagates": sends}
+
+if __name__ == "__main__":
+    check_against_heart()
+    print("OK  - Swarm matches ObliviousHeart.ingest per heart")
+    print(scale_run())
@@ -0,0 +1,434 @@
+# ==============================================
+# ObliviousTally v0.1 — Truth Through Erasure
+# No time. No replay. No logs.
+# ==============================================
+from __future__ import annotations
+from array import array
+from hashlib import blake2b
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, MutableMapping, Optional, Tuple
+
+# An empty slot. Distinguishes "no such account" from a zero balance,
+# so a vector compares exactly like the dict it stands in for.
+HOLE = -(1 << 63)
+
+# =========================
+# Digest (order-independent)
+# =========================
+def entry_hash(name: str, value: int) -> int:
+    h = blake2b(f"{name}\x00{int(value)}".encode("utf-8"), digest_size=8)
+    return int.from_bytes(h.digest(), "big")
+
+def tally_digest(tallies: Mapping[str, int]) -> int:
+    # XOR of entry hashes: any order, any representation, same digest.
+    d = 0
+    for name, value in tallies.items():
+        d ^= entry_hash(name, value)
+    return d
+
+def digest_update(digest: int, name: str,
+                  old: Optional[int], new: Optional[int]) -> int:
+    # One entry changed: strike the old hash, fold in the new one.
+    if old is not None:
+        digest ^= entry_hash(name, old)
+    if new is not None:
+        digest ^= entry_hash(name, new)
+    return digest
+
+def digest_against(tallies: Mapping[str, int], base: Mapping[str, int],
+                   digest: int, changes: Optional[Mapping[str, int]] = None,
+                   verify: bool = False) -> Optional[int]:
+    """Digest of incoming tallies, carried from `digest` (the digest of
+    base overlaid with changes) across only the entries that differ; None
+    if none do. Nothing is taken off the wire. verify=True recomputes the
+    digest in full as a cross-check."""
+    if not changes and (tallies is base or tallies == base):
+        return None                                # C-level compare decides
+    names = set(tally_changes(base, tallies))
+    if changes:
+        names.update(changes)
+    d, moved = digest, False
+    for name in names:
+        old = changes[name] if changes and name in changes else base.get(name)
+        new = tallies.get(name)
+        if old != new:
+            d, moved = digest_update(d, name, old, new), True
+    if not moved:
+        return None
+    if verify and d != tally_digest(tallies):
+        raise ValueError("carried digest drifted from the tallies")
+    return d
+
+def tally_changes(old: Mapping[str, int], new: Mapping[str, int]) -> Iterable[str]:
+    """Names whose entries differ between two tallies. Shared HAMT subtrees
+    and equal vector blocks are skipped without looking inside."""
+    if isinstance(old, PersistentTallies) and isinstance(new, PersistentTallies):
+        out: List[str] = []
+        _changed(old._root, new._root, out)
+        return out
+    if (isinstance(old, TallyVector) and isinstance(new, TallyVector)
+            and old.registry is new.registry):
+        return _vector_changes(old, new)
+    return {name for name, _ in _items(old) ^ _items(new)}
+
+def _items(tallies: Mapping[str, int]) -> Any:
+    # dict_items (set ops in C); a mappingproxy hands out its dict's view
+    if isinstance(tallies, (dict, MappingProxyType)):
+        return tallies.items()
+    return dict(tallies.items()).items()
+
+def _vector_changes(old: "TallyVector", new: "TallyVector",
+                    block: int = 512) -> List[str]:
+    a, b, names = old.values, new.values, old.registry._names
+    n = min(len(a), len(b))
+    out: List[str] = []
+    for s in range(0, n, block):
+        if a[s:s + block] != b[s:s + block]:       # memcmp per block
+            out.extend(names[i] for i in range(s, min(s + block, n)) if a[i] != b[i])
+    longer = a if len(a) > n else b
+    out.extend(names[i] for i in range(n, len(longer)) if longer[i] != HOLE)
+    return out
+
+class AccountRegistry:
+    """Shared account-name → slot index. Slots are append-only."""
+    __slots__ = ("_slots", "_names")
+
+    def __init__(self, names: Iterable[str] = ()) -> None:
+        self._slots: Dict[str, int] = {}
+        self._names: List[str] = []
+        for name in names:
+            self.slot(name)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._slots
+
+    @property
+    def names(self) -> List[str]:
+        return list(self._names)
+
+    def find(self, name: str) -> Optional[int]:
+        return self._slots.get(name)
+
+    def slot(self, name: str) -> int:
+        name = str(name)
+        i = self._slots.get(name)
+        if i is None:
+            i = self._slots[name] = len(self._names)
+            self._names.append(name)
+        return i
+
+    def vector(self, tallies: Optional[Mapping[str, int]] = None) -> "TallyVector":
+        # Same registry → one buffer copy. Anything else → one pass.
+        if isinstance(tallies, TallyVector) and tallies.registry is self:
+            return tallies.copy()
+        vec = TallyVector(self)
+        for name, value in (tallies or {}).items():
+            vec[name] = value
+        return vec
+
+class TallyVector(MutableMapping[str, int]):
+    """Fixed-order int64 tallies over a registry; reads like a dict."""
+    __slots__ = ("registry", "values", "frozen")
+
+    def __init__(self, registry: AccountRegistry,
+                 values: Optional[array] = None) -> None:
+        self.registry = registry
+        self.values = values if values is not None else array("q")
+        self.frozen = False
+
+    # =========================
+    # Mapping view
+    # =========================
+    def __getitem__(self, name: str) -> int:
+        i = self.registry.find(name)
+        if i is None or i >= len(self.values) or self.values[i] == HOLE:
+            raise KeyError(name)
+        return self.values[i]
+
+    def __setitem__(self, name: str, value: int) -> None:
+        if self.frozen:
+            raise TypeError("frozen tallies; copy() to change")
+        value = int(value)
+        if value == HOLE:
+            raise ValueError("tally out of range")
+        i = self.registry.slot(name)
+        if i >= len(self.values):
+            self.values.extend([HOLE] * (i + 1 - len(self.values)))
+        self.values[i] = value
+
+    def __delitem__(self, name: str) -> None:
+        if self.frozen:
+            raise TypeError("frozen tallies; copy() to change")
+        i = self.registry.find(name)
+        if i is None or i >= len(self.values) or self.values[i] == HOLE:
+            raise KeyError(name)
+        self.values[i] = HOLE
+
+    def __iter__(self) -> Iterator[str]:
+        names = self.registry._names
+        for i, v in enumerate(self.values):
+            if v != HOLE:
+                yield names[i]
+
+    def __len__(self) -> int:
+        return len(self.values) - self.values.count(HOLE)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, TallyVector) and other.registry is self.registry:
+            a, b = self.values, other.values
+            if len(a) == len(b):
+                return a == b                      # memcmp
+            if len(a) > len(b):
+                a, b = b, a
+            n, tail = len(a), b[len(a):]
+            return a == b[:n] and tail.count(HOLE) == len(tail)
+        if isinstance(other, Mapping):
+            return dict(self.items()) == dict(other.items())
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return repr(self.to_dict())
+
+    # =========================
+    # Buffer ops
+    # =========================
+    def copy(self) -> "TallyVector":
+        return TallyVector(self.registry, self.values[:])
+
+    def freeze(self) -> "TallyVector":
+        # Read-only from here on; safe to share between states and proofs
+        self.frozen = True
+        return self
+
+    def to_dict(self) -> Dict[str, int]:
+        return dict(self.items())
+
+# =========================
+# Persistent tallies (HAMT)
+# =========================
+# 32-way hash array mapped trie. A leaf is a (name, value, hash) tuple; a
+# node holds a bitmap and a packed tuple of leaves and child nodes. Setting
+# one entry copies only the path to it: O(log32 n) new nodes, everything
+# else shared with the map it came from.
+_BITS = 5
+_MASK = (1 << _BITS) - 1
+_HASH = 64
+_MISSING = object()
+
+class _Node:
+    __slots__ = ("bitmap", "items")
+
+    def __init__(self, bitmap: int, items: Tuple[Any, ...]) -> None:
+        self.bitmap = bitmap      # -1 → collision bucket (hash bits spent)
+        self.items = items
+
+_EMPTY = _Node(0, ())
+
+def _hash(name: str) -> int:
+    return hash(name) & ((1 << _HASH) - 1)
+
+def _index(bitmap: int, bit: int) -> int:
+    return bin(bitmap & (bit - 1)).count("1")
+
+def _get(node: _Node, h: int, name: str) -> Any:
+    shift = 0
+    while True:
+        if node.bitmap < 0:
+            for leaf in node.items:
+                if leaf[0] == name:
+                    return leaf[1]
+            return _MISSING
+        bit = 1 << ((h >> shift) & _MASK)
+        if not node.bitmap & bit:
+            return _MISSING
+        entry = node.items[_index(node.bitmap, bit)]
+        if isinstance(entry, _Node):
+            node, shift = entry, shift + _BITS
+            continue
+        return entry[1] if entry[0] == name else _MISSING
+
+def _split(a: Tuple[str, int, int], b: Tuple[str, int, int], shift: int) -> _Node:
+    if shift >= _HASH:
+        return _Node(-1, (a, b))
+    ia, ib = (a[2] >> shift) & _MASK, (b[2] >> shift) & _MASK
+    if ia == ib:
+        return _Node(1 << ia, (_split(a, b, shift + _BITS),))
+    return _Node((1 << ia) | (1 << ib), (a, b) if ia < ib else (b, a))
+
+def _set(node: _Node, leaf: Tuple[str, int, int], shift: int) -> Tuple[_Node, int]:
+    # → (new node, size change); the same node back when nothing changed
+    name, value, h = leaf
+    if node.bitmap < 0:
+        if _get(node, h, name) == value:
+            return node, 0
+        rest = tuple(e for e in node.items if e[0] != name)
+        return _Node(-1, rest + (leaf,)), int(len(rest) == len(node.items))
+    bit = 1 << ((h >> shift) & _MASK)
+    i = _index(node.bitmap, bit)
+    items = node.items
+    if not node.bitmap & bit:
+        return _Node(node.bitmap | bit, items[:i] + (leaf,) + items[i:]), 1
+    entry = items[i]
+    if isinstance(entry, _Node):
+        child, grew = _set(entry, leaf, shift + _BITS)
+        if child is entry:
+            return node, 0
+    elif entry[0] == name:
+        if entry[1] == value:
+            return node, 0
+        child, grew = leaf, 0
+    else:
+        child, grew = _split(entry, leaf, shift + _BITS), 1
+    return _Node(node.bitmap, items[:i] + (child,) + items[i + 1:]), grew
+
+def _remove(node: _Node, h: int, name: str, shift: int) -> Any:
+    # → the new node (or a lone leaf to inline), or _MISSING if absent
+    if node.bitmap < 0:
+        rest = tuple(e for e in node.items if e[0] != name)
+        if len(rest) == len(node.items):
+            return _MISSING
+        return rest[0] if len(rest) == 1 else _Node(-1, rest)
+    bit = 1 << ((h >> shift) & _MASK)
+    if not node.bitmap & bit:
+        return _MISSING
+    i = _index(node.bitmap, bit)
+    entry = node.items[i]
+    if isinstance(entry, _Node):
+        child = _remove(entry, h, name, shift + _BITS)
+        if child is _MISSING:
+            return _MISSING
+        items = node.items[:i] + (child,) + node.items[i + 1:]
+        bitmap = node.bitmap
+    elif entry[0] == name:
+        items = node.items[:i] + node.items[i + 1:]
+        bitmap = node.bitmap & ~bit
+    else:
+        return _MISSING
+    if shift and len(items) == 1 and not isinstance(items[0], _Node):
+        return items[0]
+    return _Node(bitmap, items)
+
+def _leaves(node: _Node) -> Iterator[Tuple[str, int, int]]:
+    for entry in node.items:
+        if isinstance(entry, _Node):
+            yield from _leaves(entry)
+        else:
+            yield entry
+
+def _same(a: Any, b: Any) -> bool:
+    # Shared subtrees are equal without looking inside
+    if a is b:
+        return True
+    if isinstance(a, _Node) and isinstance(b, _Node):
+        if a.bitmap >= 0 and a.bitmap == b.bitmap:
+            return all(_same(x, y) for x, y in zip(a.items, b.items))
+        return ({e[0]: e[1] for e in _leaves(a)}
+                == {e[0]: e[1] for e in _leaves(b)})
+    if isinstance(a, _Node) or isinstance(b, _Node):
+        return False
+    return a[0] == b[0] and a[1] == b[1]
+
+def _changed(a: Any, b: Any, out: List[str]) -> None:
+    # Names that differ under two subtrees; shared ones are skipped
+    if a is b:
+        return
+    a_node, b_node = isinstance(a, _Node), isinstance(b, _Node)
+    if a_node and b_node and a.bitmap >= 0 and a.bitmap == b.bitmap:
+        for x, y in zip(a.items, b.items):
+            _changed(x, y, out)
+        return
+    if not a_node and not b_node and a[0] == b[0]:
+        if a[1] != b[1]:
+            out.append(a[0])
+        return
+    da = {e[0]: e[1] for e in (_leaves(a) if a_node else (a,))}
+    db = {e[0]: e[1] for e in (_leaves(b) if b_node else (b,))}
+    out.extend(k for k in da.keys() | db.keys()
+               if da.get(k, _MISSING) != db.get(k, _MISSING))
+
+class PersistentTallies(Mapping[str, int]):
+    """Immutable tallies with structural sharing; reads like a dict."""
+    __slots__ = ("_root", "_len")
+
+    def __init__(self, tallies: Optional[Mapping[str, int]] = None) -> None:
+        root, n = _EMPTY, 0
+        for name, value in (tallies or {}).items():
+            name = str(name)
+            root, grew = _set(root, (name, int(value), _hash(name)), 0)
+            n += grew
+        self._root, self._len = root, n
+
+    @classmethod
+    def _make(cls, root: _Node, n: int) -> "PersistentTallies":
+        m = object.__new__(cls)
+        m._root, m._len = root, n
+        return m
+
+    # =========================
+    # Mapping view
+    # =========================
+    def __getitem__(self, name: str) -> int:
+        v = _get(self._root, _hash(name), name) if isinstance(name, str) else _MISSING
+        if v is _MISSING:
+            raise KeyError(name)
+        return v
+
+    def get(self, name: str, default: Any = None) -> Any:
+        v = _get(self._root, _hash(name), name) if isinstance(name, str) else _MISSING
+        return default if v is _MISSING else v
+
+    def __contains__(self, name: object) -> bool:
+        return isinstance(name, str) and _get(self._root, _hash(name), name) is not _MISSING
+
+    def __iter__(self) -> Iterator[str]:
+        return (leaf[0] for leaf in _leaves(self._root))
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, PersistentTallies):
+            return self._len == other._len and _same(self._root, other._root)
+        if isinstance(other, Mapping):
+            return self.to_dict() == dict(other.items())
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        # Hash order is per-process; print in name order
+        return repr(dict(sorted(self.to_dict().items())))
+
+    def __reduce__(self) -> Any:
+        # str hashes are per-process: rebuild on load
+        return (PersistentTallies, (self.to_dict(),))
+
+    # =========================
+    # Path-copying updates
+    # =========================
+    def set(self, name: str, value: int) -> "PersistentTallies":
+        name = str(name)
+        root, grew = _set(self._root, (name, int(value), _hash(name)), 0)
+        return self if root is self._root else self._make(root, self._len + grew)
+
+    def update(self, changes: Mapping[str, int]) -> "PersistentTallies":
+        root, n = self._root, self._len
+        for name, value in changes.items():
+            name = str(name)
+            root, grew = _set(root, (name, int(value), _hash(name)), 0)
+            n += grew
+        return self if root is self._root else self._make(root, n)
+
+    def remove(self, name: str) -> "PersistentTallies":
+        root = _remove(self._root, _hash(name), name, 0)
+        if root is _MISSING:
+            raise KeyError(name)
+        return self._make(root, self._len - 1)
+
+    def to_dict(self) -> Dict[str, int]:
+        return {leaf[0]: leaf[1] for leaf in _leaves(self._root)}
@@ -0,0 +1,104 @@
+# ============================================
+# Bench (Pulse) — Truth Through Erasure
+# No time. No replay. No logs.
+# ============================================
+"""
+Plexus hot paths under a stopwatch: propose, ingest (in-window, out-of-window,
+duplicate, delta) and dream hydration, plus the wire codecs, across book sizes.
+The stopwatch, JSON report and baseline check are Heart/ObliviousBench.py's.
+
+    python bench.py --out base.json
+    python bench.py --baseline base.json
+"""
+from __future__ import annotations
+import sys
+from typing import Any, Callable, Dict, List, Optional
+
+from plexus import plexus, crown_next            # puts Heart/ on the path
+from shell import JSON, MYELIN, _decode, _peek, _wire as _wire_out
+
+import ObliviousBench
+from ObliviousBench import Op, Setup, _book, _cycle
+
+# ============================================
+# Cases
+# ============================================
+def _plexus(**options: Any) -> Dict[str, Setup]:
+    def head(name: str, accounts: int) -> plexus:
+        return plexus(head_id=name, initial_tallies=_book(accounts), **options)
+
+    def propose(accounts: int, ops: int) -> Op:
+        p = head("acct0", accounts)
+        return lambda: p.propose("acct1", 1)
+
+    def chain(accounts: int, ops: int, delta: bool = False) -> List[Any]:
+        src, out = head("acct0", accounts), []
+        for i in range(ops):
+            t = src.propose(f"acct{1 + i % max(1, accounts - 1)}", 1, delta=delta)
+            src.ingest(t)
+            out.append(t)
+        return out
+
+    def in_window(accounts: int, ops: int) -> Op:
+        p, tails = head("sink", accounts), _cycle(chain(accounts, ops))
+        return lambda: p.ingest(tails())
+
+    def in_window_delta(accounts: int, ops: int) -> Op:
+        p, tails = head("sink", accounts), _cycle(chain(accounts, ops, delta=True))
+        return lambda: p.ingest(tails())
+
+    def out_of_window(accounts: int, ops: int) -> Op:
+        p = head("sink", accounts)
+        t = head("acct0", accounts).propose("acct1", 1)
+        t = t.replace(crown=crown_next(crown_next(p.state.crown)))
+        return lambda: p.ingest(t)
+
+    def duplicate(accounts: int, ops: int) -> Op:
+        p = head("sink", accounts)
+        t = head("acct0", accounts).propose("acct1", 1)
+        p.ingest(t)
+        return lambda: p.ingest(t)
+
+    def hydrate(accounts: int, ops: int) -> Op:
+        p, a, b = head("sink", accounts), head("acct0", accounts), head("acct0", accounts)
+        b.ingest(b.propose("acct1", 1))
+        dreams, flip = [a.dream_state(), b.dream_state()], [0]
+
+        def op() -> Any:
+            flip[0] ^= 1
+            return p.ingest(dreams[flip[0]])
+        return op
+
+    return {"propose": propose, "ingest.in_window": in_window,
+            "ingest.in_window_delta": in_window_delta,
+            "ingest.out_of_window": out_of_window,
+            "ingest.duplicate": duplicate, "ingest.hydrate": hydrate}
+
+def _wire() -> Dict[str, Setup]:
+    def tail(accounts: int) -> Any:
+        return plexus(head_id="acct0", initial_tallies=_book(accounts)).propose("acct1", 1)
+
+    def encode(codec: str) -> Setup:
+        return lambda accounts, ops: (lambda t=tail(accounts): _wire_out(t, codec))
+
+    def decode(codec: str, fn: Callable[[bytes], Any]) -> Setup:
+        return lambda accounts, ops: (lambda b=_wire_out(tail(accounts), codec): fn(b))
+
+    return {"json.encode": encode(JSON), "json.decode": decode(JSON, _decode),
+            "myelin.encode": encode(MYELIN), "myelin.decode": decode(MYELIN, _decode),
+            "myelin.peek": decode(MYELIN, _peek)}
+
+def cases() -> Dict[str, Setup]:
+    out: Dict[str, Setup] = {}
+    for group, table in (("plexus", _plexus()),
+                         ("plexus.persistent", _plexus(persistent=True)),
+                         ("wire", _wire())):
+        for name, setup in table.items():
+            out[f"{group}.{name}"] = setup
+    return out
+
+def main(argv: Optional[List[str]] = None) -> int:
+    return ObliviousBench.main(argv, cases(), prog="bench.py")
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,356 @@
+# ============================================
+# Commissure (Shared Memory) — Truth Through Erasure
+# No time. No replay. No logs.
+# ============================================
+"""
+The short way between heads on one machine. With --shm a head publishes one
+ring in shared memory, named for its port (hydra-PORT). It writes every
+datagram meant for co-resident peers into that ring exactly once, addressed
+to their ports. Each co-resident peer reads the ring with its own cursor
+and keeps only what is addressed to it. A fan-out to N local heads is one
+write and N reads: no syscall per peer, no kernel copy, and one encode per
+wire format. Remote peers, and local heads without --shm, still get UDP.
+
+A reader registers itself in the producer's ring header and restamps
+itself every SHM_REFRESH seconds. A producer uses the ring only for peers
+stamped within SHM_STALE; anyone else gets a datagram, so a head that died
+or restarted without --shm is never written into the void. A restarted
+head's new ring has a new nonce, and readers reattach to it.
+
+The ring keeps no history and applies no backpressure. A new reader starts
+at the present. A reader lapped by the producer skips to the present and
+counts an overrun, just as a full socket buffer would have dropped. Records
+up to a quarter of the ring travel whole, so a local hungry head can
+hydrate a big book without chunks.
+
+A record is read where it lies. drain(keep) hands each one addressed to us
+to keep() as a view into the ring; the body senses it there and copies out
+only what it still needs (a tail's bytes, a chunk), never an echo or a
+HUNGER. The write cursor is checked again once keep() returns, seqlock
+fashion: a record the producer overwrote meanwhile is thrown away, whatever
+keep() made of it, and counted as an overrun.
+
+Readers poll, backing off from SHM_SPIN to SHM_IDLE. A reader that stays
+quiet naps on its UDP socket and marks itself asleep in every ring it reads.
+A producer writing to a sleeper clears the mark and rings it with one empty
+datagram. Under load nobody naps and no bells ring; an idle swarm costs
+nothing. A bell lost to a race costs at most SHM_NAP.
+
+    [write u64][nonce u64][readers: SHM_SLOTS × (port, stamp, asleep: u32)][data…]
+    record: [size u32][count u16][port u16 × count][payload]
+
+Linux (POSIX shared memory) and total-store-order CPUs, like ganglia.py.
+"""
+from __future__ import annotations
+import os, struct, threading, time
+from multiprocessing import resource_tracker, shared_memory
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from vitals import Vitals
+
+Addr = Tuple[str, int]
+
+SHM_BYTES = 1 << 22         # per head
+SHM_SLOTS = 64              # readers one ring can register
+SHM_REFRESH = 1.0           # seconds between reader restamps and ring rescans
+SHM_STALE = 3.0             # a reader not restamped for this long gets UDP again
+SHM_SPIN = 0.0002           # reader poll backoff, seconds
+SHM_IDLE = 0.002
+SHM_NAP = 0.25              # longest sleep on the socket waiting for a bell
+
+BELL = b""                  # the doorbell: an empty datagram
+
+_U64 = struct.Struct("Q")
+_SLOT = struct.Struct("III")
+_REC = struct.Struct("IH")
+_WRAP = 0xFFFFFFFF
+_HEAD = 16 + SHM_SLOTS * _SLOT.size
+
+def ring_name(port: int) -> str:
+    return f"hydra-{int(port)}"
+
+def _stamp() -> int:
+    # Deciseconds on the system-wide monotonic clock (same in every process)
+    return int(time.monotonic() * 10) & 0xFFFFFFFF
+
+def _fresh(stamp: int, now: int) -> bool:
+    return (now - stamp) & 0xFFFFFFFF <= SHM_STALE * 10
+
+def _loopback(addr: Addr) -> bool:
+    return addr[0].startswith("127.") or addr[0] in ("localhost", "0.0.0.0")
+
+def _open(name: str, size: int = 0) -> shared_memory.SharedMemory:
+    # Untracked: the resource tracker would unlink a ring when any process
+    # that touched it exits (or a Ctrl+X regrowth execs away); the owner
+    # unlinks on close, and a severed head's ring is reclaimed by the next
+    # head on its port
+    create = size > 0
+    try:
+        return shared_memory.SharedMemory(name=name, create=create, size=size,
+                                          track=False)  # type: ignore[call-arg]
+    except TypeError:
+        shm = shared_memory.SharedMemory(name=name, create=create, size=size)
+        resource_tracker.unregister(shm._name, "shared_memory")  # type: ignore[attr-defined]
+        return shm
+
+def _unlink(shm: shared_memory.SharedMemory) -> None:
+    # SharedMemory.unlink would also unregister what was never registered
+    try:
+        import _posixshmem
+        _posixshmem.shm_unlink(shm._name)  # type: ignore[attr-defined]
+    except ImportError:
+        shm.unlink()
+    except FileNotFoundError:
+        pass
+
+class _Tap:
+    """A peer's ring, read from our own cursor."""
+    __slots__ = ("port", "shm", "buf", "cap", "nonce", "read", "slot")
+
+    def __init__(self, port: int, shm: shared_memory.SharedMemory) -> None:
+        self.port = port
+        self.shm = shm
+        self.buf = shm.buf
+        self.cap = len(self.buf) - _HEAD
+        self.nonce = _U64.unpack_from(self.buf, 8)[0]
+        self.read = _U64.unpack_from(self.buf, 0)[0]   # the present; no replay
+        self.slot = -1
+
+    def close(self) -> None:
+        self.buf.release()
+        self.shm.close()
+
+class Commissure:
+    def __init__(self, port: int, peers: Callable[[], Iterable[Addr]] = tuple,
+                 vitals: Optional[Vitals] = None,
+                 bell: Optional[Callable[[Addr], None]] = None,
+                 size: int = SHM_BYTES) -> None:
+        self.port = int(port)
+        self.peers = peers                         # who might be co-resident, read at refresh
+        self.vitals = vitals if vitals is not None else Vitals()
+        self.bell = bell                           # None → never nap (nobody could wake us)
+        name = ring_name(port)
+        try:
+            stale = _open(name)                    # a severed head's ring
+            stale.close()
+            _unlink(stale)
+        except FileNotFoundError:
+            pass
+        self.shm = _open(name, _HEAD + int(size))
+        self.buf = self.shm.buf
+        self.buf[:_HEAD] = bytes(_HEAD)
+        _U64.pack_into(self.buf, 8, int.from_bytes(os.urandom(8), "big"))
+        self.cap = len(self.buf) - _HEAD
+        self.record_max = self.cap // 4
+        self.write = 0
+        self.lock = threading.Lock()               # one producer, however many threads send
+        self.taps: Dict[int, _Tap] = {}
+        self.readers: Dict[int, int] = {}          # port → slot, as of the last refresh
+        self.asleep = False
+        self._due = 0.0
+        self._wait = SHM_SPIN
+
+    # Who is local
+    def refresh(self) -> None:
+        """Attach (or reattach) co-resident peers' rings, restamp ourselves in
+        each, and reread who reads ours."""
+        now = _stamp()
+        want = {int(a[1]) for a in self.peers() if _loopback(a) and int(a[1]) != self.port}
+        for port in list(self.taps):
+            if port not in want:
+                self.taps.pop(port).close()
+        for port in want:
+            tap = self.taps.get(port)
+            try:
+                if tap is None or not self._alive(tap):
+                    if tap is not None:
+                        self.taps.pop(port).close()
+                    tap = self.taps[port] = _Tap(port, _open(ring_name(port)))
+            except (FileNotFoundError, ValueError):
+                continue                           # not co-resident, or no --shm
+            self._register(tap, now)
+        readers: Dict[int, int] = {}
+        for i in range(SHM_SLOTS):
+            port, stamp, _ = _SLOT.unpack_from(self.buf, 16 + i * _SLOT.size)
+            if port and _fresh(stamp, now):
+                readers[port] = i
+        self.readers = readers
+        self._due = time.monotonic() + SHM_REFRESH
+
+    def _alive(self, tap: _Tap) -> bool:
+        # The owner unlinked it (a restart): the name now holds another ring
+        try:
+            probe = _open(ring_name(tap.port))
+        except FileNotFoundError:
+            return False
+        same = _U64.unpack_from(probe.buf, 8)[0] == tap.nonce
+        probe.close()
+        return same
+
+    def _register(self, tap: _Tap, now: int) -> None:
+        buf = tap.buf
+        if tap.slot >= 0 and _SLOT.unpack_from(buf, 16 + tap.slot * _SLOT.size)[0] == self.port:
+            _SLOT.pack_into(buf, 16 + tap.slot * _SLOT.size, self.port, now, int(self.asleep))
+            return
+        # Probe from our hash; take ours back, else an empty or stale slot
+        start = self.port % SHM_SLOTS
+        for k in range(SHM_SLOTS):
+            i = (start + k) % SHM_SLOTS
+            port, stamp, _ = _SLOT.unpack_from(buf, 16 + i * _SLOT.size)
+            if port in (0, self.port) or not _fresh(stamp, now):
+                _SLOT.pack_into(buf, 16 + i * _SLOT.size, self.port, now, int(self.asleep))
+                tap.slot = i
+                return
+
+    def local(self, peer: Addr) -> bool:
+        return int(peer[1]) in self.readers and _loopback(peer)
+
+    # Efferent: one write for every local recipient
+    def send(self, payload: bytes, ports: Sequence[int]) -> bool:
+        n = _REC.size + 2 * len(ports) + len(payload)
+        if n > self.record_max:
+            return False
+        buf, cap = self.buf, self.cap
+        sleepers: List[int] = []
+        with self.lock:
+            w = self.write
+            pos = w % cap
+            if cap - pos < n:
+                if cap - pos >= 4:
+                    struct.pack_into("I", buf, _HEAD + pos, _WRAP)
+                w += cap - pos
+                pos = 0
+            at = _HEAD + pos
+            _REC.pack_into(buf, at, n - 4, len(ports))
+            struct.pack_into(f"{len(ports)}H", buf, at + _REC.size, *ports)
+            buf[at + _REC.size + 2 * len(ports):at + n] = payload
+            self.write = w + n
+            _U64.pack_into(buf, 0, self.write)   # publish after the bytes
+            for port in ports:
+                slot = self.readers.get(port)
+                if slot is None:
+                    continue
+                at = 16 + slot * _SLOT.size + 8
+                if struct.unpack_from("I", buf, at)[0]:
+                    struct.pack_into("I", buf, at, 0)   # one bell per nap
+                    sleepers.append(port)
+        self.vitals.shm_out += 1
+        if self.bell is not None:
+            for port in sleepers:
+                self.bell(("127.0.0.1", port))
+                self.vitals.shm_bells += 1
+        return True
+
+    # Afferent: everything addressed to us since the last look
+    def _scan(self, keep: Callable[[memoryview], Any] = bytes) -> List[Tuple[Any, Addr]]:
+        out: List[Tuple[Any, Addr]] = []
+        me = self.port
+        for tap in self.taps.values():
+            buf, cap = tap.buf, tap.cap
+            lap = cap - cap // 4                   # how far behind a record stays intact
+            w = _U64.unpack_from(buf, 0)[0]
+            r = tap.read
+            if r == w:
+                continue
+            if w - r > lap:
+                self.vitals.shm_overruns += 1      # lapped: drop to the present
+                tap.read = w
+                continue
+            addr = ("127.0.0.1", tap.port)
+            while r < w:
+                pos = r % cap
+                if cap - pos < 4:
+                    r += cap - pos
+                    continue
+                kept = None
+                try:
+                    size = struct.unpack_from("I", buf, _HEAD + pos)[0]
+                    if size == _WRAP:
+                        r += cap - pos
+                        continue
+                    count = _REC.unpack_from(buf, _HEAD + pos)[1]
+                    at = _HEAD + pos + _REC.size
+                    if me in struct.unpack_from(f"{count}H", buf, at):
+                        # Read where it lies; keep copies out what it keeps
+                        view = buf[at + 2 * count:_HEAD + pos + 4 + size]
+                        try:
+                            kept = keep(view)
+                        finally:
+                            view.release()
+                    torn = False
+                except struct.error:
+                    torn = True
+                if torn or _U64.unpack_from(buf, 0)[0] - r > lap:
+                    # Overwritten under us (the seqlock check, after the
+                    # read): whatever keep made of it goes; to the present
+                    self.vitals.shm_overruns += 1
+                    r = _U64.unpack_from(buf, 0)[0]
+                    break
+                if kept is not None:
+                    out.append((kept, addr))
+                r += 4 + size
+            tap.read = r
+        return out
+
+    def _mark(self, asleep: bool) -> None:
+        self.asleep = asleep
+        for tap in self.taps.values():
+            if tap.slot >= 0:
+                struct.pack_into("I", tap.buf, 16 + tap.slot * _SLOT.size + 8, int(asleep))
+
+    def drain(self, keep: Callable[[memoryview], Any] = bytes) -> List[Tuple[Any, Addr]]:
+        """(keep(record), sender) for every record addressed to us. keep sees
+        a view into the ring, valid only during the call, and returns what
+        to keep of it (None: nothing). Default: a copy of the bytes."""
+        if time.monotonic() >= self._due:
+            self.refresh()
+        out = self._scan(keep)
+        if out:
+            if self.asleep:
+                self._mark(False)
+            self._wait = SHM_SPIN
+        elif self._wait < SHM_IDLE or self.bell is None:
+            self._wait = min(self._wait * 2, SHM_IDLE)
+        elif not self.asleep:
+            # Quiet long enough: ask to be rung, then look once more for
+            # anything written before the producers could see the mark
+            self._mark(True)
+            out = self._scan(keep)
+            if out:
+                self._mark(False)
+                self._wait = SHM_SPIN
+            else:
+                self._wait = SHM_NAP
+        self.vitals.shm_in += len(out)
+        return out
+
+    def idle(self) -> float:
+        # How long a reader may wait on its socket before looking again
+        return min(self._wait, max(0.0, self._due - time.monotonic()))
+
+    def close(self) -> None:
+        for tap in self.taps.values():
+            tap.close()
+        self.taps.clear()
+        self.buf.release()
+        self.shm.close()
+        _unlink(self.shm)
+
+def fan(pairs: Iterable[Tuple[Addr, bytes]], commissure: Optional[Commissure],
+        send: Any) -> None:
+    """Send each (peer, payload): co-resident readers get one ring write per
+    distinct payload, everyone else goes through `send(payload, peer)`."""
+    if commissure is None:
+        for peer, payload in pairs:
+            send(payload, peer)
+        return
+    local: Dict[int, Tuple[bytes, List[int]]] = {}
+    for peer, payload in pairs:
+        if commissure.local(peer):
+            local.setdefault(id(payload), (payload, []))[1].append(int(peer[1]))
+        else:
+            send(payload, peer)
+    for payload, ports in local.values():
+        if not commissure.send(payload, ports):
+            for port in ports:                     # too big for the ring: datagrams
+                send(payload, ("127.0.0.1", port))
@@ -0,0 +1,354 @@
+# ============================================
+# Cradle (Harness) — Truth Through Erasure
+# No time. No replay. No logs.
+# ============================================
+"""
+Real heads on a fake network. N headless hydra.py processes on localhost
+peer only through a proxy that treats their datagrams the way womb.py's
+links do, with the same womb.Links: per-link latency, loss, duplication,
+reordering and partitions.
+
+The proxy keeps one UDP socket per ordered pair. Head i reaches j at
+link(i, j), and j hears i from link(j, i), so replies find their way back
+and every head sees one distinct address per peer. PEERS rosters are
+rewritten on the way through, so learned peers are links too. Bulk TCP is
+not proxied.
+
+FEEDs are scripted one line at a time on each head's stdin ("feed B 1"),
+one proposal at a time. For each, the cradle waits for the origin's digest
+to move, then for every head to hold it, reading digests off the heads'
+--vitals sockets (so timings are only as fine as one polling sweep). It
+reports convergence percentiles and datagrams per proposal by kind:
+
+    python cradle.py --heads 5 --proposals 50 --latency uniform:1,10 --drop 0.05
+    python cradle.py --heads 8 --head-args="--async --gossip 2"
+"""
+from __future__ import annotations
+import argparse, heapq, json, os, random, selectors, shlex, shutil, socket
+import subprocess, sys, tempfile, threading, time
+from collections import Counter
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import myelin
+from vitals import read as _read
+from womb import Links, Weather, latency
+
+Addr = Tuple[str, int]
+
+HOST = "127.0.0.1"
+BASE_PORT = 47000
+BOOT_TIMEOUT = 10.0         # seconds for every head's vitals socket to answer
+ORIGIN_TIMEOUT = 1.0        # the FEED itself (an envious origin never moves)
+SPREAD_TIMEOUT = 5.0        # the rest of the swarm
+SETTLE = 0.5                # quiet after the last proposal, before the final count
+KINDS = {myelin.TAIL: "tails", myelin.HUNGER: "hungers",
+         myelin.CHUNK: "chunks", myelin.PEERS: "peers"}
+
+def _kind(data: bytes) -> str:
+    if myelin.is_myelin(data):
+        try:
+            return KINDS.get(myelin.kind(data)[0], "tails")
+        except (IndexError, ValueError):
+            return "tails"
+    if b'"PEERS"' in data:
+        return "peers"
+    return "hungers" if b'"HUNGER"' in data else "tails"
+
+def _names(n: int) -> List[str]:
+    return [chr(ord("A") + i) if n <= 26 else f"H{i}" for i in range(n)]
+
+def _pct(xs: Sequence[float]) -> Optional[Dict[str, float]]:
+    if not xs:
+        return None
+    s = sorted(xs)
+    at = lambda q: s[min(len(s) - 1, int(q * len(s)))]
+    return {"p50": round(at(0.50), 2), "p90": round(at(0.90), 2),
+            "p99": round(at(0.99), 2), "max": round(s[-1], 2)}
+
+# ============================================
+# Proxy (the network that lies)
+# ============================================
+class Proxy:
+    def __init__(self, n: int, weather: Weather, seed: int = 0) -> None:
+        self.n = int(n)
+        self.weather = weather
+        self.rng = random.Random(seed)
+        self.heads: List[Addr] = []
+        self.sock: Dict[Tuple[int, int], socket.socket] = {}
+        self.pair: Dict[int, Tuple[int, int]] = {}
+        for i in range(self.n):
+            for j in range(self.n):
+                if i == j:
+                    continue
+                s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+                s.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 1 << 20)
+                s.bind((HOST, 0))
+                s.setblocking(False)
+                self.sock[(i, j)] = s
+                self.pair[s.getsockname()[1]] = (i, j)
+        self.links = Links(self.n, weather, self.rng)
+        self.timers: List[Tuple[float, int, int, int, bytes]] = []
+        self.seq = 0
+        self.counts: Counter = Counter()
+        self.lock = threading.Lock()              # counts are read from the main thread
+        self.born = time.monotonic()
+        self.stop = threading.Event()
+
+    def port(self, i: int, j: int) -> int:
+        return self.sock[(i, j)].getsockname()[1]
+
+    def _roster(self, i: int, j: int, data: bytes) -> bytes:
+        # i's live links become j's links to the same heads
+        msg = myelin.decode(data) if myelin.is_myelin(data) else json.loads(data)
+        peers = []
+        for host, port in msg.get("peers") or ():
+            _, k = self.pair.get(int(port), (None, None))
+            if k is not None and k != j:
+                peers.append([HOST, self.port(j, k)])
+        out = {"type": "PEERS", "peers": peers}
+        return myelin.encode(out) if myelin.is_myelin(data) else json.dumps(out).encode("utf-8")
+
+    def _carry(self, i: int, j: int, data: bytes, now: float) -> None:
+        kind = _kind(data)
+        with self.lock:
+            self.counts[kind] += 1
+            if kind == "peers":
+                try:
+                    data = self._roster(i, j, data)
+                except (ValueError, TypeError, AttributeError):
+                    self.counts["strays"] += 1
+                    return
+            for delay in self.links.carry(i, j, (now - self.born) * 1000.0, self.counts):
+                self.seq += 1
+                heapq.heappush(self.timers, (now + delay / 1000.0, self.seq, j, i, data))
+
+    def run(self) -> None:
+        sel = selectors.DefaultSelector()
+        for pair, s in self.sock.items():
+            sel.register(s, selectors.EVENT_READ, pair)
+        timers = self.timers
+        while not self.stop.is_set():
+            wait = min(0.05, max(0.0, timers[0][0] - time.monotonic())) if timers else 0.05
+            for key, _ in sel.select(wait):
+                i, j = key.data
+                while True:
+                    try:
+                        data, src = key.fileobj.recvfrom(65535)  # type: ignore[union-attr]
+                    except (BlockingIOError, InterruptedError):
+                        break
+                    if src != self.heads[i]:
+                        with self.lock:
+                            self.counts["strays"] += 1
+                        continue
+                    self._carry(i, j, data, time.monotonic())
+            now = time.monotonic()
+            while timers and timers[0][0] <= now:
+                _, _, j, i, data = heapq.heappop(timers)
+                try:
+                    self.sock[(j, i)].sendto(data, self.heads[j])
+                except OSError:
+                    with self.lock:
+                        self.counts["refused"] += 1
+        sel.close()
+        for s in self.sock.values():
+            s.close()
+
+    def close(self) -> None:
+        self.stop.set()                           # run() closes the sockets on its way out
+
+    def take(self) -> Counter:
+        with self.lock:
+            out, self.counts = self.counts, Counter()
+        return out
+
+# ============================================
+# Swarm
+# ============================================
+class Cradle:
+    def __init__(self, n: int, weather: Weather, head_args: Sequence[str] = (),
+                 base_port: int = BASE_PORT, seed: int = 0, direct: bool = False) -> None:
+        self.n = int(n)
+        self.names = _names(self.n)
+        self.rng = random.Random(seed)
+        self.proxy: Optional[Proxy] = None
+        if not direct:
+            self.proxy = Proxy(self.n, weather, seed=seed)
+            self.proxy.heads = [(HOST, base_port + i) for i in range(self.n)]
+        self.dir = tempfile.mkdtemp(prefix="cradle-")
+        self.socks = [os.path.join(self.dir, f"{name}.sock") for name in self.names]
+        self.heads: List[subprocess.Popen] = []
+        hydra = os.path.join(os.path.dirname(os.path.abspath(__file__)), "hydra.py")
+        for i, name in enumerate(self.names):
+            peers = [f"{HOST}:{self.proxy.port(i, j) if self.proxy else base_port + j}"
+                     for j in range(self.n) if j != i]
+            argv = [sys.executable, hydra, "--id", name, "--port", str(base_port + i),
+                    "--headless", "--vitals", self.socks[i], *head_args, "--peers", *peers]
+            self.heads.append(subprocess.Popen(argv, stdin=subprocess.PIPE, stdout=subprocess.DEVNULL,
+                                               stderr=subprocess.DEVNULL, text=True))
+        if self.proxy is not None:
+            threading.Thread(target=self.proxy.run, daemon=True, name="proxy").start()
+
+    def vitals(self, i: int) -> Dict[str, Any]:
+        return _read(self.socks[i])
+
+    def digest(self, i: int) -> Optional[int]:
+        try:
+            return self.vitals(i)["gauges"]["digest"]
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def boot(self) -> None:
+        until = time.monotonic() + BOOT_TIMEOUT
+        for i in range(self.n):
+            while self.digest(i) is None:
+                if self.heads[i].poll() is not None:
+                    raise RuntimeError(f"head {self.names[i]} died at birth")
+                if time.monotonic() > until:
+                    raise RuntimeError(f"head {self.names[i]} never answered on {self.socks[i]}")
+                time.sleep(0.05)
+
+    def feed(self, i: int, to: str, amount: int = 1) -> None:
+        stdin = self.heads[i].stdin
+        assert stdin is not None
+        stdin.write(f"feed {to} {amount}\n")
+        stdin.flush()
+
+    def propose(self) -> Dict[str, Any]:
+        """One FEED from a random head; when each head came to hold it."""
+        i = self.rng.randrange(self.n)
+        j = (i + 1 + self.rng.randrange(self.n - 1)) % self.n
+        before = self.digest(i)
+        t0 = time.monotonic()
+        self.feed(i, self.names[j])
+
+        target = before
+        while target == before and time.monotonic() - t0 < ORIGIN_TIMEOUT:
+            target = self.digest(i)
+        if target == before:
+            return {"origin": self.names[i], "stalled": True}
+
+        arrivals: Dict[int, float] = {i: (time.monotonic() - t0) * 1000.0}
+        pending = set(range(self.n)) - {i}
+        while pending and time.monotonic() - t0 < ORIGIN_TIMEOUT + SPREAD_TIMEOUT:
+            for k in list(pending):
+                if self.digest(k) == target:
+                    arrivals[k] = (time.monotonic() - t0) * 1000.0
+                    pending.discard(k)
+        origin = arrivals.pop(i)
+        return {"origin": self.names[i], "stalled": False, "origin_ms": origin,
+                "arrivals": list(arrivals.values()),
+                "converge_ms": max(arrivals.values(), default=origin) if not pending else None}
+
+    def close(self) -> None:
+        for p in self.heads:
+            p.terminate()
+        for p in self.heads:
+            try:
+                p.wait(timeout=2.0)
+            except subprocess.TimeoutExpired:
+                p.kill()
+        if self.proxy is not None:
+            self.proxy.close()
+        shutil.rmtree(self.dir, ignore_errors=True)
+
+def bench(n: int, proposals: int, weather: Weather, head_args: Sequence[str] = (),
+          gap: float = 0.05, base_port: int = BASE_PORT, seed: int = 0,
+          direct: bool = False) -> Dict[str, Any]:
+    cradle = Cradle(n, weather, head_args, base_port, seed, direct)
+    proxy = cradle.proxy
+
+    def sent() -> Counter:
+        # What the heads themselves say they sent: datagrams, and ring records
+        total: Counter = Counter()
+        for i in range(n):
+            c = cradle.vitals(i)["counters"]
+            total.update(tx=c["tx"], shm_out=c["shm_out"], shm_in=c["shm_in"])
+        return total
+
+    try:
+        cradle.boot()
+        time.sleep(SETTLE)                        # first HUNGERs answered
+        if proxy is not None:
+            proxy.take()
+            proxy.born = time.monotonic()         # the partition clock starts with the first FEED
+        before = sent()
+        runs = []
+        for _ in range(int(proposals)):
+            runs.append(cradle.propose())
+            time.sleep(gap)
+        time.sleep(SETTLE)
+        carried = proxy.take() if proxy is not None else Counter()
+        heads = sent()
+        heads.subtract(before)
+        digests = {cradle.digest(i) for i in range(n)}
+    finally:
+        cradle.close()
+
+    moved = [r for r in runs if not r["stalled"]]
+    whole = [r["converge_ms"] for r in moved if r["converge_ms"] is not None]
+    per = max(1, int(proposals))
+    return {
+        "heads": n,
+        "proposals": int(proposals),
+        "head_args": list(head_args),
+        "stalled": len(runs) - len(moved),
+        "converged": len(whole),
+        "origin_ms": _pct([r["origin_ms"] for r in moved]),
+        "converge_ms": _pct(whole),
+        "arrival_ms": _pct([t for r in moved for t in r["arrivals"]]),
+        "per_proposal": {k: round(carried[k] / per, 2) for k in ("tails", "hungers", "chunks")},
+        "per_proposal_total": round(sum(carried[k] for k in ("tails", "hungers", "chunks")) / per, 2),
+        "head_sent": {k: round(heads[k] / per, 2) for k in ("tx", "shm_out", "shm_in")},
+        "network": {k: carried[k] for k in ("peers", "dropped", "duplicated", "reordered",
+                                            "partitioned", "strays", "refused")},
+        "digests_end": len(digests),
+    }
+
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(prog="cradle.py")
+    ap.add_argument("--heads", type=int, default=5, help="Heads to launch (default 5)")
+    ap.add_argument("--proposals", type=int, default=20, help="FEEDs, one at a time (default 20)")
+    ap.add_argument("--gap", type=float, default=0.05, help="Seconds between proposals (default 0.05)")
+    ap.add_argument("--head-args", default="", help='Extra hydra.py flags, e.g. --head-args="--async --gossip 2"')
+    ap.add_argument("--base-port", type=int, default=BASE_PORT, help=f"First head's port (default {BASE_PORT})")
+    ap.add_argument("--direct", action="store_true",
+                    help="Heads peer directly, no proxy (the network options are ignored)")
+    ap.add_argument("--latency", default="uniform:1,10", help="Link latency spec, ms (see womb.py)")
+    ap.add_argument("--slow", default=None, metavar="SHARE:SPEC",
+                    help="This share of links draws from SPEC instead")
+    ap.add_argument("--drop", type=float, default=0.0, help="Loss probability per datagram")
+    ap.add_argument("--dup", type=float, default=0.0, help="Duplication probability")
+    ap.add_argument("--reorder", type=float, default=0.0,
+                    help="Share of datagrams held back an extra uniform(0, --reorder-ms)")
+    ap.add_argument("--reorder-ms", type=float, default=50.0)
+    ap.add_argument("--partition", default=None, metavar="START:END:SHARE",
+                    help="Cut SHARE of the heads off between START and END ms after the first FEED")
+    ap.add_argument("--seed", type=int, default=7)
+    args = ap.parse_args(argv)
+
+    if args.heads < 2:
+        ap.error("a swarm needs at least 2 heads")
+    try:
+        latency(args.latency)
+        if args.slow:
+            latency(args.slow.partition(":")[2])
+        cut = tuple(float(x) for x in args.partition.split(":")) if args.partition else None
+        if cut is not None and len(cut) != 3:
+            raise ValueError("partition wants START:END:SHARE")
+    except ValueError as e:
+        ap.error(str(e))
+    weather = Weather(latency=args.latency, slow=args.slow, drop=args.drop, dup=args.dup,
+                      reorder=args.reorder, reorder_ms=args.reorder_ms,
+                      partition=cut)  # type: ignore[arg-type]
+    try:
+        report = bench(args.heads, args.proposals, weather, shlex.split(args.head_args),
+                       gap=args.gap, base_port=args.base_port, seed=args.seed,
+                       direct=args.direct)
+    except RuntimeError as e:
+        print(f"cradle.py: {e}", file=sys.stderr)
+        return 1
+    print(json.dumps(report, sort_keys=True))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,152 @@
+# ============================================
+# Dendrites (Peers) — Truth Through Erasure
+# No time. No replay. No logs.
+# ============================================
+"""
+The peer table. --peers are seeds; any head heard from is learned, and
+hearing from a peer is what makes it live. A live peer gets every send. A
+peer gone quiet for LIVE_TTL is suspect: it gets a probe, then nothing
+until its backoff runs out (doubling from BACKOFF_MIN to BACKOFF_MAX). A
+dead head therefore costs one datagram per backoff instead of one per
+tail. A learned peer silent for FORGET_TTL is forgotten; seeds never are.
+
+A PEERS list is hearsay. At most LEARN_MAX strangers are taken from one
+list and at most STRANGERS_MAX named-but-never-heard peers are held at
+once, so a forged roster can't fill the table or set off a greeting storm.
+
+Every PULSE_EVERY seconds a head sends each reachable peer a PEERS list:
+the peers it believes live, less the recipient. That is the heartbeat
+(receipt is liveness) and the join path. A new head needs one seed; the
+seed answers at once and names it to everyone on its next pulse.
+"""
+from __future__ import annotations
+import socket, time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+Addr = Tuple[str, int]
+
+LIVE_TTL = 15.0             # seconds since last heard
+BACKOFF_MIN = 1.0
+BACKOFF_MAX = 30.0
+FORGET_TTL = 120.0
+PULSE_EVERY = 5.0
+PEERS_MAX = 1024
+LEARN_MAX = 64              # strangers taken from one PEERS list
+STRANGERS_MAX = 256         # learned, not yet heard
+TICK = 0.25                 # how long one live list is reused
+
+def _resolve(addr: Addr) -> Addr:
+    # Sources arrive as dotted quads; seeds given as names must match them
+    try:
+        return socket.gethostbyname(addr[0]), int(addr[1])
+    except OSError:
+        return addr[0], int(addr[1])
+
+class _Peer:
+    __slots__ = ("seed", "heard", "since", "probe", "backoff")
+
+    def __init__(self, seed: bool, now: float) -> None:
+        self.seed = seed
+        self.heard: Optional[float] = None
+        self.since = now                         # known since (forgetting clock)
+        self.probe = 0.0                         # due at once
+        self.backoff = BACKOFF_MIN
+
+class Dendrites:
+    def __init__(self, seeds: Iterable[Addr] = (), port: int = 0,
+                 vitals: Any = None) -> None:
+        now = time.monotonic()
+        self.port = int(port)
+        self.vitals = vitals
+        self.table: Dict[Addr, _Peer] = {}
+        for seed in seeds:
+            self.table[_resolve(seed)] = _Peer(True, now)
+        self.strangers = 0                       # learned from a list, never heard
+        self._reach: List[Addr] = []
+        self._until = 0.0
+
+    def __len__(self) -> int:
+        return len(self.table)
+
+    def __contains__(self, addr: object) -> bool:
+        return addr in self.table
+
+    def _me(self, addr: Addr) -> bool:
+        return addr[1] == self.port and (addr[0].startswith("127.") or addr[0] == "0.0.0.0")
+
+    def touch(self, addr: Addr) -> bool:
+        """Heard from addr. True if it was a stranger (now learned)."""
+        now = time.monotonic()
+        peer = self.table.get(addr)
+        fresh = peer is None
+        if fresh:
+            if len(self.table) >= PEERS_MAX:
+                return False
+            peer = self.table[addr] = _Peer(False, now)
+            if self.vitals is not None:
+                self.vitals.peers_learned += 1
+        elif peer.heard is None and not peer.seed:
+            self.strangers -= 1                  # named, and now heard
+        if peer.heard is None or now - peer.heard > LIVE_TTL:
+            self._until = 0.0                    # back from the dead → reach it now
+        peer.heard = now
+        peer.backoff = BACKOFF_MIN
+        return fresh
+
+    def learn(self, addrs: Iterable[Any]) -> List[Addr]:
+        # Named in a peer's PEERS list: reachable, not yet heard → the new ones
+        now = time.monotonic()
+        new: List[Addr] = []
+        for entry in addrs:
+            try:
+                addr = (str(entry[0]), int(entry[1]))
+            except (TypeError, ValueError, IndexError):
+                continue
+            if addr in self.table or self._me(addr):
+                continue
+            if (len(new) >= LEARN_MAX or self.strangers >= STRANGERS_MAX
+                    or len(self.table) >= PEERS_MAX):
+                break
+            self.table[addr] = _Peer(False, now)
+            self.strangers += 1
+            new.append(addr)
+            self._until = 0.0
+            if self.vitals is not None:
+                self.vitals.peers_learned += 1
+        return new
+
+    def reach(self) -> List[Addr]:
+        """Who gets a send now: live peers, plus suspects whose probe is due.
+        The live list is reused for TICK; a probe goes out exactly once."""
+        now = time.monotonic()
+        if now < self._until:
+            return self._reach
+        live: List[Addr] = []
+        probes: List[Addr] = []
+        for addr, peer in list(self.table.items()):
+            last = peer.heard if peer.heard is not None else peer.since
+            if peer.heard is not None and now - peer.heard <= LIVE_TTL:
+                live.append(addr)
+                continue
+            if not peer.seed and now - last > FORGET_TTL:
+                del self.table[addr]
+                if peer.heard is None:
+                    self.strangers -= 1
+                if self.vitals is not None:
+                    self.vitals.peers_forgotten += 1
+                continue
+            if now >= peer.probe:
+                probes.append(addr)
+                peer.probe = now + peer.backoff
+                peer.backoff = min(peer.backoff * 2.0, BACKOFF_MAX)
+        self._reach, self._until = live, now + TICK
+        return live + probes if probes else live
+
+    def live(self) -> List[Addr]:
+        now = time.monotonic()
+        return [a for a, p in list(self.table.items())
+                if p.heard is not None and now - p.heard <= LIVE_TTL]
+
+    def roster(self, to: Addr) -> Dict[str, Any]:
+        # The PEERS message for one recipient: everyone live but them
+        return {"type": "PEERS", "peers": [[h, p] for h, p in self.live() if (h, p) != to]}
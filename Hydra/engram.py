@@ -0,0 +1,255 @@
+# ============================================
+# Engram (Trace) — Truth Through Erasure
+# No time. No replay. No logs.
+# ============================================
+"""
+Opt-in propagation tracing. The heart keeps no time and no logs; this is
+instrumentation that sits beside it, for heads run with --trace DIR.
+
+A FEED born on a traced head is stamped: origin, the origin's monotonic
+clock in nanoseconds (together, the trace id) and hop 0. Every traced head
+that forwards the tail writes the trace into a myelin trailer with one more
+hop and its own id as `via`. The trailer sits after the tallies: the heart
+never sees it, decode() never reads it and the membrane never fingerprints
+it, so a traced tail compares and dedupes as the same tail. JSON peers and
+--workers heads pass tails on untraced.
+
+Each head appends the first copy of every traced tail it senses to
+DIR/<id>.trace, one JSON line a tail, flushed once a second:
+
+    {"trace": "A@81234567890", "origin": "A", "head": "C", "via": "B",
+     "hops": 2, "ms": 1.84, "crown": 2}
+
+`ms` is time since the origin's stamp. The monotonic clock is only shared
+between processes on one machine, so across machines read hops and trees,
+not milliseconds.
+
+    python engram.py DIR [--show 5] [--json]
+
+builds each proposal's propagation tree (first arrival per head, parent =
+via) and histograms of origin-to-head latency, per-hop latency and depth.
+"""
+from __future__ import annotations
+import argparse, json, os, sys, threading, time
+from collections import Counter
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+import myelin
+
+TRACED_MAX = 1024      # tails we still know the trace of, for forwarding
+FLUSH_EVERY = 1.0
+EDGES_MS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000)
+
+Key = Tuple[Any, int, Any]          # (id, crown, digest): the same tail, however sent
+Mark = Tuple[str, int, int]         # (origin, stamp, hops)
+Peer = Tuple[str, int]
+
+def _key(tail: Mapping[str, Any]) -> Key:
+    return tail.get("id"), int(tail.get("crown") or 0), tail.get("digest")
+
+class Engram:
+    """One head's traces: what it heard, and a sink for the record."""
+
+    def __init__(self, head_id: str, directory: str, every: float = FLUSH_EVERY) -> None:
+        os.makedirs(directory, exist_ok=True)
+        self.head_id = str(head_id)
+        self.path = os.path.join(directory, f"{self.head_id}.trace")
+        self.marks: Dict[Key, Mark] = {}
+        self.lines: List[str] = []
+        self.lock = threading.Lock()
+        self.every = float(every)
+        self.closed = threading.Event()
+        threading.Thread(target=self._loop, daemon=True, name="engram").start()
+
+    def _note(self, key: Key, mark: Mark) -> None:
+        self.marks.pop(key, None)
+        self.marks[key] = mark
+        if len(self.marks) > TRACED_MAX:
+            self.marks.pop(next(iter(self.marks)))
+
+    def _record(self, mark: Mark, via: Optional[str], tail: Mapping[str, Any]) -> None:
+        origin, stamp, hops = mark
+        line = json.dumps({
+            "trace": f"{origin}@{stamp}", "origin": origin, "head": self.head_id,
+            "via": via, "hops": hops, "ms": round((time.monotonic_ns() - stamp) / 1e6, 3),
+            "crown": int(tail.get("crown") or 0),
+        }, separators=(",", ":"))
+        with self.lock:
+            self.lines.append(line)
+
+    def feed(self, tail: Mapping[str, Any]) -> None:
+        # A FEED born here: hop 0
+        mark = (self.head_id, time.monotonic_ns(), 0)
+        self._note(_key(tail), mark)
+        self._record(mark, None, tail)
+
+    def hear(self, msg: Mapping[str, Any], data: bytes) -> None:
+        # First copy past the membrane; untraced tails pass unremarked
+        found = myelin.trace(data)
+        if found is None:
+            return
+        origin, stamp, hops, via = found
+        mark = (origin, stamp, hops)
+        self._note(_key(msg), mark)
+        self._record(mark, via, msg)
+
+    def mark(self, tail: Mapping[str, Any],
+             pairs: Iterable[Tuple[Peer, bytes]]) -> Iterator[Tuple[Peer, bytes]]:
+        # Outgoing (peer, payload): myelin copies of a traced tail go one hop on
+        found = self.marks.get(_key(tail))
+        if found is None:
+            yield from pairs
+            return
+        origin, stamp, hops = found
+        cache: Dict[bytes, bytes] = {}
+        for peer, payload in pairs:
+            if myelin.is_myelin(payload):
+                out = cache.get(payload)
+                if out is None:
+                    try:
+                        out = cache[payload] = myelin.traced(payload, origin, stamp, hops + 1, self.head_id)
+                    except myelin.WireError:
+                        out = cache[payload] = payload
+                payload = out
+            yield peer, payload
+
+    def flush(self) -> None:
+        with self.lock:
+            lines, self.lines = self.lines, []
+        if lines:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write("\n".join(lines) + "\n")
+
+    def _loop(self) -> None:
+        while not self.closed.wait(self.every):
+            try:
+                self.flush()
+            except OSError:
+                pass
+
+    def close(self) -> None:
+        self.closed.set()
+        self.flush()
+
+# ============================================
+# Analysis
+# ============================================
+def load(paths: Sequence[str]) -> List[Dict[str, Any]]:
+    """Every record in the given .trace files (directories: every .trace inside)."""
+    files: List[str] = []
+    for p in paths:
+        if os.path.isdir(p):
+            files += sorted(os.path.join(p, f) for f in os.listdir(p) if f.endswith(".trace"))
+        else:
+            files.append(p)
+    out: List[Dict[str, Any]] = []
+    for path in files:
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    out.append(json.loads(line))
+                except ValueError:
+                    continue                     # a line cut short by a severed head
+    return out
+
+def trees(records: Iterable[Mapping[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Per trace id: first arrival per head, parent (via), depth and spread."""
+    firsts: Dict[str, Dict[str, Mapping[str, Any]]] = {}
+    for r in records:
+        seen = firsts.setdefault(r["trace"], {})
+        old = seen.get(r["head"])
+        if old is None or r["ms"] < old["ms"]:
+            seen[r["head"]] = r
+    out: Dict[str, Dict[str, Any]] = {}
+    for tid, seen in firsts.items():
+        children: Dict[Optional[str], List[str]] = {}
+        for head, r in seen.items():
+            parent = r["via"] if r["via"] in seen and r["via"] != head else None
+            children.setdefault(parent, []).append(head)
+        for kids in children.values():
+            kids.sort(key=lambda h: seen[h]["ms"])
+        hops = [seen[h]["ms"] - seen[seen[h]["via"]]["ms"]
+                for h in seen if seen[h]["via"] in seen and seen[h]["via"] != h]
+        origin = next(iter(seen.values()))["origin"]
+        out[tid] = {
+            "origin": origin,
+            "heads": len(seen),
+            "depth": max(r["hops"] for r in seen.values()),
+            "spread_ms": max(r["ms"] for r in seen.values()),
+            "arrivals_ms": sorted(r["ms"] for h, r in seen.items() if h != origin),
+            "hop_ms": hops,
+            "children": children,
+            "first": seen,
+        }
+    return out
+
+def histogram(values: Sequence[float], edges: Sequence[float] = EDGES_MS) -> List[Tuple[str, int]]:
+    counts = [0] * (len(edges) + 1)
+    for v in values:
+        i = 0
+        while i < len(edges) and v >= edges[i]:
+            i += 1
+        counts[i] += 1
+    labels = [f"< {edges[0]:g}"] + [f"{a:g}-{b:g}" for a, b in zip(edges, edges[1:])] + [f">= {edges[-1]:g}"]
+    return list(zip(labels, counts))
+
+def _render(tree: Mapping[str, Any]) -> List[str]:
+    first, children = tree["first"], tree["children"]
+    lines: List[str] = []
+
+    def walk(head: str, depth: int) -> None:
+        r = first[head]
+        lines.append(f"{'  ' * depth}{head}  +{r['ms']:.2f} ms  hop {r['hops']}")
+        for kid in children.get(head, ()):
+            walk(kid, depth + 1)
+
+    for root in children.get(None, ()):
+        walk(root, 1)
+    return lines
+
+def _bars(title: str, hist: List[Tuple[str, int]]) -> List[str]:
+    peak = max((n for _, n in hist), default=0) or 1
+    lines = [title]
+    for label, n in hist:
+        if n:
+            lines.append(f"  {label:>10}  {n:6d}  {'#' * max(1, round(40 * n / peak))}")
+    return lines
+
+def report(records: Iterable[Mapping[str, Any]]) -> Dict[str, Any]:
+    ts = trees(records)
+    arrivals = [ms for t in ts.values() for ms in t["arrivals_ms"]]
+    hops = [ms for t in ts.values() for ms in t["hop_ms"]]
+    return {
+        "proposals": len(ts),
+        "trees": ts,
+        "arrival_ms": histogram(arrivals),
+        "hop_ms": histogram(hops),
+        "depth": [(str(d), n) for d, n in sorted(Counter(t["depth"] for t in ts.values()).items())],
+    }
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    ap = argparse.ArgumentParser(prog="engram.py", description=__doc__.split("\n\n")[1].strip())
+    ap.add_argument("paths", nargs="+", help="--trace directories, or .trace files")
+    ap.add_argument("--show", type=int, default=5, metavar="N", help="Print the N widest-spread trees (default 5)")
+    ap.add_argument("--json", action="store_true", help="One JSON report instead of text")
+    args = ap.parse_args(argv)
+    out = report(load(args.paths))
+    if args.json:
+        for t in out["trees"].values():
+            t.pop("first")
+            t["children"] = {str(k): v for k, v in t["children"].items()}
+        print(json.dumps(out, sort_keys=True))
+        return 0
+    ts = sorted(out["trees"].items(), key=lambda kv: -kv[1]["spread_ms"])
+    print(f"{out['proposals']} traced proposals")
+    for tid, t in ts[:max(0, args.show)]:
+        print(f"\n{tid}: {t['heads']} heads, {t['depth']} hops deep, last at +{t['spread_ms']:.2f} ms")
+        print("\n".join(_render(t)))
+    for title, key in (("origin → head (ms)", "arrival_ms"), ("per hop (ms)", "hop_ms"),
+                       ("depth (hops)", "depth")):
+        print()
+        print("\n".join(_bars(title, out[key])))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
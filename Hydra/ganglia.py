@@ -0,0 +1,220 @@
+# ============================================
+# Ganglia (Workers) — Truth Through Erasure
+# No time. No replay. No logs.
+# ============================================
+"""
+Sensing across cores. N worker processes bind the head's UDP port with
+SO_REUSEPORT; the kernel spreads datagrams across them by source. Each
+worker does what needs no heart: decode, crown-window prefilter, and a
+first storm membrane that only knows the repeats its own sources sent.
+Survivors go through a shared-memory ring (one per worker) to the single
+process that owns the plexus, where drain() runs every tail past the
+heart's membrane: one tail that reached two workers is still one tail.
+The overwrite law stays single-writer; only the parsing fans out. CHUNKs
+pass through raw: the heart stitches them.
+
+Workers see the heart's crown and envy through a two-byte shared array,
+and publish their vitals through one shared counter array each.
+The heart sends from the first worker's socket (same port, never read
+there), so peers still see the head at its own address.
+
+Linux only (fork, SO_REUSEPORT). Ring counters assume a total-store-order
+CPU such as x86-64.
+"""
+from __future__ import annotations
+import marshal, multiprocessing as mp, os, signal, socket, struct
+from multiprocessing import shared_memory
+from typing import Any, Iterator, List, Optional, Tuple
+
+from shell import Membrane, SEEN_H, SEEN_MAX, _felt, _sense, _tail_key, _tongue
+from vitals import COUNTERS, Vitals
+
+RING_BYTES = 1 << 22   # per worker
+BURST = 64             # datagrams per wakeup
+_U64 = struct.Struct("Q")
+_U32 = struct.Struct("I")
+_WRAP = 0xFFFFFFFF
+
+# ============================================
+# Ring (shared memory, one producer, one consumer)
+# ============================================
+class Ring:
+    """[write u64][read u64][data…]. Records are u32 length + bytes; a
+    record that would straddle the end wraps to the start. Full → drop."""
+
+    def __init__(self, name: Optional[str] = None, size: int = RING_BYTES) -> None:
+        if name is None:
+            self.shm = shared_memory.SharedMemory(create=True, size=16 + int(size))
+            self.buf = self.shm.buf
+            _U64.pack_into(self.buf, 0, 0)
+            _U64.pack_into(self.buf, 8, 0)
+        else:
+            self.shm = shared_memory.SharedMemory(name=name)
+            self.buf = self.shm.buf
+        self.cap = len(self.buf) - 16
+
+    @property
+    def name(self) -> str:
+        return self.shm.name
+
+    def put(self, payload: bytes) -> bool:
+        buf, cap = self.buf, self.cap
+        n = 4 + len(payload)
+        w = _U64.unpack_from(buf, 0)[0]
+        r = _U64.unpack_from(buf, 8)[0]
+        pos = w % cap
+        skip = cap - pos if cap - pos < n else 0
+        if w + skip + n - r > cap:
+            return False
+        if skip:
+            if skip >= 4:
+                _U32.pack_into(buf, 16 + pos, _WRAP)
+            w += skip
+            pos = 0
+        _U32.pack_into(buf, 16 + pos, len(payload))
+        buf[16 + pos + 4:16 + pos + n] = payload
+        _U64.pack_into(buf, 0, w + n)            # publish after the bytes
+        return True
+
+    def drain(self) -> Iterator[bytes]:
+        buf, cap = self.buf, self.cap
+        w = _U64.unpack_from(buf, 0)[0]
+        r = _U64.unpack_from(buf, 8)[0]
+        while r < w:
+            pos = r % cap
+            if cap - pos < 4:
+                r += cap - pos
+                continue
+            n = _U32.unpack_from(buf, 16 + pos)[0]
+            if n == _WRAP:
+                r += cap - pos
+                continue
+            yield bytes(buf[16 + pos + 4:16 + pos + 4 + n])
+            r += 4 + n
+        _U64.pack_into(buf, 8, r)
+
+    def close(self, unlink: bool = False) -> None:
+        self.buf.release()
+        self.shm.close()
+        if unlink:
+            self.shm.unlink()
+
+# ============================================
+# Worker (one per core)
+# ============================================
+def _worker(sock: socket.socket, ring: Ring, gate: Any, bell: int,
+            echoes: bool, pulse: Any) -> None:
+    signal.signal(signal.SIGINT, signal.SIG_IGN)   # Ctrl+C is the heart's to handle
+    membrane = Membrane(SEEN_MAX)
+    vitals = Vitals()
+    while True:
+        try:
+            burst = [sock.recvfrom(65535)]
+            while len(burst) < BURST:
+                try:
+                    burst.append(sock.recvfrom(65535, socket.MSG_DONTWAIT))
+                except BlockingIOError:
+                    break
+        except OSError as e:
+            vitals.fault(e)
+            continue
+        crown, envy = int(gate[0]), bool(gate[1])
+        fresh = True
+        for data, addr in burst:
+            try:
+                sensed = _sense(data, crown, envy, fresh=fresh, membrane=membrane)
+            except Exception as e:
+                vitals.fault(e)
+                continue
+            _felt(vitals, data, sensed)
+            if sensed is None:
+                continue
+            kind, key, msg = sensed
+            if kind == "ECHO" and not echoes:
+                continue
+            if kind == "CHUNK":
+                msg = data                       # stitched by the heart, raw
+            if kind == "TAIL":
+                fresh = False                    # the window may move from here on
+            if not ring.put(marshal.dumps((kind, key, msg, addr, _tongue(data)))):
+                vitals.drops += 1
+        vitals.store(pulse)
+        try:
+            os.write(bell, b"\0")
+        except BlockingIOError:
+            pass                                 # bell already ringing
+
+class Ganglia:
+    def __init__(self, port: int, workers: int, echoes: bool = False,
+                 membrane: Optional[Membrane] = None) -> None:
+        if not hasattr(socket, "SO_REUSEPORT"):
+            raise OSError("SO_REUSEPORT is not available on this platform")
+        ctx = mp.get_context("fork")
+        self.socks: List[socket.socket] = []
+        for _ in range(max(1, int(workers))):
+            s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+            s.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 1 << 20)
+            s.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 1 << 20)
+            s.bind(("0.0.0.0", int(port)))
+            self.socks.append(s)
+        self.gate = ctx.RawArray("b", 2)         # [crown, envy]
+        self.echoes = bool(echoes)
+        self.membrane = SEEN_H if membrane is None else membrane
+        self.pulses = [ctx.RawArray("Q", len(COUNTERS)) for _ in self.socks]
+        self.bell, bell_w = os.pipe()
+        os.set_blocking(self.bell, False)
+        os.set_blocking(bell_w, False)
+        self.rings = [Ring() for _ in self.socks]
+        self.procs = [ctx.Process(target=_worker, daemon=True,
+                                  args=(s, r, self.gate, bell_w, bool(echoes), p))
+                      for s, r, p in zip(self.socks, self.rings, self.pulses)]
+        for p in self.procs:
+            p.start()
+        os.close(bell_w)
+
+        # Mouth: send from the port, never read here. (Shared with worker 0,
+        # so no setblocking: O_NONBLOCK would reach its recvfrom too.)
+        self.mouth = self.socks[0]
+
+    def publish(self, crown: int, envy: bool) -> None:
+        self.gate[0], self.gate[1] = int(crown), int(bool(envy))
+
+    def drain(self, vitals: Optional[Vitals] = None
+              ) -> Iterator[Tuple[str, Optional[bytes], Any, Tuple[str, int], str]]:
+        try:
+            while os.read(self.bell, 4096):
+                pass
+        except BlockingIOError:
+            pass
+        envy, membrane = bool(self.gate[1]), self.membrane
+        for ring in self.rings:
+            for record in ring.drain():
+                kind, key, msg, addr, tongue = marshal.loads(record)
+                if kind == "TAIL":
+                    # A worker's membrane only knows its own sources; this one
+                    # catches what two workers each let through
+                    if key in membrane and not (envy and msg.get("is_dream")):
+                        if vitals is not None:
+                            vitals.membrane_hits += 1
+                        if not self.echoes:
+                            continue
+                        kind, key = "ECHO", _tail_key(msg)
+                    else:
+                        membrane.add(key, bool(msg.get("is_dream")), _tail_key(msg))
+                yield kind, key, msg, tuple(addr), tongue
+
+    def sendto(self, payload: bytes, addr: Tuple[str, int]) -> None:
+        # OSError (full buffer, dead route) is the caller's to count
+        self.mouth.sendto(payload, socket.MSG_DONTWAIT, addr)
+
+    def close(self) -> None:
+        for p in self.procs:
+            p.terminate()
+        for p in self.procs:
+            p.join(timeout=1)
+        for ring in self.rings:
+            ring.close(unlink=True)
+        for s in self.socks:
+            s.close()
+        os.close(self.bell)
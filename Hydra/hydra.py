@@ -6,22 +6,24 @@ from __future__ import annotations
 import argparse, random
 from typing import List, Tuple
 from plexus import plexus, gem_name 
-from shell import run_body, parse_peer
+from shell import EYES_FPS, HUNGER_BURST, HUNGER_RATE, MYELIN, WIRES, Nurse, run_body, parse_peer
+from spine import run_spine
+from synapse import SAMPLING, Gossip
 
 HEADS_DEFAULT = ["A", "B", "C", "D", "E"]
 
 
-def _run_loopback(heads: List[str], steps: int, seed: int) -> None:
+def _run_loopback(heads: List[str], steps: int, seed: int, persistent: bool = False) -> None:
     """Minimal in-process loopback harness (no sockets, no threads)."""
     rng = random.Random(seed)
     heads = [h.upper() for h in heads]
 
-    nodes = {h: plexus(head_id=h) for h in heads}
+    nodes = {h: plexus(head_id=h, persistent=persistent) for h in heads}
 
     # Align everyone to the same starting truth (demo-faithful bootstrap)
     base = next(iter(nodes.values())).snapshot()
     for n in nodes.values():
-        n.state.tallies = dict(base["tallies"])
+        n.state.tallies = base["tallies"]
         n.state.crown = int(base["crown"] or 1)
 
     for _ in range(max(0, int(steps))):
@@ -31,9 +33,9 @@ def _run_loopback(heads: List[str], steps: int, seed: int) -> None:
 
         tail = nodes[frm].propose(to, amt)
 
-        # Deliver to all nodes (unordered delivery)
+        # Deliver to all nodes: in order, no loss, no latency (womb.py has a network)
         for n in nodes.values():
-            n.ingest(dict(tail))
+            n.ingest(tail)
 
     print("\nLoopback results (no UDP):\n")
     for h in heads:
@@ -46,7 +48,24 @@ def main() -> None:
     ap = argparse.ArgumentParser(prog="Hydra.py")
     ap.add_argument("--id", help="Head ID, e.g. A (required for UDP run)")
     ap.add_argument("--port", type=int, help="UDP port to bind (required for UDP run)")
-    ap.add_argument("--peers", nargs="*", default=[], help="Peers as host:port")
+    ap.add_argument("--peers", nargs="*", default=[], help="Seed peers as host:port (the rest are learned)")
+    ap.add_argument("--delta", action="store_true", help="FEED sends delta tails (changed tallies only)")
+    ap.add_argument("--persistent", action="store_true", help="Hold tallies in a persistent map (shared structure)")
+    ap.add_argument("--wire", choices=WIRES, default=MYELIN, help="Wire format to offer (default myelin: JSON to a peer until it speaks or offers myelin; JSON is always understood)")
+    ap.add_argument("--gossip", type=int, default=0, metavar="K", help="Gossip PROPAGATE to K sampled peers instead of flooding all")
+    ap.add_argument("--suppress", type=int, default=3, metavar="M", help="Gossip: go quiet after hearing a tail M times (default 3; 0 = never)")
+    ap.add_argument("--sampling", choices=SAMPLING, default="random", help="Gossip peer sampling: random, or deterministic per crown")
+    ap.add_argument("--async", dest="use_async", action="store_true", help="Run the body on one asyncio event loop (no threads)")
+    ap.add_argument("--headless", action="store_true", help="No HUD, no keyboard, no termios: just the nerves and the heart")
+    ap.add_argument("--fps", type=float, default=EYES_FPS, help=f"Max HUD redraws per second (default {EYES_FPS:g})")
+    ap.add_argument("--workers", type=int, default=0, metavar="N", help="Sense datagrams in N SO_REUSEPORT worker processes (implies --async)")
+    ap.add_argument("--hunger-rate", type=float, default=HUNGER_RATE, metavar="R", help=f"Dreams a second per hungry peer (default {HUNGER_RATE:g}; 0 = unlimited)")
+    ap.add_argument("--hunger-burst", type=int, default=HUNGER_BURST, metavar="B", help=f"HUNGERs a peer may send back to back (default {HUNGER_BURST})")
+    ap.add_argument("--bulk", action="store_true", help="Serve and pull big dreams over TCP on the same port number instead of UDP chunks")
+    ap.add_argument("--shm", action="store_true", help="Reach co-resident --shm heads through a shared-memory ring instead of UDP")
+    ap.add_argument("--vitals", metavar="SOCK", help="Serve counters and gauges as JSON on this Unix socket (read with vitals.py)")
+    ap.add_argument("--vitals-dump", metavar="FILE", help="Rewrite counters and gauges as JSON to FILE once a second")
+    ap.add_argument("--trace", metavar="DIR", help="Trace FEEDs across the swarm into DIR/<id>.trace (read with engram.py)")
 
     ap.add_argument("--loopback", action="store_true", help="Run in-process loopback test (no UDP)")
     ap.add_argument("--heads", nargs="*", default=HEADS_DEFAULT, help="Heads for loopback (default A B C D E)")
@@ -56,7 +75,8 @@ def main() -> None:
     args = ap.parse_args()
 
     if args.loopback:
-        _run_loopback(heads=list(args.heads or HEADS_DEFAULT), steps=int(args.steps), seed=int(args.seed))
+        _run_loopback(heads=list(args.heads or HEADS_DEFAULT), steps=int(args.steps), seed=int(args.seed),
+                      persistent=bool(args.persistent))
         return
 
     # UDP run path
@@ -67,8 +87,21 @@ def main() -> None:
     port = int(args.port)
     peers: List[Tuple[str, int]] = [parse_peer(p) for p in (args.peers or [])]
 
-    heart = plexus(head_id=head_id)
-    run_body(heart=heart, head_id=head_id, port=port, peers=peers)
+    heart = plexus(head_id=head_id, persistent=bool(args.persistent))
+    gossip = None
+    if args.gossip:
+        gossip = Gossip(fanout=args.gossip, suppress=args.suppress, sampling=args.sampling, head_id=head_id)
+    options = dict(heart=heart, head_id=head_id, port=port, peers=peers, delta=bool(args.delta),
+                   wire=args.wire, gossip=gossip, headless=bool(args.headless), fps=float(args.fps),
+                   vitals=args.vitals, vitals_dump=args.vitals_dump,
+                   nurse=Nurse(rate=args.hunger_rate, burst=args.hunger_burst), bulk=bool(args.bulk),
+                   shm=bool(args.shm), trace=args.trace)
+    if args.workers > 0:
+        run_spine(workers=args.workers, **options)
+    elif args.use_async:
+        run_spine(**options)
+    else:
+        run_body(**options)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,373 @@
+# ============================================
+# Myelin (Wire) — Truth Through Erasure
+# No time. No replay. No logs.
+# ============================================
+"""
+Binary codec for tails, dreams and HUNGER. struct + varints, versioned.
+
+    magic  version  type  crown*  flags  [id]  [mode]  [digest]  [base]  [tallies|delta]  [trace]
+
+    *  unsigned varint; id and mode are varint-length UTF-8
+    digest, base       8 bytes, big-endian
+    tallies / delta    count*, width code, names-length*, NUL-joined names,
+                       count values packed at one struct width
+    trace              'T'  origin  stamp*  hops*  via   (engram.py; opt-in)
+
+The trace trailer rides behind the tallies: decode() never reads it and the
+membrane never fingerprints it, so a traced tail is the same tail.
+
+A message too big for one datagram travels as CHUNKs (suture.py):
+
+    magic  version  CHUNK  digest  total*  index*  count*  fragment…
+
+    digest             8 bytes: blake2b of the whole payload
+    count 0            a manifest: fetch the payload over TCP instead
+
+The peer table's heartbeat (dendrite.py) is a PEERS list:
+
+    magic  version  PEERS  count*  (host  port*)…
+
+Everything before the tally section is the header: peek() reads it without
+touching the tallies, so a tail outside the crown window is turned away
+before its book is parsed. The magic byte can never start UTF-8 text, so a
+datagram is myelin or JSON at a glance; JSON stays as the fallback. The
+readers take any bytes-like buffer: a record can be read where it lies in a
+shared-memory ring (commissure.py) and nothing of it copied but the result.
+"""
+from __future__ import annotations
+import struct
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+MAGIC = 0xA7                    # a UTF-8 continuation byte: never '{'
+VERSION = 1
+
+TAIL, HUNGER, CHUNK, PEERS = 1, 2, 3, 4
+TRACE = 0x54                    # 'T': the optional trailer after a tail's tallies
+
+# Flags
+DREAM     = 0x01
+DIGEST    = 0x02
+BASE      = 0x04
+TALLIES   = 0x08
+DELTA     = 0x10
+NEED_TAIL = 0x20
+ID        = 0x40
+MODE      = 0x80
+
+_U64 = struct.Struct("!Q")
+_WIDTHS = (("b", 1 << 7), ("h", 1 << 15), ("i", 1 << 31), ("q", 1 << 63))
+
+class WireError(ValueError):
+    pass
+
+def is_myelin(data: bytes) -> bool:
+    return len(data) > 1 and data[0] == MAGIC
+
+# =========================
+# Varints
+# =========================
+def _put_uvarint(out: bytearray, n: int) -> None:
+    if n < 0:
+        raise WireError("negative varint")
+    while n > 0x7F:
+        out.append((n & 0x7F) | 0x80)
+        n >>= 7
+    out.append(n)
+
+def _uvarint(data: bytes, i: int) -> Tuple[int, int]:
+    b = data[i]
+    if b < 0x80:
+        return b, i + 1
+    n, shift = b & 0x7F, 7
+    while True:
+        i += 1
+        b = data[i]
+        n |= (b & 0x7F) << shift
+        if b < 0x80:
+            return n, i + 1
+        shift += 7
+
+def _put_str(out: bytearray, s: str) -> None:
+    raw = str(s).encode("utf-8")
+    _put_uvarint(out, len(raw))
+    out += raw
+
+def _str(data: bytes, i: int) -> Tuple[str, int]:
+    n, i = _uvarint(data, i)
+    if i + n > len(data):
+        raise WireError("truncated")            # a slice would just come up short
+    return str(data[i:i + n], "utf-8"), i + n
+
+# =========================
+# Tally section
+# =========================
+def _put_tallies(out: bytearray, tallies: Mapping[str, int]) -> None:
+    plain = tallies.to_dict() if hasattr(tallies, "to_dict") else tallies
+    names = list(plain)
+    values = list(plain.values())
+    blob = "\x00".join(names).encode("utf-8")
+    if names and blob.count(b"\x00") != len(names) - 1:
+        raise WireError("account name contains NUL")
+    lo, hi = (min(values), max(values)) if values else (0, 0)
+    for code, bound in _WIDTHS:
+        if -bound <= lo and hi < bound:
+            break
+    else:
+        raise WireError("tally value wider than 64 bits")
+    n = len(names)
+    if n < 0x80 and len(blob) < 0x80:
+        out += bytes((n, ord(code), len(blob)))
+    else:
+        _put_uvarint(out, n)
+        out.append(ord(code))
+        _put_uvarint(out, len(blob))
+    out += blob
+    out += struct.pack(f"!{n}{code}", *values)
+
+def _tallies(data: bytes, i: int) -> Dict[str, int]:
+    n, i = _uvarint(data, i)
+    code = chr(data[i])
+    if code not in "bhiq":
+        raise WireError("bad width")
+    size, i = _uvarint(data, i + 1)
+    if not n:
+        return {}
+    if i + size > len(data):
+        raise WireError("truncated")
+    names = str(data[i:i + size], "utf-8").split("\x00")
+    if len(names) != n:
+        raise WireError("name count mismatch")
+    values = struct.unpack_from(f"!{n}{code}", data, i + size)
+    return dict(zip(names, values))
+
+# =========================
+# Encode
+# =========================
+def _put_header(out: bytearray, msg: Mapping[str, Any]) -> int:
+    get = msg.get
+    kind = HUNGER if get("type") == "HUNGER" else TAIL
+    out.append(kind)
+    _put_uvarint(out, int(get("crown") or 0))
+
+    ident, mode = get("id"), get("mode")
+    digest, base = get("digest"), get("base")
+    flags = ((DREAM if get("is_dream") else 0)
+             | (NEED_TAIL if get("need_tail") else 0)
+             | (ID if ident is not None else 0)
+             | (MODE if mode is not None else 0))
+    if kind == TAIL:
+        flags |= ((DIGEST if digest is not None else 0)
+                  | (BASE if base is not None else 0)
+                  | (DELTA if get("delta") is not None
+                     else TALLIES if get("tallies") is not None else 0))
+    out.append(flags)
+
+    if flags & ID:
+        _put_str(out, ident)
+    if flags & MODE:
+        _put_str(out, mode)
+    try:
+        if flags & DIGEST:
+            out += _U64.pack(int(digest))
+        if flags & BASE:
+            out += _U64.pack(int(base))
+    except struct.error as e:
+        raise WireError(str(e)) from None
+    return flags
+
+def _put_peers(out: bytearray, peers: Any) -> None:
+    out.append(PEERS)
+    peers = list(peers or ())
+    _put_uvarint(out, len(peers))
+    for host, port in peers:
+        _put_str(out, host)
+        _put_uvarint(out, int(port))
+
+def encode(msg: Mapping[str, Any]) -> bytes:
+    """Tail, dream, HUNGER or PEERS (Tail or plain dict) → bytes. WireError if it can't."""
+    out = bytearray((MAGIC, VERSION))
+    if msg.get("type") == "PEERS":
+        _put_peers(out, msg.get("peers"))
+        return bytes(out)
+    flags = _put_header(out, msg)
+    try:
+        if flags & DELTA:
+            _put_tallies(out, msg.get("delta"))
+        elif flags & TALLIES:
+            _put_tallies(out, msg.get("tallies"))
+    except struct.error as e:
+        raise WireError(str(e)) from None
+    return bytes(out)
+
+def header(msg: Mapping[str, Any]) -> bytes:
+    """The header encode() would write, without the tally section."""
+    out = bytearray((MAGIC, VERSION))
+    _put_header(out, msg)
+    return bytes(out)
+
+def span(data: bytes) -> int:
+    """How many leading bytes name this datagram. A myelin tail is named by
+    its header and tallies, short of any trace trailer (hops and stamps
+    change on every relay; the tail doesn't); anything else by all of it.
+    Reads lengths only: nothing is decoded."""
+    try:
+        if not is_myelin(data) or data[2] != TAIL:
+            return len(data)
+        i = 3
+        while data[i] & 0x80:
+            i += 1
+        flags = data[i + 1]
+        i += 2
+        for bit in (ID, MODE):
+            if flags & bit:
+                n, i = _uvarint(data, i)
+                i += n
+        i += (8 if flags & DIGEST else 0) + (8 if flags & BASE else 0)
+        return min(_past(data, flags, i), len(data))
+    except (WireError, IndexError):
+        return len(data)
+
+def kind(data: bytes) -> Tuple[int, int]:
+    """(type, flags) off the first few bytes; (0, 0) if not myelin.
+    CHUNK and PEERS carry no flags byte: (type, 0)."""
+    try:
+        if not is_myelin(data):
+            return 0, 0
+        if data[2] in (CHUNK, PEERS):
+            return data[2], 0
+        i = 3
+        while data[i] & 0x80:
+            i += 1
+        return data[2], data[i + 1]
+    except IndexError:
+        return 0, 0
+
+def chunk(digest: int, total: int, index: int, count: int, fragment: bytes = b"") -> bytes:
+    out = bytearray((MAGIC, VERSION, CHUNK))
+    out += _U64.pack(int(digest))
+    _put_uvarint(out, int(total))
+    _put_uvarint(out, int(index))
+    _put_uvarint(out, int(count))
+    out += fragment
+    return bytes(out)
+
+def unchunk(data: bytes) -> Optional[Tuple[int, int, int, int, bytes]]:
+    """(digest, total, index, count, fragment), or None if not a CHUNK."""
+    try:
+        if not is_myelin(data) or data[1] != VERSION or data[2] != CHUNK:
+            return None
+        digest = _U64.unpack_from(data, 3)[0]
+        total, i = _uvarint(data, 11)
+        index, i = _uvarint(data, i)
+        count, i = _uvarint(data, i)
+        return digest, total, index, count, data[i:]
+    except (IndexError, struct.error):
+        return None
+
+# =========================
+# Decode
+# =========================
+def _header(data: bytes) -> Tuple[Dict[str, Any], int, int]:
+    if not is_myelin(data):
+        raise WireError("not myelin")
+    if data[1] != VERSION:
+        raise WireError(f"unknown version {data[1]}")
+    kind = data[2]
+    if kind == PEERS:
+        n, i = _uvarint(data, 3)
+        peers = []
+        for _ in range(n):
+            host, i = _str(data, i)
+            port, i = _uvarint(data, i)
+            peers.append([host, port])
+        return {"type": "PEERS", "peers": peers}, 0, i
+    crown, i = _uvarint(data, 3)
+    flags = data[i]
+    i += 1
+
+    if kind == HUNGER:
+        msg: Dict[str, Any] = {"type": "HUNGER", "crown": crown,
+                               "need_tail": bool(flags & NEED_TAIL)}
+    elif kind == TAIL:
+        msg = {"crown": crown}
+        if flags & DREAM:
+            msg["is_dream"] = True
+    else:
+        raise WireError(f"unknown type {kind}")
+
+    if flags & ID:
+        msg["id"], i = _str(data, i)
+    if flags & MODE:
+        msg["mode"], i = _str(data, i)
+    if flags & DIGEST:
+        msg["digest"] = _U64.unpack_from(data, i)[0]
+        i += 8
+    if flags & BASE:
+        msg["base"] = _U64.unpack_from(data, i)[0]
+        i += 8
+    # Present, not yet parsed
+    if flags & DELTA:
+        msg["delta"] = None
+    elif flags & TALLIES:
+        msg["tallies"] = None
+    return msg, flags, i
+
+def _past(data: bytes, flags: int, i: int) -> int:
+    # Where a tail's tally section ends, read off its lengths alone
+    if not flags & (DELTA | TALLIES):
+        return i
+    n, i = _uvarint(data, i)
+    code = chr(data[i])
+    if code not in "bhiq":
+        raise WireError("bad width")
+    size, i = _uvarint(data, i + 1)
+    return i + size + n * struct.calcsize(code)
+
+def traced(data: bytes, origin: str, stamp: int, hops: int, via: str) -> bytes:
+    """An encoded tail with its trace trailer set (any old one replaced)."""
+    _, flags, i = _header(data)
+    if data[2] != TAIL:
+        raise WireError("only tails carry a trace")
+    out = bytearray(data[:_past(data, flags, i)])
+    out.append(TRACE)
+    _put_str(out, origin)
+    _put_uvarint(out, int(stamp))
+    _put_uvarint(out, int(hops))
+    _put_str(out, via)
+    return bytes(out)
+
+def trace(data: bytes) -> Optional[Tuple[str, int, int, str]]:
+    """(origin, stamp, hops, via) off a tail's trailer, or None if it has none."""
+    try:
+        if not is_myelin(data) or data[2] != TAIL:
+            return None
+        _, flags, i = _header(data)
+        i = _past(data, flags, i)
+        if i >= len(data) or data[i] != TRACE:
+            return None
+        origin, i = _str(data, i + 1)
+        stamp, i = _uvarint(data, i)
+        hops, i = _uvarint(data, i)
+        via, i = _str(data, i)
+        return origin, stamp, hops, via
+    except (WireError, IndexError, UnicodeDecodeError, struct.error):
+        return None
+
+def peek(data: bytes) -> Optional[Dict[str, Any]]:
+    """Header only. A tail's tallies/delta key is there but None: unparsed."""
+    try:
+        return _header(data)[0]
+    except (WireError, IndexError, UnicodeDecodeError, struct.error):
+        return None
+
+def decode(data: bytes) -> Optional[Dict[str, Any]]:
+    """Whole message as the plain dict JSON would have produced, or None."""
+    try:
+        msg, flags, i = _header(data)
+        if flags & DELTA:
+            msg["delta"] = _tallies(data, i)
+        elif flags & TALLIES:
+            msg["tallies"] = _tallies(data, i)
+        return msg
+    except (WireError, IndexError, UnicodeDecodeError, struct.error):
+        return None
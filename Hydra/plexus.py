@@ -3,8 +3,18 @@
 # No time. No replay. No logs.
 # ============================================
 from __future__ import annotations
-from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Literal
+import os, sys
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Literal, Tuple
+
+# The Heart is the one home of the tally law; Hydra sits beside it
+_HEART = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "Heart"))
+if _HEART not in sys.path:
+    sys.path.insert(0, _HEART)
+
+from ObliviousHeart import Record
+from ObliviousTally import PersistentTallies, digest_against, digest_update, tally_digest
 
 # =========================
 # Crown Membrane (3-gem plane)
@@ -17,6 +27,64 @@ def gem_name(g: int) -> str:
 def crown_next(c: int) -> int:
     return 1 if int(c) >= 3 else int(c) + 1
 
+# =========================
+# Tail (frozen, shared, never copied)
+# =========================
+_READ_ONLY = (MappingProxyType, PersistentTallies)
+
+def _frozen(tallies: Mapping[str, int]) -> Mapping[str, int]:
+    # Read-only without a copy: the caller hands over ownership
+    return tallies if isinstance(tallies, _READ_ONLY) else MappingProxyType(tallies)
+
+def _plain(tallies: Mapping[str, int]) -> Dict[str, int]:
+    if isinstance(tallies, MappingProxyType):
+        return tallies.copy()                    # dict.copy, not a key walk
+    if isinstance(tallies, PersistentTallies):
+        return tallies.to_dict()
+    return dict(tallies)
+
+def _own(tallies: Mapping[str, int]) -> Mapping[str, int]:
+    # Frozen tallies are shared; anything else is copied once
+    if isinstance(tallies, _READ_ONLY):
+        return tallies
+    return MappingProxyType(_plain(tallies))
+
+def _materialize(base: Mapping[str, int], changes: Mapping[str, int]) -> Mapping[str, int]:
+    if not changes:
+        return _own(base)
+    if isinstance(base, PersistentTallies):
+        return base.update(changes)              # one new path per change
+    tallies = _plain(base)
+    tallies.update(changes)
+    return MappingProxyType(tallies)
+
+class Tail(Record):
+    """Frozen tail: the heart's Record in crown terms; to_wire() for the socket."""
+    __slots__ = ("id", "tallies", "crown", "digest", "is_dream", "mode", "base", "delta")
+    _fields = __slots__
+
+    def __init__(
+        self,
+        id: Optional[str] = None,
+        tallies: Optional[Mapping[str, int]] = None,
+        crown: Optional[int] = None,
+        digest: Optional[int] = None,
+        is_dream: Optional[bool] = None,
+        mode: Optional[str] = None,
+        base: Optional[int] = None,
+        delta: Optional[Mapping[str, int]] = None,
+    ) -> None:
+        put = object.__setattr__
+        put(self, "id", id)
+        put(self, "tallies", None if tallies is None else _frozen(tallies))
+        put(self, "crown", crown)
+        put(self, "digest", digest)
+        put(self, "is_dream", is_dream)
+        put(self, "mode", mode)
+        put(self, "base", base)
+        put(self, "delta", None if delta is None else _frozen(delta))
+        put(self, "_held", False)
+
 # =========================
 # Intent (Body Interface)
 # =========================
@@ -32,21 +100,32 @@ class Intent:
 # =========================
 @dataclass
 class Tetron:
-    tallies: Dict[str, int]
+    tallies: Mapping[str, int]
+    _digest: Optional[Tuple[Any, int]] = field(default=None, repr=False, compare=False)
+
+    def settle(self, tallies: Mapping[str, int], digest: int) -> None:
+        self.tallies = tallies
+        self._digest = (tallies, int(digest))
 
-    def snapshot(self) -> Dict[str, Any]:
+    def digest(self) -> int:
+        if self._digest is None or self._digest[0] is not self.tallies:
+            self._digest = (self.tallies, tally_digest(self.tallies))
+        return self._digest[1]
+
+    def snapshot(self) -> Tail:
         # Dream geometry: no authority, no memory
-        return {
-            "tallies": dict(self.tallies),
-            "is_dream": True,
-        }
+        return Tail(
+            tallies=_own(self.tallies),
+            digest=self.digest(),
+            is_dream=True,
+        )
 
 # =========================
 # Plexus State
 # =========================
 @dataclass
 class plexusState:
-    tallies: Dict[str, int]
+    tallies: Mapping[str, int]
     crown: int
     head: Optional[str] = None
 
@@ -59,93 +138,177 @@ class plexus:
         head_id: str,
         initial_tallies: Optional[Dict[str, int]] = None,
         initial_crown: int = 1,
+        verify_digest: bool = False,
+        persistent: bool = False,
+        initial_digest: Optional[int] = None,
     ) -> None:
         self.head_id = str(head_id)
 
-        tallies = dict(initial_tallies or {
+        # The tallies decide equality; the digest is carried across the
+        # entries that change (verify_digest recomputes it in full)
+        self.verify_digest = bool(verify_digest)
+
+        # Persistent: tallies live in the Heart's HAMT; a transfer grows one
+        # new path and the tetron, tail and snapshots share the rest
+        self.persistent = bool(persistent)
+
+        tallies = self._keep(initial_tallies or {
             "A": 10, "B": 10, "C": 10, "D": 10, "E": 10
         })
 
-        # Tetron = crystalline soul geometry
+        # Tetron = crystalline soul geometry (shares the frozen tallies)
         self.tetron = Tetron(tallies=tallies)
 
         # Embodiment
         self.state = plexusState(
-            tallies=dict(tallies),
+            tallies=tallies,
             crown=int(initial_crown),
             head=None,
         )
 
-        self.tail: Optional[Dict[str, Any]] = None
+        self.tail: Optional[Tail] = None
         self.envy: bool = False
+        self.adopts = 0                  # tails that overwrote the tetron (read by vitals)
+        self._digest: Optional[Tuple[Any, int]] = None
+        if initial_digest is not None:
+            self.genesis(tallies, initial_digest)
 
     # =========================
     # Echo
     # =========================
-    def snapshot(self) -> Dict[str, Any]:
-        return {
-            "id": self.head_id,
-            "tallies": dict(self.state.tallies),
-            "crown": int(self.state.crown),
-            "is_dream": False,
-        }
+    def snapshot(self) -> Tail:
+        return Tail(
+            id=self.head_id,
+            tallies=_own(self.state.tallies),
+            crown=int(self.state.crown),
+            digest=self.digest(),
+            is_dream=False,
+        )
 
     def emotions(self) -> Dict[str, Any]:
         return {"envy": bool(self.envy)}
 
+    # =========================
+    # Digest (kept current on every adopt)
+    # =========================
+    def digest(self) -> int:
+        # Memoized per tallies object; any outside reassignment recomputes
+        tallies = self.state.tallies
+        if self._digest is None or self._digest[0] is not tallies:
+            self._digest = (tallies, tally_digest(tallies))
+        return self._digest[1]
+
+    def _moved(self, tallies: Mapping[str, int]) -> Optional[int]:
+        # None if the tetron holds these already; else their digest, computed
+        # here: a peer's digest only names its tail, it does not vouch for it
+        return digest_against(tallies, self.state.tallies, self.digest(),
+                              verify=self.verify_digest)
+
+    def _keep(self, tallies: Mapping[str, int]) -> Mapping[str, int]:
+        if self.persistent and not isinstance(tallies, PersistentTallies):
+            return PersistentTallies(tallies)
+        return _own(tallies)
+
+    def genesis(self, tallies: Mapping[str, int], digest: int) -> None:
+        """Start over at `tallies`, taking `digest` as theirs: one genesis book
+        and digest shared by a whole swarm instead of a tally walk per head
+        (verify_digest still checks it)."""
+        if self.verify_digest and int(digest) != tally_digest(tallies):
+            raise ValueError("genesis digest does not match its tallies")
+        self._settle(tallies, int(digest))
+        self.tail = None
+        self.envy = False
+
+    def _settle(self, tallies: Mapping[str, int], digest: int) -> None:
+        self.state.tallies = self._keep(tallies)
+        self._digest = (self.state.tallies, digest)
+        self.tetron.settle(self.state.tallies, digest)
+
+    def _tail(self, tail_in: Mapping[str, Any], digest: int,
+              tallies: Optional[Mapping[str, int]] = None,
+              delta: Optional[Mapping[str, int]] = None) -> Tail:
+        # The adopted tail; shares the settled tallies instead of copying,
+        # and is held: the body reads it back as plex.tail
+        return Tail(
+            id=tail_in.get("id"),
+            tallies=tallies,
+            crown=tail_in.get("crown"),
+            digest=digest,
+            mode=tail_in.get("mode"),
+            base=tail_in.get("base"),
+            delta=delta,
+        ).hold()
+
     # =========================
     # DreamState (Tetron Projection)
     # =========================
-    def dream_state(self) -> Dict[str, Any]:
-        d = self.tetron.snapshot()
+    def dream_state(self) -> Tail:
         # Crown is pacing only; never authority
-        d["crown"] = int(self.state.crown)
-        return d
+        return self.tetron.snapshot().replace(crown=int(self.state.crown))
 
     # =========================
     # Envy
     # =========================
-    def _envy_reanchor(self) -> Dict[str, Any]:
+    def _envy_reanchor(self) -> Tail:
         # Drop authority, redraw identity, do nothing else
-        return {
-            "id": self.head_id,
-            "tallies": dict(self.tetron.tallies),
-            "crown": int(self.state.crown),
-            "is_dream": True,
-            "mode": "ENVY",
-        }
+        return Tail(
+            id=self.head_id,
+            tallies=_own(self.tetron.tallies),
+            crown=int(self.state.crown),
+            digest=self.tetron.digest(),
+            is_dream=True,
+            mode="ENVY",
+        )
 
     # =========================
     # Proposal
     # =========================
-    def propose(self, to_head: str, amount: int) -> Dict[str, Any]:
+    def propose(self, to_head: str, amount: int,
+                delta: bool = False) -> Tail:
         if self.envy:
             return self._envy_reanchor()
 
-        tallies = dict(self.state.tallies)
-        tallies[self.head_id] = tallies.get(self.head_id, 0) - int(amount)
-        tallies[to_head] = tallies.get(to_head, 0) + int(amount)
-
-        return {
-            "id": self.head_id,
-            "tallies": tallies,
-            "crown": crown_next(self.state.crown),
-        }
+        cur = self.state.tallies
+        base = digest = self.digest()
+        changes: Dict[str, int] = {}
+        for name, change in ((self.head_id, -int(amount)), (to_head, int(amount))):
+            old = changes.get(name, cur.get(name))
+            changes[name] = (old or 0) + change
+            digest = digest_update(digest, name, old, changes[name])
+
+        if delta:
+            # Delta tail: changed entries only, anchored to our base digest
+            return Tail(
+                id=self.head_id,
+                base=base,
+                delta=changes,
+                crown=crown_next(self.state.crown),
+                digest=digest,
+            )
+
+        return Tail(
+            id=self.head_id,
+            tallies=_materialize(cur, changes),
+            crown=crown_next(self.state.crown),
+            digest=digest,
+        )
 
     # =========================
     # Ingest
     # =========================
-    def ingest(self, tail_in: Dict[str, Any]) -> List[Intent]:
+    def ingest(self, tail_in: Mapping[str, Any]) -> List[Intent]:
         intents: List[Intent] = []
 
         # Dream is orientation AND hydration (never a competitor)
         if tail_in.get("is_dream"):
-            dream_tallies = dict(tail_in.get("tallies", {}) or {})
+            dream_tallies = tail_in.get("tallies", {}) or {}
 
             # Idempotent hydration
-            if dream_tallies and dream_tallies != self.state.tallies:
-                self.state.tallies = dict(dream_tallies)
-                self.tetron.tallies = dict(dream_tallies)
+            if dream_tallies:
+                dream_digest = self._moved(dream_tallies)
+                if dream_digest is not None:
+                    self._settle(dream_tallies, dream_digest)
+                    self.adopts += 1
 
             # Envy resolves through stillness
             if self.envy:
@@ -153,7 +316,7 @@ class plexus:
 
             return intents
 
-        inc_tallies = dict(tail_in.get("tallies", {}))
+        inc_tallies = tail_in.get("tallies", {}) or {}
         inc_crown = int(tail_in.get("crown", self.state.crown))
 
         cur = int(self.state.crown)
@@ -174,25 +337,28 @@ class plexus:
             }))
             return intents
 
+        # Delta tail → applies only onto the base it was cut from
+        if "delta" in tail_in:
+            return self._ingest_delta(tail_in, inc_crown, cur)
+
         # Calm again
         if self.envy:
             self.envy = False
 
         # Idempotent no-op
-        if inc_tallies == self.state.tallies:
+        inc_digest = self._moved(inc_tallies)
+        if inc_digest is None:
             return intents
 
-        # Adopt witnessed reality
-        self.state.tallies = dict(inc_tallies)
+        # Adopt witnessed reality + stabilize the Tetron
+        self._settle(inc_tallies, inc_digest)
+        self.adopts += 1
         self.state.crown = inc_crown
         self.state.head = str(tail_in.get("id", "")) or None
 
-        # Stabilize the Tetron
-        self.tetron.tallies = dict(inc_tallies)
+        self.tail = self._tail(tail_in, inc_digest, tallies=self.state.tallies)
 
-        self.tail = dict(tail_in)
-
-        intents.append(Intent("PROPAGATE", {"tail": dict(self.tail)}))
+        intents.append(Intent("PROPAGATE", {"tail": self.tail}))
 
         if inc_crown == exp:
             intents.append(Intent("REQUEST_SYNC", {
@@ -201,3 +367,161 @@ class plexus:
             }))
 
         return intents
+
+    # =========================
+    # Delta Ingest
+    # =========================
+    def _ingest_delta(self, tail_in: Mapping[str, Any], inc_crown: int,
+                      cur: int) -> List[Intent]:
+        intents: List[Intent] = []
+
+        # Foreign base → cannot apply; hunger for a dream instead
+        base = tail_in.get("base")
+        if base != self.digest():
+            intents.append(Intent("REQUEST_SYNC", {
+                "crown": cur,
+                "gem": gem_name(cur),
+                "need_tail": True,
+            }))
+            return intents
+
+        if self.envy:
+            self.envy = False
+
+        changes = {str(k): int(v) for k, v in (tail_in.get("delta", {}) or {}).items()}
+        tallies = self.state.tallies
+        if all(tallies.get(k) == v for k, v in changes.items()):
+            return intents
+
+        digest = int(base)
+        for k, v in changes.items():
+            digest = digest_update(digest, k, tallies.get(k), v)
+
+        self._settle(_materialize(tallies, changes), digest)
+        self.adopts += 1
+        self.state.crown = inc_crown
+        self.state.head = str(tail_in.get("id", "")) or None
+
+        self.tail = self._tail(tail_in, digest, delta=changes)
+
+        intents.append(Intent("PROPAGATE", {"tail": self.tail}))
+
+        if inc_crown == crown_next(cur):
+            intents.append(Intent("REQUEST_SYNC", {
+                "crown": inc_crown,
+                "gem": gem_name(inc_crown),
+            }))
+
+        return intents
+
+    # =========================
+    # Burst Ingest
+    # =========================
+    def ingest_many(self, tails: Iterable[Mapping[str, Any]]) -> List[Intent]:
+        # Same law as ingest, in order, across a drained burst. Survivors are
+        # held by reference; only the last is materialized. Intents collapse
+        # to at most one ENVY, one PROPAGATE and one REQUEST_SYNC.
+        envy, crown, head = self.envy, int(self.state.crown), self.state.head
+        base, digest = self.state.tallies, self.digest()
+        changes: Dict[str, int] = {}
+        adopts, last = 0, None
+        spoken = 0                       # adopts ingest would have propagated
+        envy_at: Optional[Dict[str, Any]] = None
+        sync_at: Optional[Dict[str, Any]] = None
+
+        def get(k: str) -> Optional[int]:
+            return changes[k] if k in changes else base.get(k)
+
+        def moved(tallies: Mapping[str, int]) -> Optional[int]:
+            return digest_against(tallies, base, digest, changes,
+                                  verify=self.verify_digest)
+
+        for tail_in in tails:
+            # Dream → hydration only
+            if tail_in.get("is_dream"):
+                dream_tallies = tail_in.get("tallies", {}) or {}
+                if dream_tallies:
+                    dream_digest = moved(dream_tallies)
+                    if dream_digest is not None:
+                        base, changes, digest = dream_tallies, {}, dream_digest
+                        adopts += 1
+                envy = False
+                continue
+
+            inc_crown = int(tail_in.get("crown", crown))
+            exp = crown_next(crown)
+
+            # Envy gate
+            if inc_crown not in (crown, exp):
+                if not envy:
+                    envy = True
+                    envy_at = envy_at or {
+                        "current_crown": crown,
+                        "incoming_crown": inc_crown,
+                    }
+                sync_at = dict(sync_at or {}, crown=crown, gem=gem_name(crown))
+                continue
+
+            if "delta" in tail_in:
+                if tail_in.get("base") != digest:
+                    sync_at = {"crown": crown, "gem": gem_name(crown), "need_tail": True}
+                    continue
+                envy = False
+                delta: Optional[Dict[str, int]] = {
+                    str(k): int(v) for k, v in (tail_in.get("delta", {}) or {}).items()
+                }
+                if all(get(k) == v for k, v in delta.items()):
+                    continue
+                for k, v in delta.items():
+                    digest = digest_update(digest, k, get(k), v)
+                    changes[k] = v
+            else:
+                delta = None
+                envy = False
+                inc_tallies = tail_in.get("tallies", {}) or {}
+                inc_digest = moved(inc_tallies)
+                if inc_digest is None:
+                    continue
+                base, changes, digest = inc_tallies, {}, inc_digest
+
+            adopts += 1
+            spoken += 1
+            last = (tail_in, digest, base, dict(changes), delta)
+            head = str(tail_in.get("id", "")) or None
+            if inc_crown == exp:
+                sync_at = dict(sync_at or {}, crown=inc_crown, gem=gem_name(inc_crown))
+            crown = inc_crown
+
+        self.envy = envy
+        intents: List[Intent] = []
+        if envy_at is not None:
+            intents.append(Intent("ENVY", envy_at))
+
+        # Materialize the lone survivor
+        if adopts:
+            self._settle(_materialize(base, changes), digest)
+            self.adopts += adopts
+            self.state.crown = crown
+            self.state.head = head
+
+        if last is not None:
+            tail_in, l_digest, l_base, l_changes, l_delta = last
+            if l_base is base and l_changes == changes:
+                l_tallies = self.state.tallies
+            else:
+                l_tallies = _materialize(l_base, l_changes)
+            if l_delta is None:
+                self.tail = self._tail(tail_in, l_digest, tallies=l_tallies)
+            else:
+                self.tail = self._tail(tail_in, l_digest, delta=l_delta)
+            out = self.tail
+            if l_delta is not None and spoken > 1:
+                # Peers missed the rest of the burst → send the whole tail
+                # (a dream adopted in it was never theirs to miss)
+                out = Tail(id=out.id, tallies=l_tallies, crown=out.crown, digest=l_digest)
+            intents.append(Intent("PROPAGATE", {"tail": out}))
+
+        if sync_at is not None:
+            intents.append(Intent("REQUEST_SYNC", sync_at))
+
+        return intents
@@ -3,25 +3,102 @@
 # No time. No replay. No logs.
 # ============================================
 from __future__ import annotations
-import json, os, socket, sys, termios, threading, tty
-from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple, Union
+import json, os, select, signal, socket, sys, termios, threading, time, tty
+from hashlib import blake2b
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple, Union
 
 # ============================================
 # Plexus (Heart)
 # ============================================
-from plexus import Intent, gem_name  # type: ignore
+import myelin
+from synapse import Gossip, _key
+from vitals import Vitals, dump as _dump, serve as _serve
+from dendrite import PULSE_EVERY, Dendrites
+from suture import WHOLE_MAX, Suture, fetch, is_manifest, manifest, serve_bulk
+from commissure import BELL, Commissure, fan
+from engram import Engram
+from thalamus import BATCH_MAX, relay
+from plexus import Intent, Tail, crown_next, gem_name  # type: ignore
 from typing import Protocol
 
 class Heart(Protocol):
     head_id: str
-    tail: Optional[Dict[str, Any]]
+    tail: Optional[Tail]
     state: Any
-    def snapshot(self) -> Dict[str, Any]: ...
+    envy: bool
+    adopts: int
+    def snapshot(self) -> Tail: ...
     def emotions(self) -> Dict[str, Any]: ...
-    def ingest(self, tail_in: Dict[str, Any]) -> List[Intent]: ...
-    def propose(self, to_head: str, amount: int) -> Dict[str, Any]: ...
-    def dream_state(self) -> Dict[str, Any]: ...
+    def ingest(self, tail_in: Mapping[str, Any]) -> List[Intent]: ...
+    def ingest_many(self, tails: Iterable[Mapping[str, Any]]) -> List[Intent]: ...
+    def propose(self, to_head: str, amount: int, delta: bool = False) -> Tail: ...
+    def dream_state(self) -> Tail: ...
+    def digest(self) -> int: ...
+
+# Wire: JSON to a peer until it speaks or offers myelin (binary), then myelin
+MYELIN, JSON = "myelin", "json"
+WIRES = (MYELIN, JSON)
+SPEAKS_MAX = 4096       # sources whose tongue we remember
+
+def _wire(tail: Mapping[str, Any], codec: str = JSON) -> bytes:
+    # Frozen tails are shared in-process; only the socket gets bytes
+    if codec == MYELIN:
+        try:
+            return myelin.encode(tail)
+        except myelin.WireError:
+            pass                                 # not myelin-shaped → JSON
+    d = tail.to_wire() if isinstance(tail, Tail) else dict(tail)
+    return json.dumps(d, separators=(",", ":")).encode("utf-8")
+
+def _targets(gossip: Optional[Gossip], tail: Mapping[str, Any], peers: List[Tuple[str, int]],
+             src_addr: Optional[Tuple[str, int]] = None) -> List[Tuple[str, int]]:
+    # Flood: everyone but the source. Gossip: k of them, until heard enough.
+    src = None if src_addr is None else (src_addr[0], src_addr[1])
+    if gossip is None:
+        return [p for p in peers if p != src]
+    key = _tail_key(tail)
+    if not gossip.forward(key):
+        return []
+    return gossip.targets(tail, key, peers, src)
+
+def _tongue(data: bytes) -> str:
+    return MYELIN if myelin.is_myelin(data) else JSON
+
+def _heard(speaks: Dict[Tuple[str, int], str], addr: Tuple[str, int], tongue: str,
+           msg: Optional[Mapping[str, Any]] = None) -> None:
+    # Myelin sticks once a peer has spoken it, or offered it on a JSON HUNGER
+    # or PEERS; until then JSON, which a JSON-only head can read
+    was = speaks.get(addr)
+    if tongue == MYELIN or (msg is not None and msg.get("wire") == MYELIN):
+        if was == MYELIN:
+            return
+        codec = MYELIN
+    elif was is not None:
+        return
+    else:
+        codec = JSON
+    if was is None and len(speaks) >= SPEAKS_MAX:
+        # Oldest gives way; a live peer is heard again on its next datagram
+        speaks.pop(next(iter(speaks)))
+    speaks[addr] = codec
+
+def _offer(msg: Dict[str, Any], wire: str) -> Dict[str, Any]:
+    # HUNGER and PEERS from a myelin head say so; JSON-only heads ignore the key
+    if wire == MYELIN:
+        msg["wire"] = MYELIN
+    return msg
+
+def _payloads(msg: Mapping[str, Any], peers: List[Tuple[str, int]],
+              speaks: Mapping[Tuple[str, int], str]) -> Iterator[Tuple[Tuple[str, int], bytes]]:
+    # Each peer in its tongue (JSON if unheard); encode once per tongue
+    cache: Dict[str, bytes] = {}
+    for peer in peers:
+        codec = speaks.get(peer, JSON)
+        payload = cache.get(codec)
+        if payload is None:
+            payload = cache[codec] = _wire(msg, codec)
+        yield peer, payload
 
 # ============================================
 # Skeleton
@@ -34,10 +111,17 @@ _selected_amount = 1
 
 PRINT_LOCK = threading.Lock()
 
-# Storm Membrane 
-SEEN_H: Dict[str, None] = {}
+# Storm Membrane (fingerprints; see Membrane below)
 SEEN_MAX = 4096
 
+# Eyes: at most this many HUD redraws a second
+EYES_FPS = 20.0
+
+# Nurse: dreams a second per hungry peer, and how many it may ask for at once
+HUNGER_RATE = 10.0
+HUNGER_BURST = 5
+HUNGRY_MAX = 4096
+
 # Cursor / Green W/ Envy
 HIDE_CURSOR = "\x1b[?25l"
 SHOW_CURSOR = "\x1b[?25h"
@@ -98,6 +182,44 @@ def _render_status(plex: Heart, head_id: str, input_buf: str) -> None:
         sys.stdout.write(_cursor_left(tail_len))
         sys.stdout.flush()
 
+class Eyes:
+    """Dirty flag + refresh cap. mark() is cheap and safe from any thread;
+    blink() draws at most fps times a second, however fast the heart beats."""
+
+    def __init__(self, plex: Heart, head_id: str, fps: float = EYES_FPS) -> None:
+        self.plex = plex
+        self.head_id = head_id
+        self.interval = 1.0 / float(fps) if fps > 0 else 0.0
+        self.dirty = True
+        self.last = 0.0
+        self._wake = threading.Event()
+
+    def mark(self) -> None:
+        self.dirty = True
+        self._wake.set()
+
+    def blink(self) -> float:
+        # Draw if dirty and due → 0.0; dirty but early → seconds to wait
+        if not self.dirty:
+            return 0.0
+        wait = self.last + self.interval - time.monotonic()
+        if wait > 0:
+            return wait
+        self.dirty = False
+        self.last = time.monotonic()
+        _render_status(self.plex, self.head_id, "")
+        return 0.0
+
+    def watch(self) -> None:
+        # Threaded body: one daemon thread does all the drawing
+        while True:
+            self._wake.wait()
+            self._wake.clear()
+            wait = self.blink()
+            if wait:
+                time.sleep(wait)
+                self._wake.set()
+
 # ============================================
 # Motor Neurons 
 # ============================================
@@ -111,10 +233,73 @@ def _soft_reboot() -> None:
 
 Command = Union[str, Tuple[str, str, int]]
 
-def _read_cmd(head_id: str, plex: Heart) -> Command:
-    # Motor Neurons → Raw Input → Command Impulses.
+def _motor(keys: str, head_id: str) -> Optional[Command]:
+    # One keystroke (or arrow escape) → selection change or command impulse
     global _selected_head_idx, _selected_amount
 
+    # Enter = FEED!!
+    if keys in ("\n", "\r"):
+        to = HEADS[_selected_head_idx]
+        if to == head_id:
+            _selected_head_idx = (_selected_head_idx + 1) % len(HEADS)
+            to = HEADS[_selected_head_idx]
+        return ("FEED", to, _selected_amount)
+
+    # Ctrl+C = Cauterize
+    if keys == "\x03":
+        raise KeyboardInterrupt
+
+    # Ctrl+X = Sever 
+    if keys == "\x18":
+        _soft_reboot()
+
+    # H / h = Hunger 
+    if keys in ("h", "H"):
+        return "HUNGER"
+
+    # Right, Left, Up, Down
+    if len(keys) == 3 and keys[:2] == "\x1b[":
+        ch3 = keys[2]
+        if ch3 == "C":  # →
+            _selected_head_idx = (_selected_head_idx + 1) % len(HEADS)
+        elif ch3 == "D":  # ←
+            _selected_head_idx = (_selected_head_idx - 1) % len(HEADS)
+        elif ch3 == "A":  # ↑
+            _selected_amount += 1
+        elif ch3 == "B":  # ↓
+            _selected_amount -= 1
+
+        if HEADS[_selected_head_idx] == head_id:
+            if ch3 in ("C", "A"):
+                _selected_head_idx = (_selected_head_idx + 1) % len(HEADS)
+            else:
+                _selected_head_idx = (_selected_head_idx - 1) % len(HEADS)
+    return None
+
+def _script(line: str, head_id: str) -> Optional[Command]:
+    # Headless motor neurons: one "feed B 3" or "hunger" per line (cradle.py)
+    words = line.split()
+    if len(words) == 1 and words[0].upper() == "HUNGER":
+        return "HUNGER"
+    if len(words) != 3 or words[0].upper() != "FEED":
+        return None
+    try:
+        to, amt = words[1].upper(), int(words[2])
+    except ValueError:
+        return None
+    return ("FEED", to, amt) if to != head_id else None
+
+def _aim(head_id: str) -> None:
+    # Start with the next head over selected, never ourselves
+    global _selected_head_idx
+    try:
+        me = HEADS.index(head_id)
+        _selected_head_idx = (me + 1) % len(HEADS)
+    except ValueError:
+        _selected_head_idx = 0
+
+def _read_cmd(head_id: str, plex: Heart) -> Command:
+    # Motor Neurons → Raw Input → Command Impulses.
     fd = sys.stdin.fileno()
     old = termios.tcgetattr(fd)
 
@@ -127,53 +312,284 @@ def _read_cmd(head_id: str, plex: Heart) -> Command:
             ch = sys.stdin.read(1)
             if ch == "":
                 raise EOFError
-
-            # Enter = FEED!!
-            if ch in ("\n", "\r"):
-                to = HEADS[_selected_head_idx]
-                if to == head_id:
-                    _selected_head_idx = (_selected_head_idx + 1) % len(HEADS)
-                    to = HEADS[_selected_head_idx]
-                    _render_status(plex, head_id, input_buf)
-                return ("FEED", to, _selected_amount)
-
-            # Ctrl+C = Cauterize
-            if ch == "\x03":
-                raise KeyboardInterrupt
-
-            # Ctrl+X = Sever 
-            if ch == "\x18" and input_buf == "":
-                _soft_reboot()
-
-            # H / h = Hunger 
-            if ch in ("h", "H") and input_buf == "":
-                return "HUNGER"
-
-            # Right, Left, Up, Down
             if ch == "\x1b":
-                ch2 = sys.stdin.read(1)
-                ch3 = sys.stdin.read(1)
-                if ch2 == "[":
-                    if ch3 == "C":  # →
-                        _selected_head_idx = (_selected_head_idx + 1) % len(HEADS)
-                    elif ch3 == "D":  # ←
-                        _selected_head_idx = (_selected_head_idx - 1) % len(HEADS)
-                    elif ch3 == "A":  # ↑
-                        _selected_amount += 1
-                    elif ch3 == "B":  # ↓
-                        _selected_amount -= 1
-
-                    if HEADS[_selected_head_idx] == head_id:
-                        if ch3 in ("C", "A"):
-                            _selected_head_idx = (_selected_head_idx + 1) % len(HEADS)
-                        else:
-                            _selected_head_idx = (_selected_head_idx - 1) % len(HEADS)
-
-                    _render_status(plex, head_id, input_buf)
+                ch += sys.stdin.read(2)
+
+            cmd = _motor(ch, head_id)
+            if cmd is not None:
+                return cmd
+            _render_status(plex, head_id, input_buf)
 
     finally:
         termios.tcsetattr(fd, termios.TCSADRAIN, old)
 
+# ============================================
+# Storm membrane (Skin)
+# ============================================
+def _decode(data: bytes) -> Optional[Dict[str, Any]]:
+    if myelin.is_myelin(data):
+        return myelin.decode(data)
+    try:
+        msg = json.loads(str(data, "utf-8"))
+    except Exception:
+        return None
+    return msg if isinstance(msg, dict) else None
+
+def _peek(data: bytes) -> Optional[Dict[str, Any]]:
+    # Myelin: header only, tallies left unparsed (None). JSON: the whole thing.
+    if myelin.is_myelin(data):
+        return myelin.peek(data)
+    return _decode(data)
+
+def _flesh(data: bytes, msg: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    # Parse the tallies a peeked tail left behind
+    if msg.get("tallies", 0) is None or msg.get("delta", 0) is None:
+        return myelin.decode(data)
+    return msg
+
+def _outside(msg: Mapping[str, Any], crown: int) -> bool:
+    # Crown gate, read off the header: lands as ENVY without its tallies
+    if msg.get("is_dream"):
+        return False
+    cur = int(crown)
+    return int(msg.get("crown", cur)) not in (cur, crown_next(cur))
+
+def _bare(msg: Mapping[str, Any]) -> bool:
+    # Peeked but never fleshed: only fit to land while still out of window
+    return msg.get("tallies", 0) is None or msg.get("delta", 0) is None
+
+def _sane(msg: Mapping[str, Any]) -> bool:
+    # full tail or delta tail
+    return ("tallies" in msg or "delta" in msg) and "crown" in msg
+
+def _fingerprint(data: bytes) -> bytes:
+    # 16 bytes off the raw datagram, before any decode: a myelin tail's
+    # header and tallies (not its trace), or every byte of anything else
+    n = myelin.span(data)
+    return blake2b(memoryview(data)[:n] if n < len(data) else data, digest_size=16).digest()
+
+def _tail_key(tail: Mapping[str, Any]) -> str:
+    # A tail's gossip name, in whichever tongue it came: id, crown, digest.
+    # The same one synapse and womb count by; our own tail has it too.
+    return _key(tail)
+
+class Membrane:
+    """Bounded seen-set: a ring of fingerprints, and a map over the ring from
+    each to whether it was a dream (an envious head lets dreams through) and
+    the tail's gossip name (a repeat is heard without decoding it again)."""
+    __slots__ = ("ring", "keys", "at")
+
+    def __init__(self, size: int = SEEN_MAX) -> None:
+        self.ring: List[Optional[bytes]] = [None] * int(size)
+        self.keys: Dict[bytes, Tuple[bool, Optional[str]]] = {}
+        self.at = 0
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.keys
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def dream(self, key: bytes) -> bool:
+        return self.keys.get(key, (False, None))[0]
+
+    def name(self, key: bytes) -> Optional[str]:
+        return self.keys.get(key, (False, None))[1]
+
+    def add(self, key: bytes, dream: bool = False, name: Optional[str] = None) -> None:
+        if key in self.keys:
+            return
+        old = self.ring[self.at]
+        if old is not None:
+            del self.keys[old]
+        self.ring[self.at] = key
+        self.keys[key] = (bool(dream), name)
+        self.at = (self.at + 1) % len(self.ring)
+
+SEEN_H = Membrane(SEEN_MAX)
+
+Sensed = Tuple[str, Optional[Union[bytes, str]], Optional[Dict[str, Any]]]
+
+_CHUNK = bytes((myelin.MAGIC, myelin.VERSION, myelin.CHUNK))
+
+def _sense(data: bytes, crown: int, envy: bool, fresh: bool = True,
+           membrane: Optional[Membrane] = None, lazy: bool = False) -> Optional[Sensed]:
+    # Everything short of the heart: → ("HUNGER", None, msg), ("PEERS", None, msg),
+    # ("ECHO", name, None) for a membrane hit (the tail's gossip name),
+    # ("TAIL", key, msg) with the membrane's fingerprint,
+    # ("CHUNK", None, None) for the suture, or None.
+    # fresh=False when the window may move before this tail lands: flesh it.
+    # lazy=True leaves every tail peeked; _rouse fleshes what survives.
+    if data[:3] == _CHUNK:
+        return "CHUNK", None, None
+    membrane = SEEN_H if membrane is None else membrane
+    spoken = myelin.is_myelin(data)
+    if not spoken or myelin.kind(data)[0] not in (myelin.HUNGER, myelin.PEERS):
+        # Storm membrane: raw fingerprint, nothing parsed yet. HUNGER and
+        # PEERS are never let in, so a hit is a tail, and its dream bit was
+        # kept when it first came by. If I'm envious, a dream comes through.
+        key = _fingerprint(data)
+        if key in membrane and not (envy and membrane.dream(key)):
+            return "ECHO", membrane.name(key), None
+    else:
+        key = None
+
+    # Decoded once: myelin to its header, JSON whole
+    msg = _peek(data)
+    if msg is None:
+        if key is not None:
+            membrane.add(key)
+        return None
+    if msg.get("type") in ("HUNGER", "PEERS"):
+        return msg["type"], None, msg
+    if key is None:
+        return None                              # typed HUNGER or PEERS, read as neither
+    if not _sane(msg):
+        membrane.add(key)
+        return None
+    membrane.add(key, bool(msg.get("is_dream")), _tail_key(msg))
+    if lazy:
+        return "TAIL", key, msg
+    # Out of window → gated on the header; else parse the tallies
+    if not (fresh and _outside(msg, crown)):
+        msg = _flesh(data, msg)
+        if msg is None:
+            return None
+    return "TAIL", key, msg
+
+def _felt(vitals: Vitals, data: bytes, sensed: Optional[Sensed],
+          lazy: bool = False) -> None:
+    # Count what the skin made of one datagram (a lazy tail's gate is
+    # counted where it lands)
+    vitals.rx += 1
+    vitals.rx_bytes += len(data)
+    if sensed is None:
+        vitals.decode_failures += 1
+        return
+    kind = sensed[0]
+    if kind == "ECHO":
+        vitals.membrane_hits += 1
+    elif kind == "HUNGER":
+        vitals.hunger_in += 1
+    elif kind == "TAIL" and not lazy and _bare(sensed[2]):
+        vitals.gate_rejects += 1
+
+Skimmed = Tuple[Optional[bytes], Sensed, str]
+
+def _skim(view: memoryview, crown: int, envy: bool, vitals: Vitals) -> Optional[Skimmed]:
+    # A ring record sensed where it lies (Commissure.drain): → (bytes the
+    # body still needs, sensed, tongue). A tail keeps its bytes to be
+    # fleshed and a chunk to be stitched; nothing else is copied out.
+    sensed = _sense(view, crown, envy, lazy=True)
+    _felt(vitals, view, sensed, lazy=True)
+    if sensed is None:
+        return None
+    data = bytes(view) if sensed[0] in ("TAIL", "CHUNK") else None
+    return data, sensed, _tongue(view)
+
+def _fleshed(felt: List[Tuple[Dict[str, Any], Optional[bytes], Tuple[str, int]]],
+             vitals: Vitals) -> List[Tuple[Dict[str, Any], Optional[bytes], Tuple[str, int]]]:
+    # Every peeked tail with its tallies parsed; a ganglion's bare tail
+    # (no datagram left) stays bare, one that won't parse is dropped
+    out = []
+    for msg, data, addr in felt:
+        if _bare(msg) and data is not None:
+            msg = _flesh(data, msg)
+            if msg is None:
+                vitals.decode_failures += 1
+                continue
+        out.append((msg, data, addr))
+    return out
+
+def _rouse(felt: List[Tuple[Dict[str, Any], Optional[bytes], Tuple[str, int]]],
+           heart: Heart, vitals: Vitals) -> Tuple[List[Tail], Optional[Tuple[str, int]], int]:
+    # One drain's (header, datagram, addr) tails → what the heart should land:
+    # superseded tails dropped (thalamus.py), survivors fleshed. Only a
+    # leading tail still out of window lands bare, as ENVY. Call with the
+    # heart held still.
+    crown = int(heart.state.crown)
+    survivors = relay(felt, crown, heart.digest(), heart.envy)
+    if len(survivors) < len(felt):
+        # Something would be dropped on the wire's word: flesh the drain and
+        # forecast again on digests computed here
+        felt = _fleshed(felt, vitals)
+        survivors = relay(felt, crown, heart.digest(), heart.envy, heart.state.tallies)
+    vitals.superseded += len(felt) - len(survivors)
+    tails: List[Tail] = []
+    src: Optional[Tuple[str, int]] = None
+    gated = 0
+    for msg, data, addr in survivors:
+        if _bare(msg):
+            if not tails and _outside(msg, crown):
+                gated += 1
+            elif data is None:
+                continue                         # a ganglion's bare tail: its window moved
+            else:
+                msg = _flesh(data, msg)
+                if msg is None:
+                    vitals.decode_failures += 1
+                    continue
+        tails.append(Tail.from_wire(msg, copy=False))
+        src = addr if len(tails) == 1 or src == addr else None
+    vitals.gate_rejects += gated
+    return tails, src, gated
+
+def _monitor(vitals: Vitals, heart: Heart, dendrites: Dendrites,
+             sock_path: Optional[str], dump_path: Optional[str]) -> None:
+    # Gauges every body shares; exposure only if asked for
+    vitals.gauges.update(
+        crown=lambda: int(heart.state.crown),
+        envy=lambda: bool(heart.envy),
+        digest=lambda: heart.digest(),
+        peers=lambda: len(dendrites.live()),
+        peers_known=lambda: len(dendrites),
+        membrane=lambda: len(SEEN_H),
+    )
+    if sock_path:
+        _serve(vitals, sock_path)
+    if dump_path:
+        _dump(vitals, dump_path)
+
+# ============================================
+# Nurse (HUNGER → dream)
+# ============================================
+class Nurse:
+    """Feeds hungry heads. The dream is encoded once per crown, digest and
+    tongue and reused until the heart moves, so a hunger storm costs one
+    encode and N sends. Each source draws from its own token bucket."""
+    __slots__ = ("rate", "burst", "key", "dreams", "buckets")
+
+    def __init__(self, rate: float = HUNGER_RATE, burst: int = HUNGER_BURST) -> None:
+        self.rate = float(rate)                 # 0 → unlimited
+        self.burst = max(1, int(burst))
+        self.key: Optional[Tuple[int, int]] = None
+        self.dreams: Dict[str, bytes] = {}
+        self.buckets: Dict[Tuple[str, int], Tuple[float, float]] = {}
+
+    def allow(self, addr: Tuple[str, int]) -> bool:
+        if self.rate <= 0:
+            return True
+        now = time.monotonic()
+        tokens, then = self.buckets.pop(addr, (float(self.burst), now))
+        tokens = min(float(self.burst), tokens + (now - then) * self.rate)
+        ok = tokens >= 1.0
+        self.buckets[addr] = (tokens - 1.0 if ok else tokens, now)
+        if len(self.buckets) > HUNGRY_MAX:
+            self.buckets.pop(next(iter(self.buckets)))
+        return ok
+
+    def dream(self, plex: Heart, codec: str, vitals: Optional[Vitals] = None) -> bytes:
+        key = (int(plex.state.crown), plex.digest())
+        if key != self.key:
+            self.key = key
+            self.dreams.clear()
+        payload = self.dreams.get(codec)
+        if payload is None:
+            payload = self.dreams[codec] = _wire(plex.dream_state(), codec)
+            if vitals is not None:
+                vitals.dream_encodes += 1
+        return payload
+
 # ============================================
 # Ichor + Neuronal
 # ============================================
@@ -181,34 +597,73 @@ def _read_cmd(head_id: str, plex: Heart) -> Command:
 class Body:
     head_id: str
     sock: socket.socket
-    peers: List[Tuple[str, int]]
+    dendrites: Dendrites
     plex: Heart
     lock: threading.Lock
-
-    def send_tail(self, tail: Dict[str, Any], src_addr: Optional[Tuple[str, int]] = None) -> None:
-        payload = json.dumps(tail, separators=(",", ":")).encode("utf-8")
-        for host, port in self.peers:
-            if src_addr is not None and (host, port) == (src_addr[0], src_addr[1]):
-                continue
+    wire: str = MYELIN
+    speaks: Dict[Tuple[str, int], str] = field(default_factory=dict)
+    gossip: Optional[Gossip] = None
+    eyes: Optional[Eyes] = None
+    vitals: Vitals = field(default_factory=Vitals)
+    nurse: Nurse = field(default_factory=Nurse)
+    suture: Optional[Suture] = None
+    bulk: bool = False
+    commissure: Optional[Commissure] = None
+    engram: Optional[Engram] = None
+
+    def __post_init__(self) -> None:
+        if self.suture is None:
+            self.suture = Suture(self.vitals)
+        if self.dendrites.vitals is None:
+            self.dendrites.vitals = self.vitals
+
+    def _send(self, payload: bytes, peer: Tuple[str, int]) -> None:
+        # Too big for one datagram → chunks (suture.py)
+        dgrams = self.suture.cut(payload)
+        if len(dgrams) > 1:
+            self.vitals.chunks_out += len(dgrams)
+        for dgram in dgrams:
             try:
-                self.sock.sendto(payload, (host, port))
-            except Exception:
-                pass
+                self.sock.sendto(dgram, peer)
+            except OSError:
+                self.vitals.tx_errors += 1
+                return
+            self.vitals.tx += 1
+            self.vitals.tx_bytes += len(dgram)
+
+    def send_tail(self, tail: Mapping[str, Any], src_addr: Optional[Tuple[str, int]] = None) -> None:
+        peers = _targets(self.gossip, tail, self.dendrites.reach(), src_addr)
+        pairs = _payloads(tail, peers, self.speaks)
+        if self.engram is not None:
+            pairs = self.engram.mark(tail, pairs)
+        fan(pairs, self.commissure, self._send)
+
+    def greet(self, addr: Tuple[str, int]) -> None:
+        # Who we know, less them: heartbeat and introduction in one
+        payload = _wire(_offer(self.dendrites.roster(addr), self.wire), self.speaks.get(addr, JSON))
+        fan(((addr, payload),), self.commissure, self._send)
+
+    def pulse(self) -> None:
+        for addr in self.dendrites.reach():
+            self.greet(addr)
+
+    def echo(self, name: Optional[str], addr: Tuple[str, int]) -> None:
+        # A copy of our current tail came back: gossip pushes on (or goes quiet)
+        with self.lock:
+            cur = self.plex.tail
+        if cur is not None and _tail_key(cur) == name:
+            self.send_tail(cur, src_addr=addr)
 
     def send_hunger(self, crown: int, need_tail: bool) -> None:
         msg = {"type": "HUNGER", "id": self.head_id, "crown": int(crown), "need_tail": bool(need_tail)}
-        payload = json.dumps(msg, separators=(",", ":")).encode("utf-8")
-        for host, port in self.peers:
-            try:
-                self.sock.sendto(payload, (host, port))
-            except Exception:
-                pass
+        self.vitals.hunger_out += 1
+        fan(_payloads(_offer(msg, self.wire), self.dendrites.reach(), self.speaks), self.commissure, self._send)
 
     def execute_intents(self, intents: List[Intent], src_addr: Optional[Tuple[str, int]] = None) -> None:
         # Neuronal efferents → Plexus intents → Shell actions.#
         for it in intents:
             if it.type == "PROPAGATE":
-                tail = dict(it.payload.get("tail", {}))
+                tail = it.payload.get("tail")
                 if tail:
                     self.send_tail(tail, src_addr=src_addr)
             elif it.type == "REQUEST_SYNC":
@@ -224,8 +679,34 @@ class Body:
                 # → emotion is held in the heart ←
                 pass
 
-        # Refresh Eyes →
-        _render_status(self.plex, self.head_id, "")
+        # Refresh Eyes → (coalesced; headless has none)
+        if self.eyes is not None:
+            self.eyes.mark()
+
+def _ring(sock: socket.socket, addr: Tuple[str, int]) -> None:
+    try:
+        sock.sendto(BELL, addr)
+    except OSError:
+        pass                                     # it naps SHM_NAP at most anyway
+
+def _cauterize(signum: int, frame: Any) -> None:
+    # SIGTERM leaves through the same door as Ctrl+C (rings unlinked, traces flushed)
+    raise KeyboardInterrupt
+
+def _pulse(body: Body) -> None:
+    while True:
+        time.sleep(PULSE_EVERY)
+        try:
+            body.pulse()
+        except Exception as e:
+            body.vitals.fault(e)
+
+def _bulk_dream(body: Body) -> bytes:
+    # What the TCP side channel hands out: the dream, in myelin
+    with body.lock:
+        payload = body.nurse.dream(body.plex, MYELIN, body.vitals)
+    body.vitals.bulk_out += 1
+    return payload
 
 class Receiver(threading.Thread):
     # Peripheral nerves → Stimulus → Storm Membrane → Heart → Intents → Actions
@@ -233,69 +714,153 @@ class Receiver(threading.Thread):
     def __init__(self, body: Body):
         super().__init__(daemon=True)
         self.body = body
+        self._pulling = threading.Lock()        # one bulk pull at a time
 
     def _handle_hunger(self, msg: Dict[str, Any], addr: Tuple[str, int]) -> None:
-        with self.body.lock:
-            tail_out = dict(self.body.plex.dream_state())
-        try:
-            self.body.sock.sendto(json.dumps(tail_out, separators=(",", ":")).encode("utf-8"), addr)
-        except Exception:
-            pass
-
-    def run(self) -> None:
-        while True:
+        body = self.body
+        if not body.nurse.allow(addr):
+            body.vitals.hunger_limited += 1
+            return
+        with body.lock:
+            payload = body.nurse.dream(body.plex, body.speaks.get(addr, JSON), body.vitals)
+        body.vitals.dreams_out += 1
+        com = body.commissure
+        if com is not None and com.local(addr) and com.send(payload, (addr[1],)):
+            return                               # co-resident: whole, however big
+        if body.bulk and len(payload) > WHOLE_MAX:
+            payload = manifest(payload)          # too big for chunks: come and get it
+        body._send(payload, addr)
+
+    def _pull(self, addr: Tuple[str, int]) -> None:
+        # Bulk: the dream over TCP, then sensed like any datagram
+        if not self._pulling.acquire(blocking=False):
+            return
+
+        def pull() -> None:
             try:
-                data, addr = self.body.sock.recvfrom(65535)
-                msg = json.loads(data.decode("utf-8"))
+                payload = fetch(addr)
+                if payload is not None:
+                    self.body.vitals.bulk_in += 1
+                    self.feel(payload, addr)
+            except Exception as e:
+                self.body.vitals.fault(e)
+            finally:
+                self._pulling.release()
+
+        threading.Thread(target=pull, daemon=True).start()
+
+    def feel(self, data: bytes, addr: Tuple[str, int]) -> None:
+        self.feel_many([(data, addr)])
+
+    def feel_many(self, batch: List[Tuple[Union[bytes, Skimmed], Tuple[str, int]]]) -> None:
+        body, vitals = self.body, self.body.vitals
+        with body.lock:
+            crown, envy = int(body.plex.state.crown), body.plex.envy
+        felt: List[Tuple[Dict[str, Any], Optional[bytes], Tuple[str, int]]] = []
+        batch = list(batch)
+        for raw, addr in batch:
+            if isinstance(raw, tuple):
+                data, sensed, tongue = raw       # skimmed off a ring, already felt
+            else:
+                data, tongue = raw, _tongue(raw)
+                sensed = _sense(data, crown, envy, lazy=True)
+                _felt(vitals, data, sensed, lazy=True)
+            # Answer in the tongue we were spoken to; a stranger gets our roster
+            _heard(body.speaks, addr, tongue)
+            if body.dendrites.touch(addr):
+                body.greet(addr)
+
+            if sensed is None:
+                continue
+            kind, key, msg = sensed
+            if kind in ("HUNGER", "PEERS"):
+                _heard(body.speaks, addr, tongue, msg)
 
-                if isinstance(msg, dict) and msg.get("type") == "HUNGER":
-                    self._handle_hunger(msg, addr)
-                    continue
+            if kind == "HUNGER":
+                self._handle_hunger(msg, addr)
+                continue
 
-                if not isinstance(msg, dict):
-                    continue
+            if kind == "PEERS":
+                for new in body.dendrites.learn(msg.get("peers") or ()):
+                    body.greet(new)
+                continue
 
-                # sanity
-                if "tallies" not in msg or "crown" not in msg:
+            if kind == "CHUNK":
+                if is_manifest(data):
+                    self._pull(addr)
                     continue
+                whole = body.suture.add(data, addr)
+                if whole is not None:
+                    batch.append((whole, addr))   # stitched: sensed in this same drain
+                continue
 
-# ============================================
-# Storm membrane (Skin)
-# ============================================
-                try:
-                    seen_key = json.dumps(
-                        {
-                            "id": msg.get("id", ""),
-                            "crown": int(msg.get("crown", 1) or 1),
-                            "tallies": dict(msg.get("tallies", {}) or {}),
-                        },
-                        sort_keys=True,
-                        separators=(",", ":"),
-                    )
-                except Exception:
-                    continue
+            gossip = body.gossip
+            if gossip is not None:
+                gossip.hear(key if kind == "ECHO" else _tail_key(msg))
+            if kind == "ECHO":
+                if gossip is not None:
+                    body.echo(key, addr)
+                continue
+            if body.engram is not None:
+                body.engram.hear(msg, data)
+            felt.append((msg, data, addr))
 
-                with self.body.lock:
-                    # If I'm envious, allow repeated dream hydration (no dedupe).
-                    if msg.get("is_dream") and self.body.plex.envy:
-                        pass
-                    else:
-                        if seen_key in SEEN_H:
-                            continue
-                    SEEN_H[seen_key] = None
-                    if len(SEEN_H) > SEEN_MAX:
-                        SEEN_H.pop(next(iter(SEEN_H)))
+        if not felt:
+            return
 
 # ============================================
 # Basal Ganglia (Nuclei)
 # ============================================
-                with self.body.lock:
-                    intents = self.body.plex.ingest(dict(msg))
-
-                self.body.execute_intents(intents, src_addr=addr)
+        plex = body.plex
+        with body.lock:
+            # Superseded tails never reach the heart; the rest land as one burst
+            tails, src, gated = _rouse(felt, plex, vitals)
+            if not tails:
+                return
+            envy, adopts = plex.envy, plex.adopts
+            # Freshly decoded → nobody else holds it → no copy
+            if len(tails) == 1:
+                intents = plex.ingest(tails[0])
+            else:
+                intents = plex.ingest_many(tails)
+            vitals.landed(len(tails), plex.adopts - adopts, gated, envy, plex.envy)
+
+        body.execute_intents(intents, src_addr=src)
+
+    def _drain(self) -> List[Tuple[Union[bytes, Skimmed], Tuple[str, int]]]:
+        # Block for the first datagram, then take whatever is already waiting
+        body = self.body
+        sock, com = body.sock, body.commissure
+        batch: List[Tuple[Union[bytes, Skimmed], Tuple[str, int]]] = []
+        flags = 0
+        if com is not None:
+            # Co-resident rings first, sensed where they lie; the socket
+            # wakes us sooner if it can
+            with body.lock:
+                crown, envy = int(body.plex.state.crown), body.plex.envy
+            batch = com.drain(lambda view: _skim(view, crown, envy, body.vitals))
+            if not batch and not select.select([sock], [], [], com.idle())[0]:
+                return batch
+            flags = socket.MSG_DONTWAIT
+        while len(batch) < BATCH_MAX:
+            try:
+                data, addr = sock.recvfrom(65535, flags)
+            except BlockingIOError:
+                break
+            flags = socket.MSG_DONTWAIT
+            if data != BELL:                     # a co-resident head rang: look at the rings
+                batch.append((data, addr))
+        return batch
 
-            except Exception:
-                continue
+    def run(self) -> None:
+        while True:
+            try:
+                batch = self._drain()
+                if batch:
+                    self.feel_many(batch)
+            except Exception as e:
+                # Counted and kept (vitals.last_fault); the nerve keeps firing
+                self.body.vitals.fault(e)
 
 # ============================================
 # Ribcage
@@ -306,17 +871,23 @@ def run_body(
     head_id: str,
     port: int,
     peers: List[Tuple[str, int]],
+    delta: bool = False,
+    wire: str = MYELIN,
+    gossip: Optional[Gossip] = None,
+    headless: bool = False,
+    fps: float = EYES_FPS,
+    vitals: Optional[str] = None,
+    vitals_dump: Optional[str] = None,
+    nurse: Optional[Nurse] = None,
+    bulk: bool = False,
+    shm: bool = False,
+    trace: Optional[str] = None,
 ) -> None:
     # Run the Shell with → Plexus heart
 
     head_id = str(head_id).upper()
 
-    global _selected_head_idx
-    try:
-        me = HEADS.index(head_id)
-        _selected_head_idx = (me + 1) % len(HEADS)
-    except ValueError:
-        _selected_head_idx = 0
+    _aim(head_id)
 
     sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
     sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 1 << 20)
@@ -324,12 +895,61 @@ def run_body(
     sock.bind(("0.0.0.0", int(port)))
 
     lock = threading.Lock()
-    body = Body(head_id=head_id, sock=sock, peers=list(peers), plex=heart, lock=lock)
+    body = Body(head_id=head_id, sock=sock, dendrites=Dendrites(peers, port), plex=heart,
+                lock=lock, wire=wire, gossip=gossip, nurse=nurse or Nurse(), bulk=bool(bulk))
+    if shm:
+        body.commissure = Commissure(port, lambda: list(body.dendrites.table), body.vitals,
+                                     bell=lambda addr: _ring(sock, addr))
+        body.vitals.gauges["shm_readers"] = lambda: len(body.commissure.readers)  # type: ignore[union-attr]
+    if trace:
+        body.engram = Engram(head_id, trace)
+    _monitor(body.vitals, heart, body.dendrites, vitals, vitals_dump)
+    if bulk:
+        serve_bulk(port, lambda: _bulk_dream(body))
+
+    signal.signal(signal.SIGTERM, _cauterize)
 
     # Fire nerves →
     Receiver(body).start()
+    threading.Thread(target=_pulse, args=(body,), daemon=True).start()
+
+    def act(cmd: Command) -> None:
+        if cmd == "HUNGER":
+            with lock:
+                my_crown = int(getattr(heart.state, "crown", 1) or 1)
+            body.send_hunger(my_crown, need_tail=True)
+        elif isinstance(cmd, tuple) and cmd[0] == "FEED":
+            _, to, amt = cmd
+            with lock:
+                tail_local = heart.propose(to, amt, delta=delta)
+                if body.engram is not None and not tail_local.get("is_dream"):
+                    body.engram.feed(tail_local)
+                intents = heart.ingest(tail_local)
+            body.execute_intents(intents)
+
+    # Headless: no eyes, no termios; the nerves do all the work, and a
+    # piped stdin may script FEEDs one line at a time
+    if headless:
+        act("HUNGER")
+        try:
+            if not sys.stdin.isatty():
+                for line in sys.stdin:
+                    cmd = _script(line, head_id)
+                    if cmd is not None:
+                        act(cmd)
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            if body.commissure is not None:
+                body.commissure.close()
+            if body.engram is not None:
+                body.engram.close()
+        return
 
     # Open eyes →
+    body.eyes = Eyes(heart, head_id, fps=fps)
+    threading.Thread(target=body.eyes.watch, daemon=True).start()
     with PRINT_LOCK:
         sys.stdout.write("\x1b[2J\x1b[H")
         sys.stdout.write(HIDE_CURSOR)
@@ -338,32 +958,19 @@ def run_body(
     _render_status(heart, head_id, "")
 
     # Awake → initial hunger →
-    with lock:
-        my_crown = int(getattr(heart.state, "crown", 1) or 1)
-    body.send_hunger(my_crown, need_tail=True)
+    act("HUNGER")
 
     try:
         while True:
-            cmd = _read_cmd(head_id, heart)
-
-            if cmd == "HUNGER":
-                with lock:
-                    my_crown = int(getattr(heart.state, "crown", 1) or 1)
-                body.send_hunger(my_crown, need_tail=True)
-                continue
-
-            if isinstance(cmd, tuple) and cmd[0] == "FEED":
-                _, to, amt = cmd
-
-                with lock:
-                    tail_local = heart.propose(to, amt)
-                    intents = heart.ingest(dict(tail_local))
-
-                body.execute_intents(intents)
+            act(_read_cmd(head_id, heart))
 
     except (KeyboardInterrupt, EOFError):
         print("\n\n\n  No Time. No Replay. No Logs.\n\n  Sniff.Snort..RAWR...bye\n\n")
     finally:
+        if body.commissure is not None:
+            body.commissure.close()
+        if body.engram is not None:
+            body.engram.close()
         with PRINT_LOCK:
             sys.stdout.write(SHOW_CURSOR)
             sys.stdout.flush()
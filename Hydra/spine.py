@@ -0,0 +1,514 @@
+# ============================================
+# Spine (Async Body) — Truth Through Erasure
+# No time. No replay. No logs.
+# ============================================
+"""
+The shell on one event loop. Datagrams arrive through a DatagramProtocol,
+keystrokes through add_reader, and both land on one queue drained by a
+single heart task: the only code that touches the plexus. No threads, no
+lock. A drained burst of tails goes through ingest_many and its intents
+collapse; sends are non-blocking; the HUD redraws once per burst.
+"""
+from __future__ import annotations
+import asyncio, os, signal, socket, stat, sys, termios, tty
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+from plexus import Intent
+from shell import (EYES_FPS, Eyes, Heart, HIDE_CURSOR, JSON, MYELIN, Nurse, PRINT_LOCK, SHOW_CURSOR, Command,
+                   _aim, _felt, _heard, _monitor, _motor, _offer, _payloads, _rouse,
+                   _script, _sense, _skim, _tail_key, _targets, _tongue, _wire)
+from ganglia import Ganglia
+from dendrite import PULSE_EVERY, Dendrites
+from suture import WHOLE_MAX, Suture, feed_bulk, fetch, is_manifest, manifest
+from commissure import BELL, Commissure, fan
+from engram import Engram
+from synapse import Gossip
+from thalamus import BATCH_MAX
+from vitals import Vitals
+
+Addr = Tuple[str, int]
+
+QUEUE_MAX = 65536      # past this, drop like the network would
+
+# ============================================
+# Peripheral nerves
+# ============================================
+class Nerve(asyncio.DatagramProtocol):
+    def __init__(self, queue: "asyncio.Queue[Tuple[Any, ...]]", vitals: Vitals,
+                 bell: Optional[asyncio.Event] = None,
+                 sock: Optional[socket.socket] = None) -> None:
+        self.queue = queue
+        self.vitals = vitals
+        self.bell = bell
+        self.sock = sock
+
+    def datagram_received(self, data: bytes, addr: Addr) -> None:
+        self._take(data, addr)
+        if self.sock is None:
+            return
+        # The transport reads one datagram a pass; take the rest of the burst
+        # now, so the heart lands it as one drain
+        for _ in range(BATCH_MAX - 1):
+            try:
+                data, addr = self.sock.recvfrom(65535)
+            except (BlockingIOError, InterruptedError):
+                return
+            except OSError as e:
+                self.error_received(e)
+                return
+            self._take(data, addr)
+
+    def _take(self, data: bytes, addr: Addr) -> None:
+        if data == BELL and self.bell is not None:
+            self.bell.set()                      # a co-resident head rang: look at the rings
+            return
+        try:
+            self.queue.put_nowait(("DATA", data, addr))
+        except asyncio.QueueFull:
+            self.vitals.drops += 1
+
+    def error_received(self, exc: Exception) -> None:
+        # ICMP unreachable from a dead peer: UDP shrugs, vitals count it
+        self.vitals.tx_errors += 1
+
+# ============================================
+# Spine
+# ============================================
+class Spine:
+    def __init__(self, heart: Heart, head_id: str, peers: List[Addr], port: int = 0,
+                 delta: bool = False, wire: str = MYELIN,
+                 gossip: Optional[Gossip] = None, eyes: bool = True,
+                 fps: float = EYES_FPS, nurse: Optional[Nurse] = None,
+                 bulk: bool = False) -> None:
+        self.plex = heart
+        self.head_id = head_id
+        self.vitals = Vitals()
+        self.dendrites = Dendrites(peers, port, self.vitals)
+        self.delta = bool(delta)
+        self.wire = wire
+        self.speaks: Dict[Addr, str] = {}
+        self.gossip = gossip
+        self.ganglia: Optional[Ganglia] = None
+        self.queue: "asyncio.Queue[Tuple[Any, ...]]" = asyncio.Queue(QUEUE_MAX)
+        self.transport: Any = None              # anything with sendto(payload, addr)
+        self.stop = asyncio.Event()
+        self.nurse = nurse or Nurse()
+        self.suture = Suture(self.vitals)
+        self.bulk = bool(bulk)
+        self.commissure: Optional[Commissure] = None
+        self.engram: Optional[Engram] = None
+        self.bell = asyncio.Event()
+        self._pulling: Optional["asyncio.Task[None]"] = None
+        self.eyes = Eyes(heart, head_id, fps=fps) if eyes and sys.stdout.isatty() else None
+        self._blinking = False
+        self._keys = ""
+
+    # Efferents (non-blocking)
+    def _sendto(self, payload: bytes, addr: Addr) -> None:
+        if self.transport is None:
+            return
+        dgrams = self.suture.cut(payload)
+        if len(dgrams) > 1:
+            self.vitals.chunks_out += len(dgrams)
+        for dgram in dgrams:
+            try:
+                self.transport.sendto(dgram, addr)
+            except OSError:
+                self.vitals.tx_errors += 1
+                return
+            self.vitals.tx += 1
+            self.vitals.tx_bytes += len(dgram)
+
+    def _sendto_raw(self, payload: bytes, addr: Addr) -> None:
+        try:
+            self.transport.sendto(payload, addr)
+        except OSError:
+            pass
+
+    def send_tail(self, tail: Mapping[str, Any], src_addr: Optional[Addr] = None) -> None:
+        peers = _targets(self.gossip, tail, self.dendrites.reach(), src_addr)
+        pairs = _payloads(tail, peers, self.speaks)
+        if self.engram is not None:
+            pairs = self.engram.mark(tail, pairs)
+        fan(pairs, self.commissure, self._sendto)
+
+    def greet(self, addr: Addr) -> None:
+        payload = _wire(_offer(self.dendrites.roster(addr), self.wire), self.speaks.get(addr, JSON))
+        fan(((addr, payload),), self.commissure, self._sendto)
+
+    def pulse(self) -> None:
+        # Heartbeat on the loop, every PULSE_EVERY seconds
+        try:
+            for addr in self.dendrites.reach():
+                self.greet(addr)
+        except Exception as e:
+            self.vitals.fault(e)
+        asyncio.get_running_loop().call_later(PULSE_EVERY, self.pulse)
+
+    def send_hunger(self, crown: int, need_tail: bool) -> None:
+        msg = {"type": "HUNGER", "id": self.head_id, "crown": int(crown), "need_tail": bool(need_tail)}
+        self.vitals.hunger_out += 1
+        fan(_payloads(_offer(msg, self.wire), self.dendrites.reach(), self.speaks), self.commissure, self._sendto)
+
+    def execute_intents(self, intents: List[Intent], src_addr: Optional[Addr] = None) -> None:
+        for it in intents:
+            if it.type == "PROPAGATE":
+                tail = it.payload.get("tail")
+                if tail:
+                    self.send_tail(tail, src_addr=src_addr)
+            elif it.type == "REQUEST_SYNC":
+                # Same flicker guard as the threaded body
+                if it.payload.get("need_tail") or self.plex.envy:
+                    self.send_hunger(int(it.payload.get("crown", 1) or 1), need_tail=True)
+        self._look()
+
+    # Heart task: the single writer
+    async def beat(self) -> None:
+        while True:
+            batch = [await self.queue.get()]
+            while len(batch) < BATCH_MAX:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+            try:
+                self._digest(batch)
+            except Exception as e:
+                # The heart task must outlive a bad burst; vitals keep the fault
+                self.vitals.fault(e)
+            if self.ganglia is not None:
+                self.ganglia.publish(self.plex.state.crown, self.plex.envy)
+            self._redraw()
+
+    def _digest(self, batch: List[Tuple[Any, ...]]) -> None:
+        felt: List[Tuple[Dict[str, Any], Optional[bytes], Addr]] = []
+        for item in batch:
+            if item[0] == "CMD":
+                # Keep order: land the tails that came before the keystroke
+                self._ingest(felt)
+                felt = []
+                self._command(item[1])
+                continue
+            if item[0] == "DATA":
+                _, data, addr = item
+                tongue = _tongue(data)
+                _heard(self.speaks, addr, tongue)
+                if self.dendrites.touch(addr):
+                    self.greet(addr)
+                sensed = _sense(data, int(self.plex.state.crown), self.plex.envy, lazy=True)
+                _felt(self.vitals, data, sensed, lazy=True)
+                if sensed is None:
+                    continue
+                kind, key, msg = sensed
+            else:
+                # Sensed by a ganglion, past the heart's membrane in drain(),
+                # or skimmed off a co-resident ring with the bytes it needs
+                _, kind, key, msg, addr, tongue = item[:6]
+                _heard(self.speaks, addr, tongue)
+                if self.dendrites.touch(addr):
+                    self.greet(addr)
+                data = item[6] if len(item) > 6 else None   # a worker's tail arrives sensed
+                if kind == "CHUNK" and data is None:
+                    data = msg                   # raw: stitched here, not in a worker
+
+            if kind in ("HUNGER", "PEERS"):
+                _heard(self.speaks, addr, tongue, msg)
+            if kind == "HUNGER":
+                if not self.nurse.allow(addr):
+                    self.vitals.hunger_limited += 1
+                    continue
+                payload = self.nurse.dream(self.plex, self.speaks.get(addr, JSON), self.vitals)
+                self.vitals.dreams_out += 1
+                com = self.commissure
+                if com is not None and com.local(addr) and com.send(payload, (addr[1],)):
+                    continue                     # co-resident: whole, however big
+                if self.bulk and len(payload) > WHOLE_MAX:
+                    payload = manifest(payload)  # too big for chunks: come and get it
+                self._sendto(payload, addr)
+                continue
+            if kind == "PEERS":
+                for new in self.dendrites.learn(msg.get("peers") or ()):
+                    self.greet(new)
+                continue
+            if kind == "CHUNK":
+                self._stitch(data, addr)
+                continue
+            if self.gossip is not None:
+                self.gossip.hear(key if kind == "ECHO" else _tail_key(msg))
+            if kind == "ECHO":
+                cur = self.plex.tail
+                if self.gossip is not None and cur is not None and _tail_key(cur) == key:
+                    self.send_tail(cur, src_addr=addr)   # gossip pushes on
+                continue
+            if self.engram is not None and data is not None:
+                self.engram.hear(msg, data)
+            felt.append((msg, data, addr))
+        self._ingest(felt)
+
+    def _ingest(self, felt: List[Tuple[Dict[str, Any], Optional[bytes], Addr]]) -> None:
+        if not felt:
+            return
+        plex = self.plex
+        # Superseded tails never reach the heart; survivors are fleshed here
+        tails, src, gated = _rouse(felt, plex, self.vitals)
+        if not tails:
+            return
+        envy, adopts = plex.envy, plex.adopts
+        if len(tails) == 1:
+            intents = plex.ingest(tails[0])
+        else:
+            intents = plex.ingest_many(tails)
+        self.vitals.landed(len(tails), plex.adopts - adopts, gated, envy, plex.envy)
+        # One source for the whole burst → don't echo back to it
+        self.execute_intents(intents, src_addr=src)
+
+    def _command(self, cmd: Command) -> None:
+        if cmd == "HUNGER":
+            self.send_hunger(int(getattr(self.plex.state, "crown", 1) or 1), need_tail=True)
+        elif isinstance(cmd, tuple) and cmd[0] == "FEED":
+            _, to, amt = cmd
+            tail_local = self.plex.propose(to, amt, delta=self.delta)
+            if self.engram is not None and not tail_local.get("is_dream"):
+                self.engram.feed(tail_local)
+            self.execute_intents(self.plex.ingest(tail_local))
+
+    # Suture (chunks, bulk)
+    def _stitch(self, data: bytes, addr: Addr) -> None:
+        if is_manifest(data):
+            if self._pulling is None:
+                self._pulling = asyncio.get_running_loop().create_task(self._pull(addr))
+            return
+        whole = self.suture.add(data, addr)
+        if whole is not None:
+            self._refeel(whole, addr)
+
+    async def _pull(self, addr: Addr) -> None:
+        try:
+            payload = await asyncio.get_running_loop().run_in_executor(None, fetch, addr)
+        finally:
+            self._pulling = None
+        if payload is not None:
+            self.vitals.bulk_in += 1
+            self._refeel(payload, addr)
+
+    def _refeel(self, payload: bytes, addr: Addr) -> None:
+        # Back through the nerves, as if it had arrived whole
+        try:
+            self.queue.put_nowait(("DATA", payload, addr))
+        except asyncio.QueueFull:
+            self.vitals.drops += 1
+
+    def bulk_dream(self) -> bytes:
+        self.vitals.bulk_out += 1
+        return self.nurse.dream(self.plex, MYELIN, self.vitals)
+
+    # Ganglia (sensed in worker processes)
+    def on_ganglia(self) -> None:
+        for record in self.ganglia.drain(self.vitals):
+            try:
+                self.queue.put_nowait(("SENSED",) + record)
+            except asyncio.QueueFull:
+                self.vitals.drops += 1
+
+    # Commissure (co-resident rings, polled on the loop)
+    async def listen(self) -> None:
+        com = self.commissure
+        assert com is not None
+        while True:
+            self.bell.clear()
+            try:
+                # Sensed where they lie; only a tail's or chunk's bytes are copied
+                crown, envy = int(self.plex.state.crown), self.plex.envy
+                skim = lambda view: _skim(view, crown, envy, self.vitals)
+                for (data, (kind, key, msg), tongue), addr in com.drain(skim):
+                    try:
+                        self.queue.put_nowait(("SENSED", kind, key, msg, addr, tongue, data))
+                    except asyncio.QueueFull:
+                        self.vitals.drops += 1
+            except Exception as e:
+                self.vitals.fault(e)
+            try:
+                await asyncio.wait_for(self.bell.wait(), com.idle())
+            except asyncio.TimeoutError:
+                pass
+
+    # Motor neurons (stdin on the loop)
+    def on_keys(self, fd: int) -> None:
+        data = os.read(fd, 1024)
+        if not data:
+            self.stop.set()
+            return
+        self._keys += data.decode("utf-8", errors="ignore")
+        while self._keys:
+            n = 3 if self._keys[0] == "\x1b" else 1
+            if len(self._keys) < n:
+                break                            # half an arrow key; wait
+            keys, self._keys = self._keys[:n], self._keys[n:]
+            try:
+                cmd = _motor(keys, self.head_id)
+            except KeyboardInterrupt:
+                self.stop.set()
+                return
+            if cmd is not None:
+                try:
+                    self.queue.put_nowait(("CMD", cmd))
+                except asyncio.QueueFull:
+                    pass
+            self._look()
+        self._redraw()
+
+    # Headless motor neurons (piped stdin, one command per line)
+    def on_script(self, fd: int) -> None:
+        data = os.read(fd, 65536)
+        if not data:
+            asyncio.get_running_loop().remove_reader(fd)
+            return
+        self._keys += data.decode("utf-8", errors="ignore")
+        *lines, self._keys = self._keys.split("\n")
+        for line in lines:
+            cmd = _script(line, self.head_id)
+            if cmd is not None:
+                try:
+                    self.queue.put_nowait(("CMD", cmd))
+                except asyncio.QueueFull:
+                    pass
+
+    # Eyes (coalesced, capped at fps)
+    def _look(self) -> None:
+        if self.eyes is not None:
+            self.eyes.dirty = True
+
+    def _redraw(self) -> None:
+        if self.eyes is None or self._blinking:
+            return
+        wait = self.eyes.blink()
+        if wait:
+            self._blinking = True
+            asyncio.get_running_loop().call_later(wait, self._reblink)
+
+    def _reblink(self) -> None:
+        self._blinking = False
+        self._redraw()
+
+async def _live(heart: Heart, head_id: str, port: int, peers: List[Addr],
+                delta: bool, wire: str, gossip: Optional[Gossip], workers: int,
+                headless: bool, fps: float, vitals: Optional[str],
+                vitals_dump: Optional[str], nurse: Optional[Nurse], bulk: bool,
+                shm: bool, trace: Optional[str]) -> None:
+    loop = asyncio.get_running_loop()
+    spine = Spine(heart, head_id, peers, port, delta=delta, wire=wire, gossip=gossip,
+                  eyes=not headless, fps=fps, nurse=nurse, bulk=bulk)
+
+    transport = None
+    if workers:
+        # Parsing across cores; this process only beats the heart
+        spine.ganglia = spine.transport = Ganglia(port, workers, echoes=gossip is not None)
+        spine.ganglia.publish(heart.state.crown, heart.envy)
+        spine.vitals.pulses = spine.ganglia.pulses
+        loop.add_reader(spine.ganglia.bell, spine.on_ganglia)
+    else:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 1 << 20)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 1 << 20)
+        sock.bind(("0.0.0.0", int(port)))
+        sock.setblocking(False)
+        transport, _ = await loop.create_datagram_endpoint(
+            lambda: Nerve(spine.queue, spine.vitals, spine.bell, sock), sock=sock)
+        spine.transport = transport
+
+    spine.vitals.gauges.update(queue=spine.queue.qsize, workers=lambda: workers)
+    listen = None
+    if shm:
+        # Ganglia workers hold the socket: nobody could hear a bell, so never nap
+        ring = None if workers else (lambda addr: spine._sendto_raw(BELL, addr))
+        com = spine.commissure = Commissure(port, lambda: list(spine.dendrites.table),
+                                            spine.vitals, bell=ring)
+        spine.vitals.gauges["shm_readers"] = lambda: len(com.readers)
+        listen = asyncio.create_task(spine.listen())
+    if trace:
+        spine.engram = Engram(head_id, trace)
+    _monitor(spine.vitals, heart, spine.dendrites, vitals, vitals_dump)
+    bulk_srv = None
+    if bulk:
+        bulk_srv = await asyncio.start_server(
+            lambda r, w: feed_bulk(r, w, spine.bulk_dream), port=int(port), reuse_address=True)
+
+    # SIGTERM leaves through the same door as Ctrl+C (rings unlinked, tty restored)
+    loop.add_signal_handler(signal.SIGTERM, spine.stop.set)
+
+    fd, old = sys.stdin.fileno(), None
+    if not headless and sys.stdin.isatty():
+        old = termios.tcgetattr(fd)
+        tty.setcbreak(fd)
+        loop.add_reader(fd, spine.on_keys, fd)
+    elif headless and stat.S_ISFIFO(os.fstat(fd).st_mode):
+        loop.add_reader(fd, spine.on_script, fd)
+
+    # Open eyes →
+    if spine.eyes is not None:
+        with PRINT_LOCK:
+            sys.stdout.write("\x1b[2J\x1b[H")
+            sys.stdout.write(HIDE_CURSOR)
+            sys.stdout.flush()
+    spine._redraw()
+
+    # Awake → initial hunger →
+    spine.send_hunger(int(getattr(heart.state, "crown", 1) or 1), need_tail=True)
+
+    beat = asyncio.create_task(spine.beat())
+    loop.call_later(PULSE_EVERY, spine.pulse)
+    try:
+        await spine.stop.wait()
+    finally:
+        beat.cancel()
+        if listen is not None:
+            listen.cancel()
+        if spine.commissure is not None:
+            spine.commissure.close()
+        if spine.engram is not None:
+            spine.engram.close()
+        if old is not None:
+            loop.remove_reader(fd)
+            termios.tcsetattr(fd, termios.TCSADRAIN, old)
+        if spine.ganglia is not None:
+            loop.remove_reader(spine.ganglia.bell)
+            spine.ganglia.close()
+        if transport is not None:
+            transport.close()
+        if bulk_srv is not None:
+            bulk_srv.close()
+
+def run_spine(
+    *,
+    heart: Heart,
+    head_id: str,
+    port: int,
+    peers: List[Addr],
+    delta: bool = False,
+    wire: str = MYELIN,
+    gossip: Optional[Gossip] = None,
+    workers: int = 0,
+    headless: bool = False,
+    fps: float = EYES_FPS,
+    vitals: Optional[str] = None,
+    vitals_dump: Optional[str] = None,
+    nurse: Optional[Nurse] = None,
+    bulk: bool = False,
+    shm: bool = False,
+    trace: Optional[str] = None,
+) -> None:
+    # Same head as shell.run_body, on one event loop; workers > 0 senses
+    # datagrams in that many processes (ganglia.py)
+    head_id = str(head_id).upper()
+    _aim(head_id)
+    try:
+        asyncio.run(_live(heart, head_id, port, peers, delta, wire, gossip, workers,
+                          headless, fps, vitals, vitals_dump, nurse, bulk, shm, trace))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if not headless:
+            print("\n\n\n  No Time. No Replay. No Logs.\n\n  Sniff.Snort..RAWR...bye\n\n")
+            with PRINT_LOCK:
+                sys.stdout.write(SHOW_CURSOR)
+                sys.stdout.flush()
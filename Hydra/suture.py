@@ -0,0 +1,252 @@
+# ============================================
+# Suture (Chunks) — Truth Through Erasure
+# No time. No replay. No logs.
+# ============================================
+"""
+Hydration for books bigger than a datagram. A payload over WHOLE_MAX is
+cut into CHUNK datagrams (myelin.chunk) that each carry the payload's
+blake2b digest, its length, an index and a count. The receiver stitches
+them per source and digest. Only a stitched payload whose length and digest
+both check out is passed on, and it is sensed as if it had arrived whole.
+
+Every cut but the last is full, so a chunk's length, count and total must
+agree before it opens a wound: a forged count can't reserve more slots than
+the payload has bytes. Open wounds are bounded: at most SUTURE_STREAMS at
+once, SUTURE_BYTES in total (payload and slots), and each is dropped
+SUTURE_TTL seconds after its last chunk. Late copies of a stitched stream
+are dropped for as long, rather than opening a wound that can never close.
+There is no retransmit. A lost chunk tears the stream, and the head hungers
+again like it would after any lost datagram.
+
+Chunks are best-effort. A whole stream has to fit in the hungry head's
+socket buffer while it drains: a few hundred KB hydrate reliably, while a
+few MB of chunks overrun it. For big books a head can run --bulk. It then
+answers a big HUNGER with a manifest (count 0), and the hungry head pulls
+the dream over TCP from the same port number:
+
+    [length u64][digest u64][payload]
+"""
+from __future__ import annotations
+import socket, struct, threading, time
+from hashlib import blake2b
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import myelin
+from vitals import Vitals
+
+Addr = Tuple[str, int]
+
+WHOLE_MAX = 60000           # bytes; anything that fits still goes whole
+CHUNK_BYTES = 1200          # fragment per datagram: under a typical MTU
+SUTURE_STREAMS = 8
+SUTURE_BYTES = 64 << 20
+SUTURE_TTL = 5.0            # seconds since the last chunk
+SLOT_BYTES = 8              # charged per fragment slot a wound holds
+BULK_MAX = 256 << 20
+BULK_TIMEOUT = 10.0
+
+_FRAME = struct.Struct("!QQ")
+
+def content_digest(payload: bytes) -> int:
+    return int.from_bytes(blake2b(payload, digest_size=8).digest(), "big")
+
+# ============================================
+# Cut
+# ============================================
+def fragments(payload: bytes, size: int = CHUNK_BYTES) -> List[bytes]:
+    """CHUNK datagrams for one payload."""
+    digest, total = content_digest(payload), len(payload)
+    count = (total + size - 1) // size
+    view = memoryview(payload)
+    return [myelin.chunk(digest, total, i, count, view[i * size:(i + 1) * size])
+            for i in range(count)]
+
+def manifest(payload: bytes) -> bytes:
+    # count 0: too big to chunk well; pull it over TCP
+    return myelin.chunk(content_digest(payload), len(payload), 0, 0)
+
+def is_manifest(data: bytes) -> bool:
+    got = myelin.unchunk(data)
+    return got is not None and got[3] == 0
+
+# ============================================
+# Stitch
+# ============================================
+def _step(total: int, index: int, count: int, n: int) -> Optional[int]:
+    # The fragment size one chunk implies (every cut but the last is full),
+    # or None if its length can't belong to a `total`-byte payload
+    if count == 1:
+        return n if n == total else None
+    if index < count - 1:
+        return n if n and (count - 1) * n < total <= count * n else None
+    step, rest = divmod(total - n, count - 1)
+    return step if 0 < n <= step and not rest else None
+
+class _Wound:
+    __slots__ = ("total", "step", "cost", "parts", "have", "size", "last")
+
+    def __init__(self, total: int, count: int, step: int, now: float) -> None:
+        self.total = total
+        self.step = step
+        self.cost = total + SLOT_BYTES * count
+        self.parts: List[Optional[bytes]] = [None] * count
+        self.have = 0
+        self.size = 0
+        self.last = now
+
+class Suture:
+    """Reassembles CHUNK streams per (source, digest), within bounds, and
+    cuts this head's own payloads for the wire."""
+
+    def __init__(self, vitals: Optional[Vitals] = None, streams: int = SUTURE_STREAMS,
+                 max_bytes: int = SUTURE_BYTES, ttl: float = SUTURE_TTL) -> None:
+        self.vitals = vitals if vitals is not None else Vitals()
+        self.streams = max(1, int(streams))
+        self.max_bytes = int(max_bytes)
+        self.ttl = float(ttl)
+        self.open: Dict[Tuple[Addr, int], _Wound] = {}
+        self.healed: Dict[Tuple[Addr, int], float] = {}   # stitched → when
+        self.held = 0
+        self.last: Tuple[Optional[bytes], List[bytes]] = (None, [])
+
+    def cut(self, payload: bytes) -> Sequence[bytes]:
+        """What actually goes on the wire for one send. The last cut is kept,
+        so a dream or tail fanned out to N peers is sliced once."""
+        if len(payload) <= WHOLE_MAX:
+            return (payload,)
+        held, frags = self.last                  # one read: swapped whole, never torn
+        if held is not payload:
+            frags = fragments(payload)
+            self.last = (payload, frags)
+        return frags
+
+    def _tear(self, key: Tuple[Addr, int]) -> None:
+        wound = self.open.pop(key)
+        self.held -= wound.cost
+        self.vitals.torn += 1
+
+    def _reap(self, now: float) -> None:
+        for key in [k for k, w in self.open.items() if now - w.last > self.ttl]:
+            self._tear(key)
+        while self.healed and now - next(iter(self.healed.values())) > self.ttl:
+            self.healed.pop(next(iter(self.healed)))
+
+    def add(self, data: bytes, addr: Addr) -> Optional[bytes]:
+        """One CHUNK in → the whole payload once the last one lands, else None."""
+        cut = myelin.unchunk(data)
+        if cut is None:
+            self.vitals.decode_failures += 1
+            return None
+        digest, total, index, count, frag = cut
+        self.vitals.chunks_in += 1
+        now = time.monotonic()
+        self._reap(now)
+        if not count or index >= count or count > total:
+            return None
+        step = _step(total, index, count, len(frag))
+        cost = total + SLOT_BYTES * count
+        if step is None or cost > self.max_bytes:
+            return None
+
+        key = (addr, digest)
+        if key in self.healed:
+            return None                          # a late copy of a stitched stream
+        wound = self.open.get(key)
+        if wound is None:
+            # Oldest wound gives way to a new one
+            while self.open and (len(self.open) >= self.streams
+                                 or self.held + cost > self.max_bytes):
+                self._tear(next(iter(self.open)))
+            wound = self.open[key] = _Wound(total, count, step, now)
+            self.held += cost
+        if len(wound.parts) != count or wound.total != total or wound.step != step:
+            return None
+        wound.last = now
+        if wound.parts[index] is None:
+            wound.size += len(frag)
+            if wound.size > total:
+                self._tear(key)
+                return None
+            wound.parts[index] = bytes(frag)
+            wound.have += 1
+        if wound.have < count:
+            return None
+
+        del self.open[key]
+        self.held -= wound.cost
+        self.healed[key] = now
+        if len(self.healed) > self.streams:
+            self.healed.pop(next(iter(self.healed)))
+        payload = b"".join(wound.parts)          # type: ignore[arg-type]
+        if len(payload) != total or content_digest(payload) != digest:
+            self.vitals.torn += 1
+            return None
+        self.vitals.sutured += 1
+        return payload
+
+# ============================================
+# Bulk (TCP side channel)
+# ============================================
+def _frame(payload: bytes) -> bytes:
+    return _FRAME.pack(len(payload), content_digest(payload)) + payload
+
+def serve_bulk(port: int, supply: Callable[[], bytes]) -> threading.Thread:
+    """Threaded body: every connection gets the current dream, framed."""
+    srv = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    srv.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    srv.bind(("0.0.0.0", int(port)))
+    srv.listen(16)
+
+    def one(conn: socket.socket) -> None:
+        try:
+            conn.settimeout(BULK_TIMEOUT)
+            conn.sendall(_frame(supply()))
+        except OSError:
+            pass
+        finally:
+            conn.close()
+
+    def loop() -> None:
+        while True:
+            conn, _ = srv.accept()
+            threading.Thread(target=one, args=(conn,), daemon=True).start()
+
+    t = threading.Thread(target=loop, daemon=True, name="bulk")
+    t.start()
+    return t
+
+async def feed_bulk(reader: Any, writer: Any, supply: Callable[[], bytes]) -> None:
+    """Spine: the same, as an asyncio.start_server handler."""
+    try:
+        writer.write(_frame(supply()))
+        await writer.drain()
+    except OSError:
+        pass
+    finally:
+        writer.close()
+
+def fetch(addr: Addr, timeout: float = BULK_TIMEOUT) -> Optional[bytes]:
+    """Blocking pull of a peer's dream; None if short, oversized or torn."""
+    try:
+        with socket.create_connection(addr, timeout=timeout) as s:
+            head = _recv(s, _FRAME.size)
+            if head is None:
+                return None
+            size, digest = _FRAME.unpack(head)
+            if size > BULK_MAX:
+                return None
+            payload = _recv(s, size)
+    except OSError:
+        return None
+    if payload is None or content_digest(payload) != digest:
+        return None
+    return payload
+
+def _recv(s: socket.socket, n: int) -> Optional[bytes]:
+    buf = bytearray()
+    while len(buf) < n:
+        part = s.recv(min(n - len(buf), 1 << 20))
+        if not part:
+            return None
+        buf += part
+    return bytes(buf)
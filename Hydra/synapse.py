@@ -0,0 +1,173 @@
+# ============================================
+# Synapse (Gossip) — Truth Through Erasure
+# No time. No replay. No logs.
+# ============================================
+"""
+Epidemic fan-out for PROPAGATE. Flood sends every tail to every peer and
+every receiver does the same: O(N²) datagrams a proposal. Gossip sends to
+k peers, sampled at random or deterministically per crown, and keeps
+pushing a tail to k more each time a copy comes back, until it has been
+heard m times; then the synapse goes quiet.
+
+    python synapse.py --heads 50 --fanout 3 --suppress 3
+
+measures datagrams and time-to-coverage, flood against gossip, on an
+in-process swarm of plexus hearts with per-datagram latency.
+"""
+from __future__ import annotations
+import argparse, heapq, json, random, sys
+from hashlib import blake2b
+from typing import Any, Dict, Hashable, List, Mapping, Optional, Sequence, Tuple
+
+from plexus import plexus
+
+Peer = Tuple[str, int]
+SAMPLING = ("random", "crown")
+HEARD_MAX = 4096
+
+class Gossip:
+    def __init__(self, fanout: int = 3, suppress: int = 3,
+                 sampling: str = "random", seed: Optional[int] = None,
+                 head_id: str = "") -> None:
+        if int(fanout) < 1:
+            raise ValueError("fanout must be at least 1")
+        if sampling not in SAMPLING:
+            raise ValueError(f"sampling must be one of {SAMPLING}")
+        self.fanout = int(fanout)
+        self.suppress = int(suppress)           # 0 → never go quiet
+        self.sampling = sampling
+        self.head_id = str(head_id)
+        self.rng = random.Random(seed)
+        self.heard: Dict[Hashable, int] = {}
+
+    def hear(self, key: Hashable) -> int:
+        # Copies of a tail that reached us, first one included. key: the
+        # tail's name (_key), whichever tongue carried the copy
+        n = self.heard.pop(key, 0) + 1
+        self.heard[key] = n
+        if len(self.heard) > HEARD_MAX:
+            self.heard.pop(next(iter(self.heard)))
+        return n
+
+    def forward(self, key: Hashable) -> bool:
+        return self.suppress <= 0 or self.heard.get(key, 0) < self.suppress
+
+    def targets(self, tail: Mapping[str, Any], key: Hashable, peers: Sequence[Hashable],
+                exclude: Optional[Hashable] = None) -> List[Any]:
+        pool = [p for p in peers if p != exclude]
+        if len(pool) <= self.fanout:
+            return pool
+        if self.sampling == "random":
+            return self.rng.sample(pool, self.fanout)
+        # Deterministic: rendezvous rank keyed by head, crown, tail and round,
+        # so each crown (and each re-push) lands on a different k
+        salt = f"{self.head_id}|{tail.get('crown')}|{key}|{self.heard.get(key, 0)}|"
+        rank = lambda p: blake2b((salt + str(p)).encode("utf-8"), digest_size=8).digest()
+        return sorted(pool, key=rank)[:self.fanout]
+
+# ============================================
+# Measurement
+# ============================================
+def _key(tail: Mapping[str, Any]) -> str:
+    # One name per tail for every copy of it: shell, womb and the measurement
+    return f"{tail.get('id', '')}|{int(tail.get('crown', 1) or 1)}|{tail.get('digest')}"
+
+def spread(heads: int, gossip: Optional[Dict[str, Any]] = None, seed: int = 0,
+           latency: Tuple[float, float] = (1.0, 5.0)) -> Dict[str, Any]:
+    """One FEED into a swarm of `heads`; flood when gossip is None."""
+    rng = random.Random(seed)
+    names = [f"H{i}" for i in range(heads)]
+    hearts = {h: plexus(head_id=h, initial_tallies={n: 10 for n in names}) for h in names}
+    synapse = {h: Gossip(seed=rng.random(), head_id=h, **gossip) for h in names} if gossip else {}
+    seen: Dict[str, set] = {h: set() for h in names}
+    events: List[Tuple[float, int, str, str, Any]] = []
+    sent, seq = 0, 0
+    covered: Dict[str, float] = {}
+
+    def send(src: str, tail: Mapping[str, Any], now: float, exclude: Optional[str]) -> None:
+        nonlocal sent, seq
+        key = _key(tail)
+        if src in synapse:
+            if not synapse[src].forward(key):
+                return
+            dst = synapse[src].targets(tail, key, names, exclude)
+        else:
+            dst = [p for p in names if p != exclude]
+        for d in dst:
+            if d == src:
+                continue
+            sent += 1
+            seq += 1
+            heapq.heappush(events, (now + rng.uniform(*latency), seq, d, src, tail))
+
+    origin = names[0]
+    tail = hearts[origin].propose(names[1], 1)
+    hearts[origin].ingest(tail)
+    covered[origin] = 0.0
+    if origin in synapse:
+        synapse[origin].hear(_key(tail))
+    send(origin, tail, 0.0, None)
+
+    while events:
+        now, _, dst, src, tail = heapq.heappop(events)
+        key = _key(tail)
+        if dst in synapse:
+            synapse[dst].hear(key)
+        if key in seen[dst]:
+            # Storm membrane hit; gossip pushes on until it has heard enough
+            cur = hearts[dst].tail
+            if dst in synapse and cur is not None and _key(cur) == key:
+                send(dst, cur, now, src)
+            continue
+        seen[dst].add(key)
+        for it in hearts[dst].ingest(tail):
+            if it.type == "PROPAGATE":
+                covered.setdefault(dst, now)
+                send(dst, it.payload["tail"], now, src)
+
+    times = sorted(covered.values())
+    return {
+        "datagrams": sent,
+        "coverage": len(covered) / heads,
+        "t50": times[len(times) // 2],
+        "t_full": times[-1] if len(covered) == heads else None,
+    }
+
+def compare(heads: int, fanout: int, suppress: int, sampling: str,
+            trials: int, seed: int) -> Dict[str, Any]:
+    out: Dict[str, Any] = {}
+    for mode, gossip in (("flood", None),
+                         ("gossip", {"fanout": fanout, "suppress": suppress,
+                                     "sampling": sampling})):
+        runs = [spread(heads, gossip, seed=seed + i) for i in range(trials)]
+        full = [r["t_full"] for r in runs if r["t_full"] is not None]
+        out[mode] = {
+            "datagrams": round(sum(r["datagrams"] for r in runs) / trials, 1),
+            "coverage": round(sum(r["coverage"] for r in runs) / trials, 4),
+            "full_coverage_runs": len(full),
+            "t50": round(sum(r["t50"] for r in runs) / trials, 2),
+            "t_full": round(sum(full) / len(full), 2) if full else None,
+        }
+    return {"heads": heads, "fanout": fanout, "suppress": suppress,
+            "sampling": sampling, "trials": trials, **out}
+
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(prog="synapse.py")
+    ap.add_argument("--heads", type=int, nargs="*", default=[10, 50, 200],
+                    help="Swarm sizes (default 10 50 200)")
+    ap.add_argument("--fanout", type=int, default=3, help="Gossip fanout k (default 3)")
+    ap.add_argument("--suppress", type=int, default=3,
+                    help="Go quiet after hearing a tail this many times (default 3)")
+    ap.add_argument("--sampling", choices=SAMPLING, default="random")
+    ap.add_argument("--trials", type=int, default=10, help="Runs per size (default 10)")
+    ap.add_argument("--seed", type=int, default=7)
+    args = ap.parse_args(argv)
+
+    for n in args.heads:
+        r = compare(int(n), args.fanout, args.suppress, args.sampling,
+                    int(args.trials), int(args.seed))
+        print(json.dumps(r, sort_keys=True))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,158 @@
+# ============================================
+# Thalamus (Relay) — Truth Through Erasure
+# No time. No replay. No logs.
+# ============================================
+"""
+The receive stage between the skin and the heart. A body drains every
+datagram already waiting, senses them on their headers alone, and hands the
+tails here. Under the overwrite law most of a burst is dead on arrival:
+once a later tail in the same drain will overwrite the tetron, everything
+before it would only be adopted, propagated and erased. relay() walks the
+law on headers (crown window, digest, delta base) and keeps the last
+overwrite and what follows it, plus whatever earlier tails the crown needs
+to step through to reach it. The heart then ingests, and the shell
+propagates, only the survivors. Their tallies are the only ones parsed.
+
+An envious heart is waiting for a dream. When a drain holds dreams, the
+latest is taken first and the rest are dropped. Tails then land on the
+present it hydrates.
+
+The walk is a forecast, not an authority. If the survivors would not leave
+the heart where the whole drain would, the whole drain goes through.
+
+A digest off the wire is only a claim, and the forecast leans on digests
+(no-op rule, delta bases). Given the heart's tallies, relay() first
+recomputes every digest from the tails' own tallies: full tails against the
+heart's (ObliviousTally.digest_against), deltas carried from the state they
+apply to. A tail forged under an honest digest can't get a real one dropped.
+The body fleshes a drain only once a forecast on its claims would drop
+something; a drain that lands whole is never parsed twice.
+"""
+from __future__ import annotations
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+from plexus import crown_next, digest_against, digest_update
+
+BATCH_MAX = 256        # datagrams drained, and folded into one landing
+
+# (header, …): whatever the body carries alongside, relayed untouched
+Felt = Tuple[Any, ...]
+Walked = Tuple[int, Optional[int], bool]
+
+def _dream(msg: Mapping[str, Any]) -> bool:
+    return bool(msg.get("is_dream"))
+
+def _walk(msgs: Sequence[Mapping[str, Any]], crown: int, digest: Optional[int],
+          envy: bool) -> Tuple[Walked, List[bool]]:
+    # plexus.ingest on headers: → (crown, digest, envy) after the lot, and
+    # which tails overwrote whatever came before them. None: digest unknown.
+    over: List[bool] = []
+    for msg in msgs:
+        wrote = False
+        if _dream(msg):
+            tallies = msg.get("tallies", {})
+            if tallies is None or tallies:       # None: peeked, not yet parsed
+                digest, wrote = msg.get("digest"), True
+            envy = False
+        else:
+            inc = int(msg.get("crown", crown))
+            d = msg.get("digest")
+            if inc not in (crown, crown_next(crown)):
+                envy = True
+            elif "delta" in msg:
+                # Applies only onto its base; moves on from there
+                if digest is not None and msg.get("base") == digest:
+                    envy = False
+                    if d != digest:
+                        digest, crown = d, inc
+            else:
+                envy = False
+                if d is None or d != digest:
+                    digest, crown, wrote = d, inc, True
+        over.append(wrote)
+    return (int(crown), digest, envy), over
+
+def _latest(msgs: Sequence[Mapping[str, Any]], over: List[bool], before: int,
+            crown: int) -> Optional[int]:
+    # The last full overwrite before `before` that left the heart at `crown`
+    for i in range(before - 1, -1, -1):
+        if over[i] and not _dream(msgs[i]) and int(msgs[i].get("crown", 0)) == crown:
+            return i
+    return None
+
+def _stones(msgs: Sequence[Mapping[str, Any]], over: List[bool], last: int,
+            crown: int) -> Iterator[List[int]]:
+    # Three crowns: the last overwrite is reached in at most two steps
+    yield []
+    c1 = crown_next(crown)
+    c2 = crown_next(c1)
+    s1 = _latest(msgs, over, last, c1)
+    if s1 is not None:
+        yield [s1]
+    s2 = _latest(msgs, over, last, c2)
+    if s2 is not None:
+        s1 = _latest(msgs, over, s2, c1)
+        if s1 is not None:
+            yield [s1, s2]
+
+def vouch(msgs: Sequence[Mapping[str, Any]], tallies: Mapping[str, int],
+          digest: int) -> List[Optional[int]]:
+    # The digest each tail would leave, computed here in landing order; None
+    # for a bare header (nothing to vouch with). A delta is carried from
+    # the state whose digest is its base, if the drain can reach one.
+    known: Dict[int, Tuple[Mapping[str, int], Dict[str, int]]] = {digest: (tallies, {})}
+    out: List[Optional[int]] = []
+    for msg in msgs:
+        if "delta" in msg and not _dream(msg):
+            changes, src = msg.get("delta"), known.get(msg.get("base"))  # type: ignore[arg-type]
+            if changes is None or src is None:
+                out.append(None if changes is None else msg.get("digest"))
+                continue                         # applies nowhere: the claim is moot
+            d, (base, over) = int(msg["base"]), src
+            over = dict(over)
+            for k, v in changes.items():
+                old = over[k] if k in over else base.get(k)
+                if old != v:
+                    d = digest_update(d, k, old, v)
+                    over[k] = v
+            known.setdefault(d, (base, over))
+        else:
+            found = msg.get("tallies")
+            if found is None:
+                out.append(None)
+                continue
+            moved = digest_against(found, tallies, digest)
+            d = digest if moved is None else moved
+            known.setdefault(d, (found, {}))
+        out.append(d)
+    return out
+
+def relay(felt: Sequence[Felt], crown: int, digest: Optional[int],
+          envy: bool, tallies: Optional[Mapping[str, int]] = None) -> List[Felt]:
+    """The tails of one drain worth ingesting, in landing order. Each item
+    leads with its header; the rest rides along. Given the heart's tallies,
+    headers must carry theirs (fleshed) and come back with digests computed
+    here; without, the wire's digests are taken at their word."""
+    order = list(felt)
+    if envy:
+        dreams = [f for f in order if _dream(f[0])]
+        if dreams:
+            order = [dreams[-1]] + [f for f in order if not _dream(f[0])]
+    if len(order) < 2:
+        return order
+    if tallies is not None and digest is not None:
+        sums = vouch([f[0] for f in order], tallies, digest)
+        order = [(dict(f[0], digest=d),) + tuple(f[1:]) for f, d in zip(order, sums)]
+    msgs = [f[0] for f in order]
+    end, over = _walk(msgs, crown, digest, envy)
+    if True not in over:
+        return order
+    last = len(over) - 1 - over[::-1].index(True)
+    if last == 0:
+        return order
+    tail = list(range(last, len(order)))
+    for stones in _stones(msgs, over, last, int(crown)):
+        keep = stones + tail
+        if _walk([msgs[i] for i in keep], crown, digest, envy)[0] == end:
+            return [order[i] for i in keep]
+    return order
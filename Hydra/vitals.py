@@ -0,0 +1,189 @@
+# ============================================
+# Vitals (Metrics) — Truth Through Erasure
+# No time. No replay. No logs.
+# ============================================
+"""
+Counters and gauges for a running head. Counters are plain ints on a
+slotted object, bumped inline by whoever owns them (the receiver thread,
+the spine's heart task, a ganglion); nothing is locked and nothing is
+formatted on the receive path. Gauges are callables read only when asked.
+
+A head with --vitals PATH answers every connection on that Unix socket with
+one JSON document and hangs up:
+
+    python vitals.py /tmp/hydra-a.sock            # once
+    python vitals.py /tmp/hydra-a.sock --every 1  # until Ctrl+C
+
+--vitals-dump FILE rewrites FILE with the same document once a second.
+Ganglion workers keep their own Vitals and copy the counts into a shared
+array after each burst; the heart sums them in when read.
+"""
+from __future__ import annotations
+import argparse, json, os, socket, sys, threading, time
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+COUNTERS = (
+    "rx", "rx_bytes",              # datagrams (and bytes) read off the socket
+    "tx", "tx_bytes", "tx_errors", # datagrams sent, and sends the kernel refused
+    "decode_failures",             # not myelin, not JSON, or not a tail
+    "membrane_hits",               # deduped by the storm membrane
+    "gate_rejects",                # out of the crown window on the header alone
+    "drops",                       # queue or ring full: dropped like UDP would
+    "superseded",                  # tails a later one in the same drain overwrites (thalamus.py)
+    "ingests",                     # tails that reached the heart
+    "overwrites",                  # … and overwrote the tetron (dreams included)
+    "noops",                       # … and changed nothing
+    "envy_on", "envy_off",         # ENVY transitions
+    "hunger_in", "hunger_out",     # HUNGER requests heard, and sent
+    "dreams_out",                  # dream replies
+    "dream_encodes",               # … of which freshly encoded (the rest were cached)
+    "hunger_limited",              # HUNGER refused by the per-peer token bucket
+    "chunks_in", "chunks_out",     # CHUNK datagrams (suture.py)
+    "sutured", "torn",             # payloads stitched whole, and streams given up on
+    "bulk_in", "bulk_out",         # dreams pulled, and served, over TCP
+    "peers_learned", "peers_forgotten",  # the peer table (dendrite.py)
+    "shm_out", "shm_in",           # ring records written, and read (commissure.py)
+    "shm_overruns",                # … and times a reader was lapped
+    "shm_bells",                   # empty datagrams that woke a napping reader
+    "faults",                      # exceptions caught on the receive path
+)
+
+DUMP_EVERY = 1.0
+
+class Vitals:
+    __slots__ = COUNTERS + ("born", "last_fault", "gauges", "pulses")
+
+    def __init__(self) -> None:
+        for name in COUNTERS:
+            setattr(self, name, 0)
+        self.born = time.monotonic()
+        self.last_fault: Optional[str] = None
+        self.gauges: Dict[str, Callable[[], Any]] = {}
+        self.pulses: List[Any] = []                # workers' shared arrays
+
+    def fault(self, exc: BaseException) -> None:
+        # Caught, counted and kept; never silent
+        self.faults += 1
+        self.last_fault = f"{type(exc).__name__}: {exc}"
+
+    def landed(self, tails: int, adopted: int, gated: int,
+               envy_was: bool, envy_is: bool) -> None:
+        # One ingest or ingest_many: tails in, overwrites out, envy edges
+        self.ingests += tails
+        self.overwrites += adopted
+        self.noops += max(0, tails - adopted - gated)
+        if envy_is != envy_was:
+            if envy_is:
+                self.envy_on += 1
+            else:
+                self.envy_off += 1
+
+    def store(self, pulse: Any) -> None:
+        # Worker side: publish the counts for the heart to sum
+        pulse[:] = [getattr(self, name) for name in COUNTERS]
+
+    def counts(self) -> Dict[str, int]:
+        out = {name: getattr(self, name) for name in COUNTERS}
+        for pulse in self.pulses:
+            for name, n in zip(COUNTERS, pulse[:]):
+                out[name] += n
+        return out
+
+    def snapshot(self) -> Dict[str, Any]:
+        gauges: Dict[str, Any] = {}
+        for name, read in self.gauges.items():
+            try:
+                gauges[name] = read()
+            except Exception as e:
+                gauges[name] = f"{type(e).__name__}: {e}"
+        return {
+            "counters": self.counts(),
+            "gauges": gauges,
+            "uptime": round(time.monotonic() - self.born, 3),
+            "last_fault": self.last_fault,
+        }
+
+    def dumps(self) -> bytes:
+        return json.dumps(self.snapshot(), sort_keys=True).encode("utf-8")
+
+# ============================================
+# Exposure (off the receive path)
+# ============================================
+def serve(vitals: Vitals, path: str) -> threading.Thread:
+    """One JSON document per connection on a Unix socket, from a daemon thread."""
+    try:
+        os.unlink(path)                            # stale from a severed head
+    except FileNotFoundError:
+        pass
+    srv = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    srv.bind(path)
+    srv.listen(8)
+
+    def loop() -> None:
+        while True:
+            conn, _ = srv.accept()
+            try:
+                conn.sendall(vitals.dumps())
+            except OSError:
+                pass
+            finally:
+                conn.close()
+
+    t = threading.Thread(target=loop, daemon=True, name="vitals")
+    t.start()
+    return t
+
+def dump(vitals: Vitals, path: str, every: float = DUMP_EVERY) -> threading.Thread:
+    """Rewrite `path` every `every` seconds; readers never see half a file."""
+    tmp = f"{path}.tmp"
+
+    def loop() -> None:
+        while True:
+            try:
+                with open(tmp, "wb") as f:
+                    f.write(vitals.dumps())
+                os.replace(tmp, path)
+            except OSError:
+                pass
+            time.sleep(every)
+
+    t = threading.Thread(target=loop, daemon=True, name="vitals-dump")
+    t.start()
+    return t
+
+def read(path: str, timeout: float = 2.0) -> Dict[str, Any]:
+    s = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    s.settimeout(timeout)
+    try:
+        s.connect(path)
+        chunks = []
+        while True:
+            chunk = s.recv(65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+    finally:
+        s.close()
+    return json.loads(b"".join(chunks).decode("utf-8"))
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    ap = argparse.ArgumentParser(prog="vitals.py")
+    ap.add_argument("sock", help="A head's --vitals socket")
+    ap.add_argument("--every", type=float, default=0.0,
+                    help="Poll every N seconds until Ctrl+C (default: once)")
+    args = ap.parse_args(argv)
+    try:
+        while True:
+            print(json.dumps(read(args.sock), sort_keys=True))
+            if args.every <= 0:
+                return 0
+            sys.stdout.flush()
+            time.sleep(args.every)
+    except KeyboardInterrupt:
+        return 0
+    except OSError as e:
+        print(f"vitals.py: {args.sock}: {e}", file=sys.stderr)
+        return 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,344 @@
+# ============================================
+# Womb (Simulator) — Truth Through Erasure
+# No time. No replay. No logs.
+# ============================================
+"""
+A discrete-event network for sizing swarms before they are born. Thousands
+of plexus hearts in one process, one event heap, and links that lose,
+duplicate, delay and reorder like a real network, with partitions that open
+and heal on a schedule. Each head runs the shell's reflexes: storm membrane,
+flood or gossip PROPAGATE, HUNGER when it needs a tail or is envious, a
+dream back to every HUNGER.
+
+    python womb.py --heads 1000 --proposals 50 --rate 20 --gossip 3 \\
+        --latency uniform:1,20 --slow 0.05:uniform:100,300 --drop 0.01 \\
+        --dup 0.005 --reorder 0.05 --partition 200:600:0.5
+
+Time is in milliseconds. One JSON line per swarm size reports convergence
+(time from the last proposal until every head holds one digest), envy,
+hunger traffic and datagrams per proposal.
+
+Latency specs: fixed:MS  uniform:LO,HI  normal:MU,SIGMA  exp:MEAN
+pareto:SCALE,ALPHA. Every link draws from --latency, except for a --slow
+fraction of links, which draw from the spec given there.
+"""
+from __future__ import annotations
+import argparse, heapq, json, random, sys
+from collections import Counter
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple
+
+from plexus import Tail, plexus, tally_digest
+from synapse import Gossip, _key
+
+PROPOSE, TAIL, HUNGER = 0, 1, 2
+Sampler = Callable[[random.Random], float]
+
+def latency(spec: str) -> Sampler:
+    """'uniform:1,20' → a sampler of milliseconds (never negative)."""
+    name, _, args = str(spec).partition(":")
+    try:
+        a = [float(x) for x in args.split(",")] if args else []
+        if name == "fixed":
+            (ms,) = a
+            return lambda r: ms
+        if name == "uniform":
+            lo, hi = a
+            return lambda r: r.uniform(lo, hi)
+        if name == "normal":
+            mu, sigma = a
+            return lambda r: max(0.0, r.gauss(mu, sigma))
+        if name == "exp":
+            (mean,) = a
+            return lambda r: r.expovariate(1.0 / mean)
+        if name == "pareto":
+            scale, alpha = a
+            return lambda r: scale * r.paretovariate(alpha)
+    except ValueError:
+        pass
+    raise ValueError(f"bad latency spec {spec!r}")
+
+@dataclass
+class Weather:
+    """What the network does to a datagram."""
+    latency: str = "uniform:1,10"
+    slow: Optional[str] = None             # "FRACTION:SPEC"
+    drop: float = 0.0
+    dup: float = 0.0
+    reorder: float = 0.0                   # share held back an extra uniform(0, reorder_ms)
+    reorder_ms: float = 50.0
+    partition: Optional[Tuple[float, float, float]] = None   # start, end, share of heads cut off
+
+class Links:
+    """Weather, link by link: which links are slow, which are cut, and what
+    becomes of one datagram on its way. Shared by the womb's event heap and
+    the cradle's proxy, so both networks lie the same way."""
+
+    def __init__(self, heads: int, weather: Weather, rng: random.Random) -> None:
+        self.weather = weather
+        self.rng = rng
+        self._fast = latency(weather.latency)
+        self._slow: Optional[Sampler] = None
+        self._slow_share = 0.0
+        if weather.slow:
+            share, _, spec = weather.slow.partition(":")
+            self._slow_share, self._slow = float(share), latency(spec)
+        self._links: Dict[Tuple[int, int], Sampler] = {}
+        cut = weather.partition
+        self._cut = int(int(heads) * cut[2]) if cut else 0
+
+    def link(self, src: int, dst: int) -> Sampler:
+        got = self._links.get((src, dst))
+        if got is None:
+            slow = self._slow is not None and self.rng.random() < self._slow_share
+            got = self._links[(src, dst)] = self._slow if slow else self._fast  # type: ignore[assignment]
+        return got
+
+    def severed(self, src: int, dst: int, now: float) -> bool:
+        cut = self.weather.partition
+        if cut is None or not (cut[0] <= now < cut[1]):
+            return False
+        return (src < self._cut) != (dst < self._cut)
+
+    def carry(self, src: int, dst: int, now: float, stats: Counter) -> List[float]:
+        """Delays (ms) of the copies that arrive, none if it never does; what
+        happened on the way is counted into stats. now: ms since birth."""
+        w, rng = self.weather, self.rng
+        if self.severed(src, dst, now):
+            stats["partitioned"] += 1
+            return []
+        if w.drop and rng.random() < w.drop:
+            stats["dropped"] += 1
+            return []
+        copies = 2 if w.dup and rng.random() < w.dup else 1
+        stats["duplicated"] += copies - 1
+        link = self.link(src, dst)
+        out = []
+        for _ in range(copies):
+            delay = link(rng)
+            if w.reorder and rng.random() < w.reorder:
+                delay += rng.uniform(0.0, w.reorder_ms)
+                stats["reordered"] += 1
+            out.append(delay)
+        return out
+
+class _Head:
+    __slots__ = ("plex", "seen", "gossip")
+
+    def __init__(self, plex: plexus, gossip: Optional[Gossip]) -> None:
+        self.plex = plex
+        self.seen: Set[str] = set()
+        self.gossip = gossip
+
+class Womb:
+    def __init__(self, heads: int, weather: Weather, gossip: Optional[Dict[str, Any]] = None,
+                 hunger_fanout: int = 0, seed: int = 0) -> None:
+        self.rng = random.Random(seed)
+        self.weather = weather
+        self.names = [f"H{i}" for i in range(int(heads))]
+        # One frozen genesis book and one digest for the whole swarm, not a
+        # tally walk per head
+        book = MappingProxyType({n: 10 for n in self.names})
+        genesis = tally_digest(book)
+        self.heads: List[_Head] = []
+        for n in self.names:
+            plex = plexus(head_id=n, initial_tallies=book,  # type: ignore[arg-type]
+                          initial_digest=genesis)
+            self.heads.append(_Head(plex, Gossip(seed=self.rng.random(), head_id=n, **gossip)
+                                    if gossip else None))
+        self.hunger_fanout = int(hunger_fanout)
+        self.links = Links(len(self.heads), weather, self.rng)
+
+        self.events: List[Tuple[float, int, int, int, int, Any]] = []
+        self.seq = 0
+        self.now = 0.0
+        self.digests = Counter({self.heads[0].plex.digest(): len(self.heads)})
+        self.whole_at: Optional[float] = 0.0   # when the swarm last came to one digest
+        self.stats: Counter = Counter()
+
+    def send(self, kind: int, src: int, dst: int, obj: Any) -> None:
+        self.stats["tails" if kind == TAIL else "hungers"] += 1
+        for delay in self.links.carry(src, dst, self.now, self.stats):
+            self.push(self.now + delay, kind, dst, src, obj)
+
+    def push(self, at: float, kind: int, dst: int, src: int, obj: Any) -> None:
+        self.seq += 1
+        heapq.heappush(self.events, (at, self.seq, kind, dst, src, obj))
+
+    # Reflexes (shell.py, without sockets)
+    def _spread(self, me: int, tail: Tail, exclude: Optional[int]) -> None:
+        head = self.heads[me]
+        if head.gossip is None:
+            for dst in range(len(self.heads)):
+                if dst != me and dst != exclude:
+                    self.send(TAIL, me, dst, tail)
+            return
+        key = _key(tail)
+        if not head.gossip.forward(key):
+            return
+        pool = range(len(self.heads))
+        for dst in head.gossip.targets(tail, key, pool, exclude):
+            if dst != me:
+                self.send(TAIL, me, dst, tail)
+
+    def _hunger(self, me: int) -> None:
+        self.stats["hunger_events"] += 1
+        n = len(self.heads)
+        if self.hunger_fanout and self.hunger_fanout < n - 1:
+            peers = self.rng.sample([i for i in range(n) if i != me], self.hunger_fanout)
+        else:
+            peers = [i for i in range(n) if i != me]
+        for dst in peers:
+            self.send(HUNGER, me, dst, None)
+
+    def _act(self, me: int, intents: Sequence[Any], src: Optional[int]) -> None:
+        plex = self.heads[me].plex
+        for it in intents:
+            if it.type == "PROPAGATE":
+                self._spread(me, it.payload["tail"], src)
+            elif it.type == "REQUEST_SYNC":
+                if it.payload.get("need_tail") or plex.envy:
+                    self._hunger(me)
+
+    def _ingest(self, me: int, tail: Tail, src: Optional[int]) -> None:
+        plex = self.heads[me].plex
+        envy, was = plex.envy, plex.digest()
+        intents = plex.ingest(tail)
+        if plex.envy and not envy:
+            self.stats["envy"] += 1
+        now = plex.digest()
+        if now != was:
+            d = self.digests
+            d[was] -= 1
+            if not d[was]:
+                del d[was]
+            d[now] += 1
+            self.whole_at = self.now if len(d) == 1 else None
+        self._act(me, intents, src)
+
+    def _hear(self, me: int, src: int, tail: Tail) -> None:
+        head = self.heads[me]
+        key = _key(tail)
+        if head.gossip is not None:
+            head.gossip.hear(key)
+        if key in head.seen and not (head.plex.envy and tail.get("is_dream")):
+            # Storm membrane; gossip pushes on until it has heard enough
+            cur = head.plex.tail
+            if head.gossip is not None and cur is not None and _key(cur) == key:
+                self._spread(me, cur, src)
+            return
+        head.seen.add(key)
+        self._ingest(me, tail, src)
+
+    # Run
+    def run(self, proposals: int, rate: float, until: float = float("inf")) -> Dict[str, Any]:
+        t, gap = 0.0, 1000.0 / float(rate)
+        for _ in range(int(proposals)):
+            t += self.rng.expovariate(1.0 / gap)
+            self.push(t, PROPOSE, self.rng.randrange(len(self.heads)), -1, None)
+        last = t
+
+        events, pop = self.events, heapq.heappop
+        while events:
+            at, _, kind, dst, src, obj = pop(events)
+            if at > until:
+                break
+            self.now = at
+            self.stats["events"] += 1
+            if kind == TAIL:
+                self._hear(dst, src, obj)
+            elif kind == HUNGER:
+                self.stats["dreams"] += 1
+                self.send(TAIL, dst, src, self.heads[dst].plex.dream_state())
+            else:
+                plex = self.heads[dst].plex
+                to = self.names[(dst + 1 + self.rng.randrange(len(self.names) - 1)) % len(self.names)]
+                self._ingest(dst, plex.propose(to, 1), None)
+
+        s = self.stats
+        whole = len(self.digests) == 1
+        return {
+            "heads": len(self.heads),
+            "proposals": int(proposals),
+            "converged": whole,
+            "t_converge": round(self.whole_at - last, 2) if whole and self.whole_at is not None else None,
+            "t_end": round(self.now, 2),
+            "digests_end": len(self.digests),
+            "agree": round(max(self.digests.values()) / len(self.heads), 4),
+            "datagrams": s["tails"] + s["hungers"],
+            "per_proposal": round((s["tails"] + s["hungers"]) / max(1, proposals), 1),
+            "tails": s["tails"],
+            "hungers": s["hungers"],
+            "dreams": s["dreams"],
+            "hunger_events": s["hunger_events"],
+            "envy": s["envy"],
+            "envy_rate": round(s["envy"] / (len(self.heads) * max(1, proposals)), 5),
+            "dropped": s["dropped"],
+            "duplicated": s["duplicated"],
+            "reordered": s["reordered"],
+            "partitioned": s["partitioned"],
+            "events": s["events"],
+        }
+
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(prog="womb.py")
+    ap.add_argument("--heads", type=int, nargs="*", default=[10, 100, 1000],
+                    help="Swarm sizes (default 10 100 1000)")
+    ap.add_argument("--proposals", type=int, default=20, help="FEEDs per run (default 20)")
+    ap.add_argument("--rate", type=float, default=10.0,
+                    help="FEEDs a second across the swarm, Poisson (default 10)")
+    ap.add_argument("--gossip", type=int, default=0, metavar="K",
+                    help="Gossip fanout K instead of flood")
+    ap.add_argument("--suppress", type=int, default=3, metavar="M")
+    ap.add_argument("--sampling", choices=("random", "crown"), default="random")
+    ap.add_argument("--hunger-fanout", type=int, default=0, metavar="K",
+                    help="HUNGER K random peers instead of all (default all, as the shell does)")
+    ap.add_argument("--latency", default="uniform:1,10", help="Link latency spec, ms")
+    ap.add_argument("--slow", default=None, metavar="SHARE:SPEC",
+                    help="This share of links draws from SPEC instead")
+    ap.add_argument("--drop", type=float, default=0.0, help="Loss probability per datagram")
+    ap.add_argument("--dup", type=float, default=0.0, help="Duplication probability")
+    ap.add_argument("--reorder", type=float, default=0.0,
+                    help="Share of datagrams held back an extra uniform(0, --reorder-ms)")
+    ap.add_argument("--reorder-ms", type=float, default=50.0)
+    ap.add_argument("--partition", default=None, metavar="START:END:SHARE",
+                    help="Cut SHARE of the heads off from the rest between START and END ms")
+    ap.add_argument("--until", type=float, default=float("inf"), help="Stop the clock here (ms)")
+    ap.add_argument("--trials", type=int, default=1)
+    ap.add_argument("--seed", type=int, default=7)
+    args = ap.parse_args(argv)
+
+    try:
+        latency(args.latency)
+        if args.slow:
+            latency(args.slow.partition(":")[2])
+        cut = tuple(float(x) for x in args.partition.split(":")) if args.partition else None
+        if cut is not None and len(cut) != 3:
+            raise ValueError("partition wants START:END:SHARE")
+    except ValueError as e:
+        ap.error(str(e))
+    weather = Weather(latency=args.latency, slow=args.slow, drop=args.drop, dup=args.dup,
+                      reorder=args.reorder, reorder_ms=args.reorder_ms,
+                      partition=cut)  # type: ignore[arg-type]
+    gossip = ({"fanout": args.gossip, "suppress": args.suppress, "sampling": args.sampling}
+              if args.gossip else None)
+
+    for n in args.heads:
+        runs = [Womb(int(n), weather, gossip, args.hunger_fanout, seed=args.seed + i)
+                .run(args.proposals, args.rate, args.until) for i in range(args.trials)]
+        if len(runs) == 1:
+            print(json.dumps(runs[0], sort_keys=True))
+            continue
+        out: Dict[str, Any] = {"heads": int(n), "trials": len(runs)}
+        out["converged_runs"] = sum(r["converged"] for r in runs)
+        times = [r["t_converge"] for r in runs if r["t_converge"] is not None]
+        out["t_converge"] = round(sum(times) / len(times), 2) if times else None
+        for k in ("datagrams", "per_proposal", "tails", "hungers", "dreams",
+                  "hunger_events", "envy", "envy_rate", "dropped", "partitioned"):
+            out[k] = round(sum(r[k] for r in runs) / len(runs), 5)
+        print(json.dumps(out, sort_keys=True))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())